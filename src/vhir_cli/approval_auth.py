@@ -189,7 +189,7 @@ def require_confirmation(config_path: Path, analyst: str) -> tuple[str, str | No
         sys.exit(1)
     _check_lockout(analyst)
     password = getpass_prompt("Enter password to confirm: ")
-    if not verify_password(config_path, analyst, password):
+    if not _check_password(config_path, analyst, password):
         _record_failure(analyst)
         remaining = _MAX_PASSWORD_ATTEMPTS - _recent_failure_count(analyst)
         if remaining <= 0:
@@ -207,6 +207,27 @@ def require_confirmation(config_path: Path, analyst: str) -> tuple[str, str | No
     return ("password", password)
 
 
+def _check_password(config_path: Path, analyst: str, password: str) -> bool:
+    """Check a password, via the key agent when one is unlocked.
+
+    The agent answers without the 600k-iteration PBKDF2. Its answer only
+    counts when it comes from the agent recorded by ``vhir agent start``
+    (which verified the password locally first) and proves it knows the
+    password verifier; otherwise (none running, stale salt, failed peer or
+    proof check) this falls back to verify_password.
+    """
+    try:
+        from vhir_cli.key_agent import agent_check_password
+
+        salt = get_analyst_salt(config_path, analyst)
+        checked = agent_check_password(analyst, salt, password)
+    except (ImportError, ValueError):
+        checked = None
+    if checked is not None:
+        return checked
+    return verify_password(config_path, analyst, password)
+
+
 def require_tty_confirmation(prompt: str) -> bool:
     """Prompt y/N via /dev/tty. Returns True if confirmed."""
     try:
@@ -278,10 +299,19 @@ def setup_password(
 
     Returns the raw password string (needed for HMAC re-signing during rotation).
     """
-    passwords_dir = passwords_dir or _PASSWORDS_DIR
-    _maybe_migrate_pin_dir()
-    _maybe_migrate(config_path, passwords_dir, analyst)
-    _ensure_passwords_dir(passwords_dir)
+    password = _prompt_new_password()
+    _store_password(
+        config_path,
+        analyst,
+        password,
+        secrets.token_bytes(32),
+        passwords_dir=passwords_dir,
+    )
+    return password
+
+
+def _prompt_new_password() -> str:
+    """Prompt twice for a new password and check it. Exits on mismatch."""
     pw1 = getpass_prompt("Enter new password: ")
     if not pw1:
         print("Password cannot be empty.", file=sys.stderr)
@@ -296,9 +326,26 @@ def setup_password(
     if pw1 != pw2:
         print("Passwords do not match.", file=sys.stderr)
         sys.exit(1)
+    return pw1
+
 
-    salt = secrets.token_bytes(32)
-    pw_hash = hashlib.pbkdf2_hmac("sha256", pw1.encode(), salt, PBKDF2_ITERATIONS).hex()
+def _store_password(
+    config_path: Path,
+    analyst: str,
+    password: str,
+    salt: bytes,
+    *,
+    passwords_dir: Path | None = None,
+) -> None:
+    """Write the password hash and salt for analyst."""
+    passwords_dir = passwords_dir or _PASSWORDS_DIR
+    _maybe_migrate_pin_dir()
+    _maybe_migrate(config_path, passwords_dir, analyst)
+    _ensure_passwords_dir(passwords_dir)
+
+    pw_hash = hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt, PBKDF2_ITERATIONS
+    ).hex()
 
     entry = {"hash": pw_hash, "salt": salt.hex()}
 
@@ -314,7 +361,6 @@ def setup_password(
     _save_config(config_path, config)
 
     print(f"Password configured for analyst '{analyst}'.")
-    return pw1
 
 
 def reset_password(
@@ -346,41 +392,63 @@ def reset_password(
         )
         sys.exit(1)
 
-    # Read old salt before setup_password overwrites it
     old_salt = get_analyst_salt(config_path, analyst, passwords_dir=passwords_dir)
+    new_password = _prompt_new_password()
+    new_salt = secrets.token_bytes(32)
+
+    def store() -> None:
+        _store_password(
+            config_path, analyst, new_password, new_salt, passwords_dir=passwords_dir
+        )
 
-    new_password = setup_password(config_path, analyst, passwords_dir=passwords_dir)
+    # Re-sign the verification ledgers with the new key. Every case is
+    # staged first; the password only changes if all of them staged, and
+    # it is stored before the staged entries are committed.
+    from vhir_cli.verification import (
+        VERIFICATION_DIR,
+        derive_hmac_key,
+        rotate_ledgers,
+    )
 
-    # Re-HMAC verification ledger entries with new key
-    new_salt = get_analyst_salt(config_path, analyst, passwords_dir=passwords_dir)
+    if not VERIFICATION_DIR.is_dir():
+        store()
+        return
+    old_key = derive_hmac_key(current, old_salt)
+    new_key = derive_hmac_key(new_password, new_salt)
     try:
-        from vhir_cli.verification import (
-            VERIFICATION_DIR,
-            derive_hmac_key,
-            rehmac_entries,
+        result = rotate_ledgers(
+            analyst, old_key, new_key, new_salt=new_salt, on_commit=store
         )
-
-        if VERIFICATION_DIR.is_dir():
-            old_key = derive_hmac_key(current, old_salt)
-            new_key = derive_hmac_key(new_password, new_salt)
-            for ledger_file in VERIFICATION_DIR.glob("*.jsonl"):
-                case_id = ledger_file.stem
-                count = rehmac_entries(
-                    case_id,
-                    analyst,
-                    current,
-                    old_salt,
-                    new_password,
-                    new_salt,
-                    old_key=old_key,
-                    new_key=new_key,
-                )
-                if count:
-                    print(
-                        f"  Re-signed {count} ledger entry/entries for case {case_id}."
-                    )
-    except (ImportError, OSError) as e:
-        print(f"  Warning: could not re-sign ledger entries: {e}", file=sys.stderr)
+    except OSError as e:
+        print(
+            f"Could not re-sign ledger entries: {e}\nPassword not changed.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    if not result["committed"]:
+        for case_id in result["errors"]:
+            print(
+                f"  Could not re-sign ledger for case {case_id}: "
+                f"{result['cases'][case_id]['error']}",
+                file=sys.stderr,
+            )
+        print(
+            "Password not changed; no ledger was modified. Fix the case(s) "
+            "above and retry.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    for case_id, case in result["cases"].items():
+        if case["resigned"]:
+            print(
+                f"  Re-signed {case['resigned']} ledger entry/entries for case {case_id}."
+            )
+        if case.get("skipped"):
+            print(
+                f"  Warning: {case['skipped']} entry/entries in case {case_id} "
+                "did not verify under the old password and were not re-signed.",
+                file=sys.stderr,
+            )
 
 
 def get_analyst_salt(
@@ -0,0 +1,353 @@
+"""Single-file backup archives with per-member compression.
+
+An archive is a plain GNU tar file. Each case file is stored as its own
+member, optionally compressed on its own (``findings.json.gz``), and
+``backup-manifest.json`` is the last member. Every manifest entry records
+the member's data offset and stored size, so one file can be restored by
+seeking straight to it; a copy of the manifest is written next to the
+archive so the offsets are found without scanning the tar headers. The
+copy is only trusted when it matches the manifest sealed in the archive.
+
+Members are streamed: a placeholder header is written, the data is read
+once (hashed, compressed, written), then the header is rewritten with the
+final size. GNU headers encode large sizes in place, so the header length
+depends only on the name and the rewrite never moves data.
+"""
+
+from __future__ import annotations
+
+import bz2
+import hashlib
+import json
+import lzma
+import os
+import tarfile
+import tempfile
+import zlib
+from pathlib import Path
+
+from vhir_cli.hashing import BLOCK_SIZE
+
+ARCHIVE_SUFFIX = ".tar"
+MANIFEST_MEMBER = "backup-manifest.json"
+CODECS = ("none", "gz", "bz2", "xz")
+DEFAULT_LEVELS = {"gz": 6, "bz2": 9, "xz": 6}
+_MAX_LEVELS = {"gz": 9, "bz2": 9, "xz": 9}
+
+
+def sidecar_path(archive_path: Path) -> Path:
+    """Manifest copy stored next to an archive."""
+    return archive_path.with_name(archive_path.name + ".manifest.json")
+
+
+class _Identity:
+    """Stand-in (de)compressor for uncompressed members."""
+
+    def compress(self, data):
+        return bytes(data)
+
+    decompress = compress
+
+    def flush(self):
+        return b""
+
+
+def _compressor(codec: str, level: int):
+    if codec == "gz":
+        return zlib.compressobj(level, zlib.DEFLATED, 31)  # 31: gzip framing
+    if codec == "bz2":
+        return bz2.BZ2Compressor(max(level, 1))
+    if codec == "xz":
+        return lzma.LZMACompressor(preset=level)
+    return _Identity()
+
+
+def _decompressor(codec: str):
+    if codec == "gz":
+        return zlib.decompressobj(31)
+    if codec == "bz2":
+        return bz2.BZ2Decompressor()
+    if codec == "xz":
+        return lzma.LZMADecompressor()
+    if codec == "none":
+        return _Identity()
+    raise ValueError(f"Unknown archive codec: {codec}")
+
+
+def check_codec(codec: str, level: int | None) -> int:
+    """Validate codec and level; return the effective level."""
+    if codec not in CODECS:
+        raise ValueError(f"Unknown archive codec: {codec} (choose {', '.join(CODECS)})")
+    if codec == "none":
+        return 0
+    if level is None:
+        return DEFAULT_LEVELS[codec]
+    if not 0 <= level <= _MAX_LEVELS[codec]:
+        raise ValueError(
+            f"Compression level for {codec} must be 0-{_MAX_LEVELS[codec]}"
+        )
+    return level
+
+
+class ArchiveWriter:
+    """Append members to a new archive file.
+
+    Args:
+        path: Archive file to create (must not exist).
+        codec: One of CODECS.
+        level: Compression level (codec default when None).
+    """
+
+    def __init__(self, path: Path, codec: str = "gz", level: int | None = None):
+        self.path = Path(path)
+        self.codec = codec
+        self.level = check_codec(codec, level)
+        self._f = open(self.path, "xb")
+        self.stored_bytes = 0
+
+    def _member_name(self, rel_path: str) -> str:
+        return rel_path if self.codec == "none" else f"{rel_path}.{self.codec}"
+
+    def add_file(self, rel_path: str, src: Path | str) -> dict:
+        """Stream one file into the archive.
+
+        Returns:
+            Manifest fields: sha256, bytes, member, offset, stored, codec.
+
+        Raises:
+            OSError: If the source can't be read or the archive written.
+        """
+        st = os.stat(src)
+        info = tarfile.TarInfo(self._member_name(rel_path))
+        info.mtime = int(st.st_mtime)
+        info.mode = 0o444
+        header_at = self._f.tell()
+        header_len = len(self._header(info))
+        self._f.write(b"\0" * header_len)
+        offset = self._f.tell()
+
+        sha = hashlib.sha256()
+        comp = _compressor(self.codec, self.level)
+        buf = bytearray(BLOCK_SIZE)
+        view = memoryview(buf)
+        nbytes = 0
+        try:
+            with open(src, "rb", buffering=0) as fin:
+                while True:
+                    n = fin.readinto(buf)
+                    if not n:
+                        break
+                    chunk = view[:n]
+                    sha.update(chunk)
+                    self._f.write(comp.compress(chunk))
+                    nbytes += n
+            self._f.write(comp.flush())
+        except BaseException:
+            # Drop the half-written member so the archive stays valid
+            self._f.seek(header_at)
+            self._f.truncate()
+            raise
+
+        stored = self._f.tell() - offset
+        self._pad(stored)
+        end = self._f.tell()
+        info.size = stored
+        self._f.seek(header_at)
+        self._f.write(self._header(info))
+        self._f.seek(end)
+        self.stored_bytes += stored
+        return {
+            "sha256": sha.hexdigest(),
+            "bytes": nbytes,
+            "member": info.name,
+            "offset": offset,
+            "stored": stored,
+            "codec": self.codec,
+        }
+
+    def close(self, manifest: dict) -> None:
+        """Write the manifest member and the tar end-of-archive blocks."""
+        data = json.dumps(manifest, indent=2).encode()
+        info = tarfile.TarInfo(MANIFEST_MEMBER)
+        info.size = len(data)
+        info.mode = 0o444
+        self._f.write(self._header(info))
+        self._f.write(data)
+        self._pad(len(data))
+        self._f.write(b"\0" * (2 * tarfile.BLOCKSIZE))
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._f.close()
+
+    def abort(self) -> None:
+        """Close without sealing; the .partial file is left for inspection."""
+        self._f.close()
+
+    @staticmethod
+    def _header(info: tarfile.TarInfo) -> bytes:
+        return info.tobuf(tarfile.GNU_FORMAT, "utf-8", "surrogateescape")
+
+    def _pad(self, size: int) -> None:
+        remainder = size % tarfile.BLOCKSIZE
+        if remainder:
+            self._f.write(b"\0" * (tarfile.BLOCKSIZE - remainder))
+
+
+def read_archive_manifest(archive_path: Path, use_sidecar: bool = True) -> dict:
+    """Load the manifest sealed inside an archive.
+
+    The sidecar copy, if present (and allowed), is only a shortcut: it is
+    used when it is byte-for-byte the manifest member at the end of the
+    archive, which costs one read of that member instead of walking the
+    tar headers. A sidecar that differs is ignored. Verification passes
+    use_sidecar=False to skip the shortcut.
+
+    Raises:
+        ValueError: If no readable manifest is found.
+    """
+    archive_path = Path(archive_path)
+    try:
+        with open(archive_path, "rb") as f:
+            return _load_manifest(f, archive_path, use_sidecar)
+    except OSError as e:
+        raise ValueError(f"cannot read archive manifest: {e}") from e
+
+
+def _load_manifest(f, archive_path: Path, use_sidecar: bool) -> dict:
+    if use_sidecar:
+        try:
+            data = sidecar_path(archive_path).read_bytes()
+        except OSError:
+            data = None
+        if data is not None and _is_sealed_manifest(f, data):
+            try:
+                return json.loads(data)
+            except json.JSONDecodeError:
+                pass
+    try:
+        f.seek(0)
+        with tarfile.open(fileobj=f, mode="r:") as tar:
+            member = tar.getmember(MANIFEST_MEMBER)
+            return json.loads(tar.extractfile(member).read())
+    except (KeyError, OSError, tarfile.TarError, json.JSONDecodeError) as e:
+        raise ValueError(f"cannot read archive manifest: {e}") from e
+
+
+def _is_sealed_manifest(f, data: bytes) -> bool:
+    """True if data is the content of the manifest member that ends the archive.
+
+    ArchiveWriter.close writes the manifest header, its data padded to a
+    block, then two zero blocks, so the member's position follows from the
+    file size and len(data).
+    """
+    block = tarfile.BLOCKSIZE
+    padded = -(-len(data) // block) * block
+    size = f.seek(0, os.SEEK_END)
+    start = size - 2 * block - padded
+    if not data or start < block:
+        return False
+    f.seek(start - block)
+    tail = f.read(block + padded + 2 * block)
+    try:
+        info = tarfile.TarInfo.frombuf(tail[:block], "utf-8", "surrogateescape")
+    except tarfile.HeaderError:
+        return False
+    return (
+        info.name == MANIFEST_MEMBER
+        and info.size == len(data)
+        and tail[block : block + len(data)] == data
+        and not tail[block + len(data) :].strip(b"\0")
+    )
+
+
+def iter_member(archive_path: Path, entry: dict, block_size: int = BLOCK_SIZE):
+    """Yield the uncompressed bytes of one manifest entry."""
+    with open(archive_path, "rb") as f:
+        yield from _iter_member(f, entry, block_size)
+
+
+def _iter_member(f, entry: dict, block_size: int = BLOCK_SIZE):
+    decomp = _decompressor(entry.get("codec", "none"))
+    remaining = entry["stored"]
+    f.seek(entry["offset"])
+    while remaining:
+        chunk = f.read(min(block_size, remaining))
+        if not chunk:
+            raise OSError(f"archive truncated in {entry['member']}")
+        remaining -= len(chunk)
+        data = decomp.decompress(chunk)
+        if data:
+            yield data
+    tail = decomp.flush() if hasattr(decomp, "flush") else b""
+    if tail:
+        yield tail
+
+
+def hash_member(archive_path: Path, entry: dict) -> dict[str, str]:
+    """SHA-256 of one member's uncompressed content (hash_file-shaped)."""
+    sha = hashlib.sha256()
+    try:
+        for data in iter_member(archive_path, entry):
+            sha.update(data)
+    except (zlib.error, lzma.LZMAError, EOFError) as e:
+        raise OSError(f"corrupt member {entry['member']}: {e}") from e
+    return {"sha256": sha.hexdigest()}
+
+
+def extract_member(
+    archive_path: Path, rel_path: str, output_dir: Path, force: bool = False
+) -> dict:
+    """Restore one file from an archive by its manifest path.
+
+    Only that member's bytes and the sealed manifest are read. The content
+    is written to a temporary file beside the destination and checked
+    against the hash in the sealed manifest before it is moved into place,
+    so a corrupt or mismatching member never touches the destination. An
+    existing file is only replaced when force is set.
+
+    Returns:
+        Dict with path (restored file), sha256, bytes.
+
+    Raises:
+        ValueError: If the path is not in the archive, fails its hash, or
+            would overwrite an existing file without force.
+        OSError: If reading or writing fails.
+    """
+    archive_path = Path(archive_path)
+    with open(archive_path, "rb") as f:
+        manifest = _load_manifest(f, archive_path, use_sidecar=True)
+        entry = next(
+            (e for e in manifest.get("files", []) if e.get("path") == rel_path), None
+        )
+        if entry is None:
+            raise ValueError(f"Not in archive: {rel_path}")
+        dest = Path(output_dir) / rel_path
+        if not Path(os.path.abspath(dest)).is_relative_to(os.path.abspath(output_dir)):
+            raise ValueError(
+                f"Refusing to extract outside output directory: {rel_path}"
+            )
+        if os.path.lexists(dest) and not force:
+            raise ValueError(f"Refusing to overwrite {dest} (use --force)")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        sha = hashlib.sha256()
+        nbytes = 0
+        fd, tmp = tempfile.mkstemp(dir=dest.parent, suffix=".tmp")
+        try:
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    for data in _iter_member(f, entry):
+                        sha.update(data)
+                        out.write(data)
+                        nbytes += len(data)
+            except (zlib.error, lzma.LZMAError, EOFError) as e:
+                raise ValueError(f"corrupt member {entry['member']}: {e}") from e
+            if sha.hexdigest() != entry["sha256"]:
+                raise ValueError(f"Hash mismatch extracting {rel_path}")
+            os.replace(tmp, dest)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    return {"path": str(dest), "sha256": entry["sha256"], "bytes": nbytes}
@@ -0,0 +1,567 @@
+"""Incremental offset indexes for append-only JSONL logs.
+
+Audit logs (audit/*.jsonl, approvals.jsonl) only ever grow. A JsonlIndex
+keeps a sidecar file that maps a key (the audit_id) to the byte offset of
+its line and remembers how far the log has been indexed, so each command
+only parses lines appended since the last run. Lookups are a seek plus one
+line parse, and the parsed line must carry the key it was looked up by.
+
+Sidecar format (append-only JSONL):
+  {"v": 2, "head": <sha256 of the first head_len bytes>, "head_len": n}
+  ["<key>", <offset>]                              one per keyed line
+  {"end": <offset>, "tail": <sha256 of the tail_len bytes before end>,
+   "tail_len": n, "lines": n, "corrupt": n, "tally": [[label, count], ...]}
+
+Checkpoint counters are cumulative. A sidecar whose head or tail hash no
+longer matches its log (rotated, truncated or rewritten), or that cannot
+be parsed, is rebuilt from scratch; so is one whose offsets point at the
+wrong lines. Sidecar writes are best-effort: when the directory is not
+writable the index is built in memory for the current command only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+INDEX_VERSION = 2
+_HEAD_BYTES = 4096
+_TAIL_BLOCK = 1 << 16
+
+
+class JsonlIndex:
+    """Offset index over one append-only JSONL file.
+
+    Args:
+        path: The JSONL log.
+        sidecar: Where the index is persisted.
+        key: Returns the lookup key for an entry, or None to skip it.
+            Later lines win when a key repeats.
+        tally: Returns a hashable label to count for an entry, or None.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sidecar: Path | None = None,
+        key: Callable[[dict], str | None] | None = None,
+        tally: Callable[[dict], tuple | str | None] | None = None,
+    ) -> None:
+        self.path = path
+        self.sidecar = sidecar
+        self._key = key
+        self._tally = tally
+        self._reset()
+        self._loaded = False
+
+    def _reset(self) -> None:
+        self.offsets: dict[str, int] = {}
+        self.end = 0
+        self.lines = 0
+        self.corrupt = 0
+        self.tally: dict = {}
+        self._head: tuple[str, int] | None = None
+        self._tail: tuple[str, int] | None = None
+        self._rewrite = True
+
+    # --- Sidecar persistence ---
+
+    def _load_sidecar(self) -> None:
+        self._loaded = True
+        if self.sidecar is None:
+            return
+        try:
+            text = self.sidecar.read_text(encoding="utf-8")
+        except OSError:
+            return
+        header_line, _, body = text.partition("\n")
+        try:
+            header = json.loads(header_line)
+            # One C-level parse for the whole body instead of one per line
+            records = json.loads("[" + ",".join(body.split("\n")[:-1]) + "]")
+        except json.JSONDecodeError:
+            return
+        if (
+            not isinstance(header, dict)
+            or header.get("v") != INDEX_VERSION
+            or not records
+            or not isinstance(records[-1], dict)
+        ):
+            return  # unknown format or torn tail: rebuild
+        offsets: dict[str, int] = {}
+        try:
+            for record in records:
+                if isinstance(record, list):
+                    offsets[record[0]] = record[1]
+                else:
+                    self.end = record["end"]
+                    self._tail = (record["tail"], record["tail_len"])
+                    self.lines = record["lines"]
+                    self.corrupt = record["corrupt"]
+                    self.tally = {
+                        tuple(label) if isinstance(label, list) else label: count
+                        for label, count in record["tally"]
+                    }
+            self._head = (header["head"], header["head_len"])
+        except (KeyError, IndexError, TypeError, ValueError):
+            self._reset()  # malformed records: rebuild
+            return
+        self.offsets = offsets
+        self._rewrite = False
+
+    def _checkpoint(self) -> str:
+        return json.dumps(
+            {
+                "end": self.end,
+                "tail": self._tail[0] if self._tail else "",
+                "tail_len": self._tail[1] if self._tail else 0,
+                "lines": self.lines,
+                "corrupt": self.corrupt,
+                "tally": [
+                    [list(label) if isinstance(label, tuple) else label, count]
+                    for label, count in self.tally.items()
+                ],
+            }
+        )
+
+    def _save_sidecar(self, new_offsets: list[tuple[str, int]]) -> None:
+        if self.sidecar is None or self._head is None:
+            return
+        if self._rewrite:
+            header = {
+                "v": INDEX_VERSION,
+                "head": self._head[0],
+                "head_len": self._head[1],
+            }
+            records = [json.dumps(header)]
+            records.extend(json.dumps([k, off]) for k, off in self.offsets.items())
+            mode = "w"
+        else:
+            records = [json.dumps([k, off]) for k, off in new_offsets]
+            mode = "a"
+        records.append(self._checkpoint())
+        try:
+            self.sidecar.parent.mkdir(exist_ok=True)
+            with open(self.sidecar, mode, encoding="utf-8") as f:
+                f.write("\n".join(records) + "\n")
+            self._rewrite = False
+        except OSError:
+            pass  # read-only case or audit dir: index stays in memory
+
+    # --- Indexing ---
+
+    def _head_hash(self, length: int) -> str:
+        with open(self.path, "rb") as f:
+            return hashlib.sha256(f.read(length)).hexdigest()
+
+    def _tail_hash(self, length: int) -> str:
+        """Hash of the length bytes before the indexed end of the log."""
+        with open(self.path, "rb") as f:
+            f.seek(self.end - length)
+            return hashlib.sha256(f.read(length)).hexdigest()
+
+    def _stale(self, size: int) -> bool:
+        """True if the indexed part of the log is no longer what was indexed."""
+        return (
+            size < self.end
+            or self._head is None
+            or self._tail is None
+            or self._head_hash(self._head[1]) != self._head[0]
+            or self._tail_hash(self._tail[1]) != self._tail[0]
+        )
+
+    def refresh(self) -> JsonlIndex:
+        """Bring the index up to date with the log. Raises OSError if unreadable."""
+        if not self._loaded:
+            self._load_sidecar()
+        size = self.path.stat().st_size
+        if self.end and self._stale(size):
+            self._reset()
+        if size > self.end:
+            self._catch_up()
+        return self
+
+    def _catch_up(self) -> None:
+        new_offsets: list[tuple[str, int]] = []
+        offset = self.end
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partial line still being written
+                line_offset = offset
+                offset += len(raw)
+                if not raw.strip():
+                    continue
+                try:
+                    entry = json.loads(raw)
+                except json.JSONDecodeError:
+                    self.corrupt += 1
+                    continue
+                if not isinstance(entry, dict):
+                    self.corrupt += 1
+                    continue
+                self.lines += 1
+                if self._key is not None:
+                    k = self._key(entry)
+                    if k:
+                        self.offsets[k] = line_offset
+                        new_offsets.append((k, line_offset))
+                if self._tally is not None:
+                    label = self._tally(entry)
+                    if label is not None:
+                        self.tally[label] = self.tally.get(label, 0) + 1
+        if offset == self.end:
+            return
+        self.end = offset
+        if self._head is None:
+            head_len = min(self.end, _HEAD_BYTES)
+            self._head = (self._head_hash(head_len), head_len)
+        tail_len = min(self.end, _HEAD_BYTES)
+        self._tail = (self._tail_hash(tail_len), tail_len)
+        self._save_sidecar(new_offsets)
+
+    # --- Lookup ---
+
+    def get(self, key: str) -> dict | None:
+        """Return the entry indexed under key (seek + one line parse)."""
+        return self.lookup([key]).get(key)
+
+    def lookup(self, keys: Iterable[str]) -> dict[str, dict]:
+        """Return {key: entry} for the keys present, reading lines in file order.
+
+        If a line at an indexed offset does not carry its key, the log was
+        changed under the index: it is rebuilt by a full scan and the
+        mismatched keys are read again.
+        """
+        keys = set(keys)
+        found, mismatched = self._read_at_offsets(keys)
+        if mismatched:
+            try:
+                self._reset()
+                self._catch_up()
+            except OSError:
+                return found
+            found.update(self._read_at_offsets(mismatched)[0])
+        return found
+
+    def _read_at_offsets(self, keys: set[str]) -> tuple[dict[str, dict], set[str]]:
+        """({key: entry} read at the indexed offsets, keys whose line mismatched)."""
+        wanted = sorted((self.offsets[k], k) for k in keys if k in self.offsets)
+        found: dict[str, dict] = {}
+        mismatched: set[str] = set()
+        if not wanted:
+            return found, mismatched
+        try:
+            with open(self.path, "rb") as f:
+                for offset, k in wanted:
+                    f.seek(offset)
+                    try:
+                        entry = json.loads(f.readline())
+                    except json.JSONDecodeError:
+                        entry = None
+                    if not isinstance(entry, dict) or (
+                        self._key is not None and self._key(entry) != k
+                    ):
+                        mismatched.add(k)
+                        continue
+                    found[k] = entry
+        except OSError:
+            pass
+        return found, mismatched
+
+
+# --- Case audit trail ---
+
+_APPROVALS_SIDECAR = "_case_approvals.jsonl.idx"
+
+
+def _audit_id(entry: dict) -> str | None:
+    eid = entry.get("audit_id")
+    return eid if isinstance(eid, str) and eid else None
+
+
+def audit_log_index(case_dir: Path, log: Path) -> JsonlIndex:
+    """Return the refreshed index for audit/<name>.jsonl or approvals.jsonl.
+
+    Entries are keyed by audit_id and tallied by (mcp, tool), with the same
+    defaults the audit commands apply: the file stem for audit logs and
+    vhir-cli/approval for approvals.jsonl. Raises OSError if unreadable.
+    """
+    index_dir = case_dir / "audit" / ".index"
+    sidecar = None
+    if log.name == "approvals.jsonl" and log.parent == case_dir:
+        if index_dir.parent.is_dir():
+            sidecar = index_dir / _APPROVALS_SIDECAR
+
+        def tally(e: dict) -> tuple:
+            return (str(e.get("mcp", "vhir-cli")), str(e.get("tool", "approval")))
+    else:
+        if index_dir.parent.is_dir():
+            sidecar = index_dir / f"{log.name}.idx"
+        stem = log.stem
+
+        def tally(e: dict) -> tuple:
+            return (str(e.get("mcp", stem)), str(e.get("tool", "unknown")))
+
+    return JsonlIndex(log, sidecar, key=_audit_id, tally=tally).refresh()
+
+
+def _audit_logs(case_dir: Path) -> list[Path]:
+    audit_dir = case_dir / "audit"
+    if not audit_dir.is_dir():
+        return []
+    return sorted(audit_dir.glob("*.jsonl"))
+
+
+def lookup_audit_entries(case_dir: Path, audit_ids: Iterable[str]) -> dict[str, dict]:
+    """Resolve audit IDs to {audit_id: {**entry, "_source_file": filename}}.
+
+    Same result as load_audit_index() restricted to audit_ids (a later file
+    wins on duplicate IDs), but each file is only read at the indexed
+    offsets instead of parsed in full.
+    """
+    wanted = set(audit_ids)
+    found: dict[str, dict] = {}
+    if not wanted:
+        return found
+    for log in _audit_logs(case_dir):
+        try:
+            index = audit_log_index(case_dir, log)
+        except OSError:
+            continue
+        for eid, entry in index.lookup(wanted).items():
+            entry["_source_file"] = log.name
+            found[eid] = entry
+    return found
+
+
+def audit_counts(case_dir: Path) -> dict:
+    """Entry totals for audit/*.jsonl plus approvals.jsonl from the indexes.
+
+    Returns:
+        Dict with total_entries, audit_ids (distinct), by_mcp, by_tool and
+        corrupt_lines.
+    """
+    logs = _audit_logs(case_dir)
+    approvals = case_dir / "approvals.jsonl"
+    if approvals.exists():
+        logs.append(approvals)
+
+    total = 0
+    corrupt = 0
+    audit_ids: set[str] = set()
+    by_mcp: dict[str, int] = {}
+    by_tool: dict[str, dict[str, int]] = {}
+    for log in logs:
+        try:
+            index = audit_log_index(case_dir, log)
+        except OSError as e:
+            print(f"  Warning: could not read {log}: {e}", file=sys.stderr)
+            continue
+        total += index.lines
+        corrupt += index.corrupt
+        audit_ids.update(index.offsets)
+        for (mcp, tool), count in index.tally.items():
+            by_mcp[mcp] = by_mcp.get(mcp, 0) + count
+            tools = by_tool.setdefault(mcp, {})
+            tools[tool] = tools.get(tool, 0) + count
+    return {
+        "total_entries": total,
+        "audit_ids": len(audit_ids),
+        "by_mcp": by_mcp,
+        "by_tool": by_tool,
+        "corrupt_lines": corrupt,
+    }
+
+
+# --- Reading entries ---
+
+
+_APPROVAL_LABELS = {"tool": "approval", "mcp": "vhir-cli"}
+
+
+def _audit_sources(
+    case_dir: Path, review_labels: bool = False
+) -> list[tuple[Path, dict, dict]]:
+    """(log, defaults, overrides) for every audit log, plus approvals.jsonl last.
+
+    vhir audit fills in missing labels (the file stem as mcp for audit
+    logs, approval/vhir-cli for approvals). With review_labels, audit logs
+    are shown as written and approvals are always labelled approval/vhir-cli,
+    as vhir review shows them.
+    """
+    sources = [
+        (log, {} if review_labels else {"mcp": log.stem}, {})
+        for log in _audit_logs(case_dir)
+    ]
+    approvals = case_dir / "approvals.jsonl"
+    if approvals.exists():
+        if review_labels:
+            sources.append((approvals, {}, _APPROVAL_LABELS))
+        else:
+            sources.append((approvals, _APPROVAL_LABELS, {}))
+    return sources
+
+
+def _label(entry: dict, defaults: dict, overrides: dict) -> dict:
+    for k, v in defaults.items():
+        entry.setdefault(k, v)
+    entry.update(overrides)
+    return entry
+
+
+def _warn_corrupt(corrupt: int) -> None:
+    if corrupt:
+        print(
+            f"  Warning: {corrupt} corrupt JSONL line(s) skipped in audit trail",
+            file=sys.stderr,
+        )
+
+
+def load_audit_entries(case_dir: Path, review_labels: bool = False) -> list[dict]:
+    """Load every audit/*.jsonl and approvals.jsonl entry, sorted by ts.
+
+    Lines that are not JSON objects are skipped and counted as corrupt.
+    """
+    entries: list[dict] = []
+    corrupt = 0
+    for log, defaults, overrides in _audit_sources(case_dir, review_labels):
+        try:
+            with open(log, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        corrupt += 1
+                        continue
+                    if not isinstance(entry, dict):
+                        corrupt += 1
+                        continue
+                    entries.append(_label(entry, defaults, overrides))
+        except OSError as e:
+            print(f"  Warning: could not read {log}: {e}", file=sys.stderr)
+    _warn_corrupt(corrupt)
+    entries.sort(key=lambda e: e.get("ts", ""))
+    return entries
+
+
+class _OutOfOrder(Exception):
+    """A log is not in ts order, so its tail is not its newest entries."""
+
+
+def _reverse_lines(path: Path) -> Iterator[bytes]:
+    """Yield non-empty lines from the end of a file towards the start."""
+    block_size = _TAIL_BLOCK
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        carry = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + carry).split(b"\n")
+            carry = lines[0]  # may continue in the previous block
+            for line in reversed(lines[1:]):
+                if line.strip():
+                    yield line
+        if carry.strip():
+            yield carry
+
+
+def _newest_first(
+    log: Path,
+    defaults: dict,
+    overrides: dict,
+    mcp: str | None,
+    tool: str | None,
+    corrupt: list[int],
+) -> Iterator[dict]:
+    """Entries of one log, newest first, with the mcp/tool filters applied.
+
+    Each entry is held until the next older line has been read, so a line
+    appended out of ts order is detected before its neighbours are merged.
+    """
+
+    def wanted(entry: dict) -> bool:
+        if mcp and entry.get("mcp", "") != mcp:
+            return False
+        return not (tool and entry.get("tool", "") != tool)
+
+    held = None
+    for line in _reverse_lines(log):
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            corrupt[0] += 1
+            continue
+        if not isinstance(entry, dict):
+            corrupt[0] += 1
+            continue
+        _label(entry, defaults, overrides)
+        if held is not None:
+            if entry.get("ts", "") > held.get("ts", ""):
+                raise _OutOfOrder(log)
+            if wanted(held):
+                yield held
+        held = entry
+    if held is not None and wanted(held):
+        yield held
+
+
+def tail_audit_entries(
+    case_dir: Path,
+    limit: int,
+    mcp: str | None = None,
+    tool: str | None = None,
+    review_labels: bool = False,
+) -> list[dict]:
+    """Return the newest `limit` audit and approval entries, oldest first.
+
+    A limit below 1 returns every entry. review_labels selects the labels
+    vhir review shows (see _audit_sources).
+
+    Reads each log backwards in blocks and k-way merges the streams by ts,
+    so the cost depends on limit rather than on the size of the audit
+    trail. Logs are appended in time order; if a line read turns out to
+    be out of order, this falls back to load_audit_entries() and a full
+    sort. Only the lines actually read are checked, so when every log is
+    in ts order the result matches load_audit_entries() filtered and
+    sliced to the last `limit`, but an out-of-order line older than the
+    tail that was read can make the two differ.
+    """
+    corrupt = [0]
+    # heapq.merge emits ties from earlier iterables first; reversing the
+    # source order reproduces the stable ascending sort, read backwards.
+    streams = [
+        _newest_first(log, defaults, overrides, mcp, tool, corrupt)
+        for log, defaults, overrides in reversed(
+            _audit_sources(case_dir, review_labels)
+        )
+    ]
+    newest: list[dict] = []
+    try:
+        for entry in heapq.merge(*streams, key=lambda e: e.get("ts", ""), reverse=True):
+            newest.append(entry)
+            if 0 < limit <= len(newest):
+                break
+    except _OutOfOrder:
+        entries = load_audit_entries(case_dir, review_labels)
+        if mcp:
+            entries = [e for e in entries if e.get("mcp", "") == mcp]
+        if tool:
+            entries = [e for e in entries if e.get("tool", "") == tool]
+        return entries[-limit:] if limit > 0 else entries
+    except OSError as e:
+        print(f"  Warning: could not read audit trail: {e}", file=sys.stderr)
+    _warn_corrupt(corrupt[0])
+    newest.reverse()
+    return newest
@@ -11,11 +11,19 @@ import os
 import re
 import sys
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import TextIO
 
 import yaml
 
+try:
+    import fcntl
+except ImportError:  # no POSIX locks: the coupling index is rebuilt on lookup
+    fcntl = None
+
 _EXAMINER_RE = re.compile(r"^[a-z0-9][a-z0-9-]{0,19}$")
 
 DEFAULT_CASES_DIR = str(Path.home() / "cases")
@@ -39,15 +47,29 @@ def _validate_examiner(examiner: str) -> None:
         raise CaseError(f"Invalid examiner slug: {examiner!r}")
 
 
+# Paths whose fsync is deferred to the end of a case transaction (None
+# outside one): each touched file is synced once, however often written.
+_DEFERRED_SYNC: set[Path] | None = None
+
+
+def _fsync(f, path: Path) -> None:
+    """fsync an open file now, or once at transaction commit."""
+    f.flush()
+    if _DEFERRED_SYNC is None:
+        os.fsync(f.fileno())
+    else:
+        _DEFERRED_SYNC.add(path)
+
+
 def _atomic_write(path: Path, content: str) -> None:
     """Write file atomically via temp file + rename to prevent data loss on crash."""
     fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w") as f:
             f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
+            _fsync(f, path)
         os.replace(tmp_path, path)
+        _invalidate_cache(path)
     except BaseException:
         try:
             os.unlink(tmp_path)
@@ -75,7 +97,25 @@ def _protected_write(path: Path, content: str) -> None:
 
 
 def get_case_dir(case_id: str | None = None) -> Path:
-    """Resolve the active case directory."""
+    """Resolve the active case directory.
+
+    An interrupted case transaction is completed (or rolled back) first.
+    """
+    case_dir = _resolve_case_dir(case_id)
+    try:
+        recover_case_transaction(case_dir)
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        print(
+            f"WARNING: Could not complete interrupted commit in {case_dir}: {e}\n"
+            f"  Check the case with 'vhir review --verify', then delete "
+            f"{case_dir / TXN_FILE} to clear this warning (re-run the approve "
+            "or reject if its changes are missing).",
+            file=sys.stderr,
+        )
+    return case_dir
+
+
+def _resolve_case_dir(case_id: str | None) -> Path:
     if case_id:
         _validate_case_id(case_id)
         cases_dir = Path(os.environ.get("VHIR_CASES_DIR", DEFAULT_CASES_DIR))
@@ -149,6 +189,302 @@ def load_case_meta(case_dir: Path) -> dict:
         return {}
 
 
+# --- Case data stores ---
+#
+# findings.json, timeline.json and iocs.json are always complete JSON
+# snapshots. Cases created with ``storage: journal`` in CASE.yaml also keep
+# an append-only ``<name>.journal.jsonl`` beside each snapshot: saves append
+# only the items that changed, loads replay committed batches over the
+# snapshot, and the journal is folded back into the snapshot once it
+# outgrows it (or on removals/reordering, which the journal cannot express).
+#
+# Journal layout, one JSON object per line:
+#   {"journal": 1, "base": <sha256 of the snapshot it extends>}
+#   {"begin": <ts>} {"put": <item>} ... {"commit": <number of puts>}
+#   {"compacting": <sha256 of the snapshot replacing it>}
+# A batch is applied only when its commit line is intact, so a torn append
+# is ignored as a whole.
+
+STORAGE_MODES = ("json", "journal")
+_JOURNAL_VERSION = 1
+_JOURNAL_COMPACT_MIN = 1024 * 1024
+
+# Parsed-file cache: path -> (stat signature, items as JSON text, journal
+# state). Revalidated by stat on every read and dropped on every write from
+# this process, so one command reads and replays each case file at most
+# once. Items are kept as text: every read decodes fresh objects, so nothing
+# a caller holds (or mutates) is shared with the cache or with the stored
+# items a journal save diffs against.
+_STORE_CACHE: dict[Path, tuple[tuple, str, str]] = {}
+_STORE_CACHE_MAX = 32
+
+
+def _journal_path(path: Path) -> Path:
+    """Journal file for a store snapshot: findings.json -> findings.journal.jsonl."""
+    return path.with_name(f"{path.stem}.journal.jsonl")
+
+
+def get_storage_mode(case_dir: Path) -> str:
+    """Return the case storage backend from CASE.yaml ("json" or "journal")."""
+    mode = str(load_case_meta(case_dir).get("storage", "json")).strip().lower()
+    return mode if mode in STORAGE_MODES else "json"
+
+
+def _replay_journal(journal: Path, items: list[dict]) -> tuple[str, set[str]]:
+    """Apply committed journal batches to items in place.
+
+    Returns (base snapshot hash, hashes of snapshots written by compaction).
+    """
+    positions = {
+        item.get("id"): i for i, item in enumerate(items) if isinstance(item, dict)
+    }
+    base = ""
+    compacted: set[str] = set()
+    pending: list[dict] | None = None
+    with open(journal, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                pending = None  # torn or corrupt line voids the open batch
+                continue
+            if not isinstance(record, dict):
+                pending = None
+            elif "journal" in record:
+                base = record.get("base", "")
+            elif "compacting" in record:
+                compacted.add(record["compacting"])
+            elif "begin" in record:
+                pending = []
+            elif "put" in record and pending is not None:
+                pending.append(record["put"])
+            elif "commit" in record and pending is not None:
+                if record["commit"] == len(pending):
+                    for item in pending:
+                        pos = positions.get(item.get("id"))
+                        if pos is None:
+                            positions[item.get("id")] = len(items)
+                            items.append(item)
+                        else:
+                            items[pos] = item
+                pending = None
+    return base, compacted
+
+
+def _file_signature(path: Path) -> tuple | None:
+    """Stat fingerprint used to revalidate cached parses."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+
+
+def _read_store(path: Path) -> tuple[list[dict], str]:
+    """Cached _parse_store: each file is read once until it changes on disk.
+
+    Always returns a list the caller owns (decoded afresh on a cache hit).
+    """
+    signature = (_file_signature(path), _file_signature(_journal_path(path)))
+    cached = _STORE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return json.loads(cached[1]), cached[2]
+    items, state = _parse_store(path)
+    if len(_STORE_CACHE) >= _STORE_CACHE_MAX:
+        _STORE_CACHE.pop(next(iter(_STORE_CACHE)))
+    _STORE_CACHE[path] = (signature, json.dumps(items), state)
+    return items, state
+
+
+def _invalidate_cache(path: Path) -> None:
+    """Drop the cached parse of a file written by this process."""
+    if path.name.endswith(".journal.jsonl"):
+        path = path.with_name(path.name[: -len(".journal.jsonl")] + ".json")
+    _STORE_CACHE.pop(path, None)
+
+
+def clear_case_cache() -> None:
+    """Forget every cached parse (for long-running callers and tests)."""
+    _STORE_CACHE.clear()
+
+
+def _parse_store(path: Path) -> tuple[list[dict], str]:
+    """Read a store snapshot and replay its journal.
+
+    Returns (items, journal state) where the state is "none" (no journal),
+    "current" (journal extends this snapshot), "obsolete" (journal already
+    folded into this snapshot) or "rebased" (snapshot was rewritten by
+    another writer; journal puts are replayed on top so approvals survive).
+    Raises json.JSONDecodeError if the snapshot is corrupt.
+    """
+    raw = b""
+    items: list[dict] = []
+    if path.exists():
+        raw = path.read_bytes()
+        items = json.loads(raw)
+    journal = _journal_path(path)
+    if not journal.exists():
+        return items, "none"
+    snapshot_hash = hashlib.sha256(raw).hexdigest()
+    replayed = list(items)
+    base, compacted = _replay_journal(journal, replayed)
+    if snapshot_hash in compacted:
+        return items, "obsolete"
+    return replayed, "current" if base == snapshot_hash else "rebased"
+
+
+def _load_store(case_dir: Path, filename: str) -> list[dict]:
+    """Load a store, warning and returning [] if the snapshot is corrupt."""
+    path = case_dir / filename
+    if not path.exists() and not _journal_path(path).exists():
+        return []
+    try:
+        return _read_store(path)[0]
+    except json.JSONDecodeError as e:
+        print(f"WARNING: Corrupt {filename} ({path}): {e}", file=sys.stderr)
+        return []
+
+
+def _append_journal(journal: Path, text: str, header: str = "") -> None:
+    """Append text to a journal with one fsync and the chmod-444 cycle."""
+    try:
+        if journal.exists():
+            os.chmod(journal, 0o644)
+    except OSError:
+        pass
+    with open(journal, "a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        prefix = b""
+        if size == 0:
+            prefix = header.encode()
+        else:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                prefix = b"\n"  # terminate a torn tail before the new batch
+        f.write(prefix + text.encode())
+        _fsync(f, journal)
+    _invalidate_cache(journal)
+    try:
+        os.chmod(journal, 0o444)
+    except OSError:
+        pass
+
+
+def _journal_save(path: Path, items: list[dict]) -> bool:
+    """Record the changes between the stored items and items as a journal batch.
+
+    Returns False when the change cannot be expressed as appended puts
+    (removed or reordered items, missing or duplicate IDs, stale journal)
+    or the journal has outgrown its snapshot; the caller compacts instead.
+    """
+    if not path.exists():
+        return False
+    current, state = _read_store(path)
+    if state not in ("none", "current"):
+        return False
+    ids = [item.get("id") if isinstance(item, dict) else None for item in items]
+    if not all(isinstance(i, str) and i for i in ids) or len(set(ids)) != len(ids):
+        return False
+    n = len(current)
+    current_ids = [c.get("id") if isinstance(c, dict) else None for c in current]
+    if len(items) < n or ids[:n] != current_ids:
+        return False
+    changed = [
+        new for new, old in zip(items, current, strict=False) if new != old
+    ] + items[n:]
+    if not changed:
+        return True
+    lines = [json.dumps({"begin": datetime.now(timezone.utc).isoformat()})]
+    lines.extend(json.dumps({"put": item}, default=str) for item in changed)
+    lines.append(json.dumps({"commit": len(changed)}))
+    batch = "\n".join(lines) + "\n"
+    journal = _journal_path(path)
+    snapshot_size = path.stat().st_size
+    journal_size = journal.stat().st_size if journal.exists() else 0
+    if journal_size + len(batch) > max(snapshot_size, _JOURNAL_COMPACT_MIN):
+        return False
+    header = ""
+    if state == "none":
+        base = hashlib.sha256(path.read_bytes()).hexdigest()
+        header = json.dumps({"journal": _JOURNAL_VERSION, "base": base}) + "\n"
+    _append_journal(journal, batch, header)
+    return True
+
+
+def _save_store(
+    case_dir: Path,
+    filename: str,
+    items: list[dict],
+    changed: list[int] | None = None,
+) -> None:
+    """Save a store: journal append when enabled, else a full protected rewrite.
+
+    Saves of timeline.json and iocs.json keep the coupling index current
+    under its lock; changed, if given, lists the positions of the only items
+    that differ from the stored list, so only those are relinked. The IOC
+    index and case catalog are not written here: the save moves the store's
+    stat signature, which marks their entries stale, and each is rebuilt by
+    its next reader.
+    """
+    path = case_dir / filename
+    if filename not in _COUPLING_FIELDS:
+        _write_store(case_dir, path, items)
+        return
+    with _coupling_lock(case_dir) as locked:
+        before = _store_signature(path)
+        _write_store(case_dir, path, items)
+        if locked:
+            _update_coupling_index(case_dir, filename, items, before, changed)
+
+
+def _write_store(case_dir: Path, path: Path, items: list[dict]) -> None:
+    if get_storage_mode(case_dir) == "journal":
+        try:
+            if _journal_save(path, items):
+                return
+        except (OSError, ValueError):
+            pass  # fall back to a full snapshot write
+    _compact_store(path, items)
+
+
+def _compact_store(path: Path, items: list[dict]) -> None:
+    """Write items as the full snapshot and retire any journal."""
+    content = json.dumps(items, indent=2, default=str)
+    journal = _journal_path(path)
+    if journal.exists():
+        # Mark the journal obsolete before replacing the snapshot, so a crash
+        # before the unlink below cannot replay older puts over newer data.
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        _append_journal(journal, json.dumps({"compacting": digest}) + "\n")
+    _protected_write(path, content)
+    try:
+        journal.unlink()
+    except FileNotFoundError:
+        pass
+    _invalidate_cache(path)
+
+
+def compact_case_data(case_dir: Path) -> list[str]:
+    """Fold every store journal into its JSON snapshot.
+
+    Returns the names of the snapshots that were rewritten. Used when a
+    journal-mode case is closed so archived cases are plain JSON files.
+    """
+    compacted = []
+    for filename in ("findings.json", "timeline.json", "iocs.json"):
+        path = case_dir / filename
+        if not _journal_path(path).exists():
+            continue
+        try:
+            items = _read_store(path)[0]
+        except json.JSONDecodeError as e:
+            print(f"WARNING: Corrupt {filename} ({path}): {e}", file=sys.stderr)
+            continue
+        _compact_store(path, items)
+        compacted.append(filename)
+    return compacted
+
+
 # --- Data I/O (case root) ---
 
 
@@ -158,15 +494,14 @@ def check_case_file_integrity(case_dir: Path, filename: str) -> None:
     if not path.exists():
         return
     try:
-        raw = path.read_text().strip()
+        # Reads through the cache, so the load that follows need not reparse
+        _read_store(path)
     except OSError as e:
         print(f"ERROR: Cannot read {filename}: {e}", file=sys.stderr)
         sys.exit(1)
-    if not raw or raw == "[]":
-        return
-    try:
-        json.loads(raw)
     except json.JSONDecodeError as e:
+        if not path.read_text().strip():
+            return
         print(
             f"ERROR: {filename} is corrupt and cannot be parsed: {e}",
             file=sys.stderr,
@@ -177,54 +512,27 @@ def check_case_file_integrity(case_dir: Path, filename: str) -> None:
 
 def load_findings(case_dir: Path) -> list[dict]:
     """Load findings from case root findings.json."""
-    findings_file = case_dir / "findings.json"
-    if not findings_file.exists():
-        return []
-    try:
-        return json.loads(findings_file.read_text())
-    except json.JSONDecodeError as e:
-        print(f"WARNING: Corrupt findings.json ({findings_file}): {e}", file=sys.stderr)
-        return []
+    return _load_store(case_dir, "findings.json")
 
 
 def save_findings(case_dir: Path, findings: list[dict]) -> None:
     """Save findings to case root."""
-    _protected_write(
-        case_dir / "findings.json",
-        json.dumps(findings, indent=2, default=str),
-    )
+    _save_store(case_dir, "findings.json", findings)
 
 
 def load_timeline(case_dir: Path) -> list[dict]:
     """Load timeline events from case root timeline.json."""
-    timeline_file = case_dir / "timeline.json"
-    if not timeline_file.exists():
-        return []
-    try:
-        return json.loads(timeline_file.read_text())
-    except json.JSONDecodeError as e:
-        print(f"WARNING: Corrupt timeline.json ({timeline_file}): {e}", file=sys.stderr)
-        return []
+    return _load_store(case_dir, "timeline.json")
 
 
 def save_timeline(case_dir: Path, timeline: list[dict]) -> None:
     """Save timeline to case root."""
-    _protected_write(
-        case_dir / "timeline.json",
-        json.dumps(timeline, indent=2, default=str),
-    )
+    _save_store(case_dir, "timeline.json", timeline)
 
 
 def load_todos(case_dir: Path) -> list[dict]:
     """Load TODO items from case root todos.json."""
-    todos_file = case_dir / "todos.json"
-    if not todos_file.exists():
-        return []
-    try:
-        return json.loads(todos_file.read_text())
-    except json.JSONDecodeError as e:
-        print(f"WARNING: Corrupt todos.json ({todos_file}): {e}", file=sys.stderr)
-        return []
+    return _load_store(case_dir, "todos.json")
 
 
 def save_todos(case_dir: Path, todos: list[dict]) -> None:
@@ -237,29 +545,18 @@ def save_todos(case_dir: Path, todos: list[dict]) -> None:
 
 def load_iocs(case_dir: Path) -> list[dict]:
     """Load IOC records from case root iocs.json."""
-    iocs_file = case_dir / "iocs.json"
-    if not iocs_file.exists():
-        return []
-    try:
-        return json.loads(iocs_file.read_text())
-    except json.JSONDecodeError as e:
-        print(f"WARNING: Corrupt iocs.json ({iocs_file}): {e}", file=sys.stderr)
-        return []
+    return _load_store(case_dir, "iocs.json")
 
 
 def save_iocs(case_dir: Path, iocs: list[dict]) -> None:
     """Save IOC records to case root (protected write)."""
-    _protected_write(
-        case_dir / "iocs.json",
-        json.dumps(iocs, indent=2, default=str),
-    )
+    _save_store(case_dir, "iocs.json", iocs)
 
 
 # --- Approval I/O ---
 
 
-def write_approval_log(
-    case_dir: Path,
+def approval_log_entry(
     item_id: str,
     action: str,
     identity: dict,
@@ -268,9 +565,8 @@ def write_approval_log(
     content_hash: str = "",
     stale_at_approval: bool = False,
     coupled_from: str = "",
-) -> bool:
-    """Write approval/rejection record to approvals.jsonl. Returns True on success."""
-    log_file = case_dir / "approvals.jsonl"
+) -> dict:
+    """Build one approvals.jsonl record (see write_approval_logs)."""
     entry = {
         "ts": datetime.now(timezone.utc).isoformat(),
         "item_id": item_id,
@@ -290,6 +586,41 @@ def write_approval_log(
         entry["stale_at_approval"] = True
     if coupled_from:
         entry["coupled_from"] = coupled_from
+    return entry
+
+
+def write_approval_log(
+    case_dir: Path,
+    item_id: str,
+    action: str,
+    identity: dict,
+    reason: str = "",
+    mode: str = "interactive",
+    content_hash: str = "",
+    stale_at_approval: bool = False,
+    coupled_from: str = "",
+) -> bool:
+    """Write approval/rejection record to approvals.jsonl. Returns True on success."""
+    entry = approval_log_entry(
+        item_id,
+        action,
+        identity,
+        reason=reason,
+        mode=mode,
+        content_hash=content_hash,
+        stale_at_approval=stale_at_approval,
+        coupled_from=coupled_from,
+    )
+    return write_approval_logs(case_dir, [entry])
+
+
+def write_approval_logs(case_dir: Path, entries: list[dict]) -> bool:
+    """Append approval records with one write, one fsync and one
+    permission cycle (0o644 while writing, back to 0o444). Returns True on
+    success, or if there is nothing to write."""
+    if not entries:
+        return True
+    log_file = case_dir / "approvals.jsonl"
     try:
         if log_file.exists():
             os.chmod(log_file, 0o644)
@@ -297,7 +628,7 @@ def write_approval_log(
         pass
     try:
         with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+            f.write("".join(json.dumps(entry) + "\n" for entry in entries))
             f.flush()
             os.fsync(f.fileno())
     except OSError:
@@ -335,9 +666,767 @@ def load_approval_log(case_dir: Path) -> list[dict]:
     return entries
 
 
+# --- Case transactions ---
+#
+# An approve/reject commit touches up to five files: the findings, timeline
+# and IOC stores, approvals.jsonl and the HMAC ledger (plus todos.json).
+# A CaseTransaction stages those writes and commit() applies them as a group:
+#
+#   1. Every staged write is recorded in .case-txn.json (temp file, one
+#      fsync, rename). The rename is the commit point.
+#   2. The writes are applied with their fsyncs deferred, then each touched
+#      file is fsynced once.
+#   3. The record is removed.
+#
+# A crash before step 1 completes leaves only .case-txn.json.tmp: nothing
+# was applied and the transaction is rolled back. A crash after it leaves
+# the record, and the next command that resolves the case (get_case_dir)
+# replays it.
+# Replay is idempotent: store writes are upserts of the staged items and
+# appends are skipped when their bytes are already at the recorded offset.
+#
+# The record is replayed without a password, so replay only trusts what a
+# commit can produce: the record must be owned by this user and not
+# writable by others (L3 deny rules keep the LLM client away from it), and
+# every op must target a case store, todos.json, approvals.jsonl or this
+# case's verification ledger. Anything else is refused and the record is
+# left in place for the examiner to inspect.
+
+TXN_FILE = ".case-txn.json"
+_TXN_STORES = ("findings.json", "timeline.json", "iocs.json")
+_TXN_REPLACE_FILES = ("todos.json",)
+
+
+class CaseTransaction:
+    """Writes staged for one group commit of a case."""
+
+    def __init__(self, case_dir: Path) -> None:
+        self.case_dir = case_dir
+        self.ops: list[dict] = []
+        self.committed = False
+
+    def save_store(self, filename: str, items: list[dict]) -> None:
+        """Stage a findings/timeline/iocs save (as save_findings etc.)."""
+        delta = _store_delta(self.case_dir / filename, items)
+        if delta.get("puts") == [] and (self.case_dir / filename).exists():
+            return  # nothing changed
+        self.ops.append({"op": "store", "file": filename, **delta})
+
+    def save_todos(self, todos: list[dict]) -> None:
+        """Stage a todos.json rewrite."""
+        content = json.dumps(todos, indent=2, default=str)
+        self.ops.append({"op": "replace", "file": "todos.json", "content": content})
+
+    def append_approval_logs(self, entries: list[dict]) -> None:
+        """Stage approvals.jsonl records (see approval_log_entry)."""
+        self.append_lines(self.case_dir / "approvals.jsonl", entries, mode=0o444)
+
+    def append_lines(self, path: Path, entries: list[dict], mode: int) -> None:
+        """Stage JSONL records for path; mode is applied after the append."""
+        if entries:
+            data = "".join(json.dumps(entry) + "\n" for entry in entries)
+            self.ops.append(
+                {"op": "append", "path": str(path), "data": data, "mode": mode}
+            )
+
+    def commit(self) -> None:
+        """Write the transaction record, apply every op, then drop the record.
+
+        Raises:
+            OSError: If a write fails. Before the record is durable nothing
+                has been applied (committed stays False); afterwards the
+                record stays and the next command completes the commit.
+        """
+        if not self.ops:
+            return
+        for op in self.ops:
+            if op["op"] == "append":
+                path = Path(op["path"])
+                op["offset"] = path.stat().st_size if path.exists() else 0
+        record = self.case_dir / TXN_FILE
+        tmp = record.with_name(TXN_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"v": 1, "ops": self.ops}, f, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o444)
+        os.replace(tmp, record)
+        self.committed = True
+        _apply_transaction(self.case_dir, self.ops)
+        record.unlink()
+
+
+def commit_transaction(
+    txn: CaseTransaction, retry_hint: str = "Retry after fixing the issue."
+) -> None:
+    """Commit txn for a CLI command; on failure say what happened and exit 1."""
+    try:
+        txn.commit()
+    except OSError as e:
+        print(f"CRITICAL: Failed to commit case changes: {e}", file=sys.stderr)
+        if txn.committed:
+            print(
+                "The commit is recorded and will be completed by the next "
+                "vhir command on this case.",
+                file=sys.stderr,
+            )
+        else:
+            print(f"No changes were committed. {retry_hint}", file=sys.stderr)
+        sys.exit(1)
+
+
+def recover_case_transaction(case_dir: Path) -> bool:
+    """Replay or roll back an interrupted transaction. Returns True if one
+    was replayed; raises OSError if the record is unreadable or refused, or
+    the replay fails (record kept)."""
+    record = case_dir / TXN_FILE
+    try:
+        (case_dir / (TXN_FILE + ".tmp")).unlink()  # never committed
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    try:
+        data = json.loads(record.read_text(encoding="utf-8"))
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    except (OSError, json.JSONDecodeError) as e:
+        raise OSError(f"unreadable transaction record {record}: {e}") from e
+    ops = data.get("ops") if isinstance(data, dict) else None
+    _check_transaction(case_dir, record, ops)
+    _apply_transaction(case_dir, ops)
+    record.unlink()
+    print(
+        f"Completed an interrupted commit in {case_dir} ({len(ops)} write(s)).",
+        file=sys.stderr,
+    )
+    return True
+
+
+def _txn_ledger_path(case_dir: Path) -> Path | None:
+    """This case's verification ledger (case_id resolved as approve does)."""
+    from vhir_cli.verification import ledger_path
+
+    case_id = load_case_meta(case_dir).get("case_id") or case_dir.name
+    try:
+        return ledger_path(str(case_id))
+    except ValueError:
+        return None
+
+
+def _check_transaction(case_dir: Path, record: Path, ops) -> None:
+    """Refuse a record that a CaseTransaction commit could not have written.
+
+    Raises:
+        OSError: If the record's owner, permissions or any op is not one
+            this CLI produces.
+    """
+    st = record.stat()
+    if st.st_uid != os.getuid() or st.st_mode & 0o022:
+        raise OSError(
+            f"transaction record {record} is not owned by this user "
+            "or is writable by others; refusing to replay it"
+        )
+    appends = {(case_dir / "approvals.jsonl").resolve(): 0o444}
+    ledger = _txn_ledger_path(case_dir)
+    if ledger is not None:
+        appends[ledger.resolve()] = 0o600
+    if not isinstance(ops, list):
+        raise OSError(f"transaction record {record} has no op list")
+    for op in ops:
+        kind = op.get("op") if isinstance(op, dict) else None
+        if kind == "store":
+            items = op.get("items", op.get("puts"))
+            ok = (
+                op.get("file") in _TXN_STORES
+                and isinstance(items, list)
+                and all(_txn_item_ok(item) for item in items)
+            )
+        elif kind == "replace":
+            ok = op.get("file") in _TXN_REPLACE_FILES and isinstance(
+                op.get("content"), str
+            )
+        elif kind == "append":
+            path = op.get("path")
+            ok = (
+                isinstance(path, str)
+                and appends.get(Path(path).resolve()) == op.get("mode")
+                and isinstance(op.get("data"), str)
+                and isinstance(op.get("offset"), int)
+                and op["offset"] >= 0
+            )
+        else:
+            ok = False
+        if not ok:
+            raise OSError(
+                f"transaction record {record} contains an op outside this "
+                f"case's stores, approvals log and ledger; refusing to replay it"
+            )
+
+
+def _txn_item_ok(item) -> bool:
+    """A store item as commits write them: a dict with a non-empty str id."""
+    return (
+        isinstance(item, dict) and isinstance(item.get("id"), str) and bool(item["id"])
+    )
+
+
+def _store_delta(path: Path, items: list[dict]) -> dict:
+    """Changed items as upserts when items only extends/updates the stored
+    list by ID (the approve/reject case); otherwise the full list."""
+    try:
+        current = _read_store(path)[0] if path.exists() else []
+    except json.JSONDecodeError:
+        return {"items": items}
+    ids = [item.get("id") if isinstance(item, dict) else None for item in items]
+    current_ids = [c.get("id") if isinstance(c, dict) else None for c in current]
+    n = len(current)
+    if (
+        not all(isinstance(i, str) and i for i in ids)
+        or len(set(ids)) != len(ids)
+        or ids[:n] != current_ids
+    ):
+        return {"items": items}
+    puts = [
+        new for new, old in zip(items, current, strict=False) if new != old
+    ] + items[n:]
+    return {"puts": puts}
+
+
+def _apply_transaction(case_dir: Path, ops: list[dict]) -> None:
+    global _DEFERRED_SYNC
+    _DEFERRED_SYNC = touched = set()
+    try:
+        for op in ops:
+            if op["op"] == "store":
+                _apply_store_op(case_dir, op)
+            elif op["op"] == "replace":
+                _atomic_write(case_dir / op["file"], op["content"])
+            elif op["op"] == "append":
+                _apply_append_op(op)
+    finally:
+        _DEFERRED_SYNC = None
+    for path in sorted(touched):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _apply_store_op(case_dir: Path, op: dict) -> None:
+    if "items" in op:
+        items = op["items"]
+    else:
+        path = case_dir / op["file"]
+        items = (
+            _read_store(path)[0]
+            if path.exists() or _journal_path(path).exists()
+            else []
+        )
+        positions = {
+            item.get("id"): i for i, item in enumerate(items) if isinstance(item, dict)
+        }
+        changed = []
+        for item in op["puts"]:
+            pos = positions.get(item.get("id"))
+            if pos is None:
+                pos = positions[item.get("id")] = len(items)
+                items.append(item)
+            else:
+                items[pos] = item
+            changed.append(pos)
+        _save_store(case_dir, op["file"], items, changed)
+        return
+    _save_store(case_dir, op["file"], items)
+
+
+def _apply_append_op(op: dict) -> None:
+    path = Path(op["path"])
+    data = op["data"].encode()
+    if path.exists():
+        with open(path, "rb") as f:
+            f.seek(op["offset"])
+            if f.read(len(data)) == data:
+                return  # applied before the interruption
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    try:
+        if path.exists():
+            os.chmod(path, 0o644)
+    except OSError:
+        pass
+    with open(path, "a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                data = b"\n" + data  # terminate a torn tail
+        f.write(data)
+        _fsync(f, path)
+    _invalidate_cache(path)
+    try:
+        os.chmod(path, op["mode"])
+    except OSError:
+        pass
+
+
+# --- Coupling index ---
+#
+# Approve and reject cascade a finding's disposition to the timeline events
+# auto-created from it (auto_created_from) and to the IOCs extracted from it
+# (source_findings). .coupling-index.json maps each finding ID to the IDs and
+# list positions of the items that reference it, so the cascade visits only
+# those items instead of every timeline event and IOC in the case.
+#
+# Each store's entry records the stat signature of the store it describes.
+# Saves through _save_store update the entry while holding
+# .coupling-index.lock across the store write, so the recorded signature is
+# the one that save produced: transaction upserts and merges relink only
+# the items they changed, other saves re-index the list being written
+# without re-reading it. A store changed by another writer (or saved where
+# the lock is unavailable) is re-indexed from its parse on the next lookup.
+# The index is a cache: it is not fsynced, backups skip it, and deleting it
+# is always safe.
+#
+# The IOC entry also lists the IOCs still awaiting coupling ("pending":
+# undecided, not manually reviewed, with source findings). Lookups return
+# them with the linked IOCs, so an IOC recorded after its sources were
+# decided is still approved or rejected by the next commit, as a full scan
+# would.
+
+COUPLING_INDEX = ".coupling-index.json"
+COUPLING_LOCK = ".coupling-index.lock"
+_COUPLING_VERSION = 2
+_COUPLING_FIELDS = {
+    "timeline.json": "auto_created_from",
+    "iocs.json": "source_findings",
+}
+_PENDING_FIELD = "source_findings"
+
+
+def _store_signature(path: Path) -> list:
+    """Stat signature of a store snapshot and its journal, JSON-shaped."""
+    return [
+        list(sig) if sig else None
+        for sig in (_file_signature(path), _file_signature(_journal_path(path)))
+    ]
+
+
+def _coupling_sources(item: dict, field: str) -> list[str]:
+    """Finding IDs an item references through field (str or list)."""
+    value = item.get(field) if isinstance(item, dict) else None
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str) and v]
+    return []
+
+
+def _awaiting_coupling(item: dict, field: str) -> bool:
+    """An IOC the coupling rule may still decide: undecided, not manually
+    reviewed, with source findings."""
+    return (
+        field == _PENDING_FIELD
+        and item.get("status") not in ("APPROVED", "REJECTED")
+        and not item.get("manually_reviewed")
+        and bool(_coupling_sources(item, field))
+    )
+
+
+def _link_item(
+    entry: dict, item_id: str, pos: int, sources: list[str], pending: bool = False
+) -> None:
+    """Point entry at (item_id, pos) for sources, replacing older links."""
+    for fid in entry["items"].pop(item_id, []):
+        refs = entry["findings"].get(fid, {})
+        refs.pop(item_id, None)
+        if not refs:
+            entry["findings"].pop(fid, None)
+    entry["pending"].pop(item_id, None)
+    if sources:
+        entry["items"][item_id] = sources
+        for fid in sources:
+            entry["findings"].setdefault(fid, {})[item_id] = pos
+    if pending:
+        entry["pending"][item_id] = pos
+
+
+def _coupling_entry(items: list[dict], field: str, signature: list) -> dict:
+    entry = {
+        "sig": signature,
+        "count": len(items),
+        "items": {},
+        "findings": {},
+        "pending": {},
+    }
+    for pos, item in enumerate(items):
+        sources = _coupling_sources(item, field)
+        if sources and isinstance(item.get("id"), str):
+            _link_item(entry, item["id"], pos, sources, _awaiting_coupling(item, field))
+    return entry
+
+
+def _read_coupling_index(case_dir: Path) -> dict | None:
+    try:
+        data = json.loads((case_dir / COUPLING_INDEX).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if isinstance(data, dict) and data.get("v") == _COUPLING_VERSION:
+        return data
+    return None
+
+
+def _write_coupling_index(case_dir: Path, index: dict) -> None:
+    path = case_dir / COUPLING_INDEX
+    tmp = path.with_name(COUPLING_INDEX + ".tmp")
+    try:
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the next lookup rebuilds it
+
+
+@contextmanager
+def _coupling_lock(case_dir: Path):
+    """Hold the case's coupling index lock; yields False if it cannot be
+    taken (the index is then left to the next lookup)."""
+    fd = None
+    if fcntl is not None:
+        try:
+            fd = os.open(case_dir / COUPLING_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except OSError:
+            if fd is not None:
+                os.close(fd)
+                fd = None
+    try:
+        yield fd is not None
+    finally:
+        if fd is not None:
+            os.close(fd)  # releases the lock
+
+
+def _update_coupling_index(
+    case_dir: Path,
+    filename: str,
+    items: list[dict],
+    before: list,
+    changed: list[int] | None,
+) -> None:
+    """Bring an existing index in line with items just saved to filename.
+
+    Called with the coupling lock held. An entry that described the store
+    before the save is relinked at the changed positions only; otherwise
+    the entry is rebuilt from items (already in memory, nothing re-read).
+    """
+    index = _read_coupling_index(case_dir)
+    if index is None:
+        return  # built on first lookup
+    field = _COUPLING_FIELDS[filename]
+    after = _store_signature(case_dir / filename)
+    entry = index.get(filename)
+    if changed is not None and entry and entry.get("sig") == before:
+        for pos in changed:
+            item = items[pos]
+            if isinstance(item, dict) and isinstance(item.get("id"), str):
+                _link_item(
+                    entry,
+                    item["id"],
+                    pos,
+                    _coupling_sources(item, field),
+                    _awaiting_coupling(item, field),
+                )
+        entry["sig"] = after
+        entry["count"] = len(items)
+    else:
+        index[filename] = _coupling_entry(items, field, after)
+    _write_coupling_index(case_dir, index)
+
+
+def _coupled(item, field: str, wanted: set[str]) -> bool:
+    return isinstance(item, dict) and (
+        not wanted.isdisjoint(_coupling_sources(item, field))
+        or _awaiting_coupling(item, field)
+    )
+
+
+def _linked_items(
+    entry: dict | None, items: list[dict], field: str, wanted: set[str]
+) -> list[dict]:
+    """Items referencing any wanted finding, plus IOCs awaiting coupling,
+    in list order."""
+    if entry is not None and entry.get("count") == len(items):
+        positions: dict[int, str] = {}
+        for fid in wanted:
+            for item_id, pos in entry["findings"].get(fid, {}).items():
+                positions[pos] = item_id
+        for item_id, pos in entry["pending"].items():
+            positions[pos] = item_id
+        found = []
+        for pos in sorted(positions):
+            item = items[pos] if pos < len(items) else None
+            if (
+                not isinstance(item, dict)
+                or item.get("id") != positions[pos]
+                or not _coupled(item, field, wanted)
+            ):
+                break  # items changed since they were indexed
+            found.append(item)
+        else:
+            return found
+    return [item for item in items if _coupled(item, field, wanted)]
+
+
+def coupled_items(
+    case_dir: Path,
+    finding_ids,
+    timeline: list[dict],
+    iocs: list[dict],
+) -> tuple[list[dict], list[dict]]:
+    """Timeline events and IOCs that reference any of finding_ids.
+
+    The IOCs also include every IOC still awaiting coupling, whatever its
+    sources, so callers apply the coupling rule as a scan of all IOCs would.
+    timeline and iocs are the caller's loaded lists; the returned items are
+    elements of those lists (in list order), so updates apply in place.
+    """
+    wanted = set(finding_ids)
+    with _coupling_lock(case_dir):
+        index = _read_coupling_index(case_dir) or {"v": _COUPLING_VERSION}
+        dirty = False
+        result = []
+        for filename, items in (("timeline.json", timeline), ("iocs.json", iocs)):
+            field = _COUPLING_FIELDS[filename]
+            path = case_dir / filename
+            signature = _store_signature(path)
+            entry = index.get(filename)
+            if not entry or entry.get("sig") != signature:
+                try:
+                    stored = _read_store(path)[0] if any(signature) else []
+                except json.JSONDecodeError:
+                    entry = None
+                else:
+                    entry = index[filename] = _coupling_entry(stored, field, signature)
+                    dirty = True
+            result.append(_linked_items(entry, items, field, wanted))
+        if dirty:
+            _write_coupling_index(case_dir, index)
+    return result[0], result[1]
+
+
+# --- Case catalog ---
+#
+# <cases_dir>/.case-catalog.json summarizes every case under a cases root:
+# CASE.yaml metadata, per-status counts of findings, timeline events and
+# TODOs, and the last-modified time. Each entry records the stat
+# signatures of the files it was built from and is revalidated lazily, so
+# listing a cases root re-reads only the cases whose files changed. Store
+# saves and CASE.yaml edits never write the catalog; they move a signature,
+# and the next listing re-catalogs the case. Like the coupling index it is
+# a cache: not fsynced, skipped by backups, and safe to delete.
+
+CASE_CATALOG = ".case-catalog.json"
+_CATALOG_VERSION = 1
+_CATALOG_STORES = {
+    "findings.json": "findings",
+    "timeline.json": "timeline",
+    "todos.json": "todos",
+}
+
+
+def _catalog_signature(case_dir: Path) -> dict:
+    meta_sig = _file_signature(case_dir / "CASE.yaml")
+    signature = {"CASE.yaml": list(meta_sig) if meta_sig else None}
+    for filename in _CATALOG_STORES:
+        signature[filename] = _store_signature(case_dir / filename)
+    return signature
+
+
+def _signature_mtime(signature: dict) -> str:
+    """Latest mtime across a catalog signature, as an ISO timestamp."""
+    sigs = [signature.get("CASE.yaml")]
+    for filename in _CATALOG_STORES:
+        sigs.extend(signature.get(filename) or [])
+    mtimes = [sig[0] for sig in sigs if sig]
+    if not mtimes:
+        return ""
+    return datetime.fromtimestamp(max(mtimes) / 1e9, tz=timezone.utc).isoformat()
+
+
+def _status_counts(items: list) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for item in items:
+        if isinstance(item, dict):
+            status = str(item.get("status", "unknown"))
+            counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def _catalog_entry(case_dir: Path, signature: dict) -> dict:
+    meta = load_case_meta(case_dir)
+    return {
+        "sig": signature,
+        "case_id": str(meta.get("case_id") or case_dir.name),
+        "name": meta.get("name", ""),
+        "status": meta.get("status", "unknown"),
+        "examiner": meta.get("examiner", ""),
+        "created": str(meta.get("created", "")),
+        "modified": _signature_mtime(signature),
+        "counts": {
+            key: _status_counts(_load_store(case_dir, filename))
+            for filename, key in _CATALOG_STORES.items()
+        },
+    }
+
+
+def _read_case_catalog(cases_dir: Path) -> dict | None:
+    try:
+        data = json.loads((cases_dir / CASE_CATALOG).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        isinstance(data, dict)
+        and data.get("v") == _CATALOG_VERSION
+        and isinstance(data.get("cases"), dict)
+    ):
+        return data
+    return None
+
+
+def _write_case_catalog(cases_dir: Path, catalog: dict) -> None:
+    path = cases_dir / CASE_CATALOG
+    tmp = path.with_name(CASE_CATALOG + ".tmp")
+    try:
+        tmp.write_text(json.dumps(catalog), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # rebuilt on the next listing
+
+
+def load_case_catalog(cases_dir: Path) -> dict[str, dict]:
+    """Catalog entries for every case under cases_dir, by directory name.
+
+    Entries whose files changed since they were cataloged are rebuilt, new
+    cases are added and removed ones dropped; the catalog file is rewritten
+    only when something changed.
+    """
+    cases_dir = Path(cases_dir)
+    catalog = _read_case_catalog(cases_dir) or {"v": _CATALOG_VERSION, "cases": {}}
+    known = catalog["cases"]
+    entries: dict[str, dict] = {}
+    dirty = False
+    with os.scandir(cases_dir) as it:
+        names = sorted(e.name for e in it if e.is_dir())
+    for name in names:
+        case_dir = cases_dir / name
+        signature = _catalog_signature(case_dir)
+        if signature["CASE.yaml"] is None:
+            continue
+        entry = known.get(name)
+        if not isinstance(entry, dict) or entry.get("sig") != signature:
+            entry = _catalog_entry(case_dir, signature)
+            dirty = True
+        entries[name] = entry
+    if dirty or len(entries) != len(known):
+        catalog["cases"] = entries
+        _write_case_catalog(cases_dir, catalog)
+    return entries
+
+
+def case_catalog_entry(case_dir: Path) -> dict:
+    """Catalog entry for one case, from its cases root's catalog if current."""
+    case_dir = Path(case_dir)
+    signature = _catalog_signature(case_dir)
+    catalog = _read_case_catalog(case_dir.parent)
+    entry = catalog["cases"].get(case_dir.name) if catalog else None
+    if isinstance(entry, dict) and entry.get("sig") == signature:
+        return entry
+    entry = _catalog_entry(case_dir, signature)
+    if catalog is not None:
+        catalog["cases"][case_dir.name] = entry
+        _write_case_catalog(case_dir.parent, catalog)
+    return entry
+
+
 # --- Item lookup ---
 
 
+class CaseModel:
+    """Case stores held in memory with ID -> item and ID -> position maps.
+
+    Wraps the caller's lists without copying them, so items fetched or
+    put through the model are the ones later saved. Each lookup is O(1);
+    multi-ID commands stay linear in the number of IDs.
+
+    Args:
+        stores: Store filename -> loaded items, in lookup order (an ID
+            present in two stores resolves to the first).
+        id_field: Item key holding the ID.
+    """
+
+    def __init__(self, stores: dict[str, list[dict]], id_field: str = "id") -> None:
+        self.stores = stores
+        self.id_field = id_field
+        self._positions: dict[str, tuple[str, int]] = {}
+        for filename, items in stores.items():
+            for pos, item in enumerate(items):
+                item_id = item.get(id_field) if isinstance(item, dict) else None
+                if isinstance(item_id, str) and item_id:
+                    self._positions.setdefault(item_id, (filename, pos))
+
+    @classmethod
+    def load(cls, case_dir: Path, iocs: bool = True) -> CaseModel:
+        """Load findings, timeline and (optionally) IOCs from case_dir."""
+        stores = {
+            "findings.json": load_findings(case_dir),
+            "timeline.json": load_timeline(case_dir),
+        }
+        if iocs:
+            stores["iocs.json"] = load_iocs(case_dir)
+        return cls(stores)
+
+    @property
+    def findings(self) -> list[dict]:
+        return self.stores.get("findings.json", [])
+
+    @property
+    def timeline(self) -> list[dict]:
+        return self.stores.get("timeline.json", [])
+
+    @property
+    def iocs(self) -> list[dict]:
+        return self.stores.get("iocs.json", [])
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    def position(self, item_id: str) -> tuple[str, int] | None:
+        """(store filename, list index) of an item, or None."""
+        return self._positions.get(item_id)
+
+    def get(self, item_id: str) -> dict | None:
+        pos = self._positions.get(item_id)
+        return self.stores[pos[0]][pos[1]] if pos else None
+
+    def find_draft(self, item_id: str) -> dict | None:
+        """The item if it exists and is DRAFT (as find_draft_item)."""
+        item = self.get(item_id)
+        return item if item is not None and item.get("status") == "DRAFT" else None
+
+    def put(self, filename: str, item: dict) -> int:
+        """Replace the item with the same ID in filename, or append it.
+
+        Returns the item's list index.
+        """
+        items = self.stores.setdefault(filename, [])
+        item_id = item[self.id_field]
+        pos = self._positions.get(item_id)
+        if pos is not None and pos[0] == filename:
+            items[pos[1]] = item
+            return pos[1]
+        items.append(item)
+        self._positions.setdefault(item_id, (filename, len(items) - 1))
+        return len(items) - 1
+
+
 def find_draft_item(
     item_id: str, findings: list[dict], timeline: list[dict]
 ) -> dict | None:
@@ -372,15 +1461,24 @@ HASH_EXCLUDE_KEYS = {
 }
 
 
+def canonicalize(item: dict) -> tuple[str, str]:
+    """Canonical JSON of an item's substantive fields, and its SHA-256.
+
+    One serialization serves both the content hash and the HMAC text;
+    callers that need both compute it once and use each half.
+    """
+    hashable = {k: v for k, v in item.items() if k not in HASH_EXCLUDE_KEYS}
+    text = json.dumps(hashable, sort_keys=True, default=str)
+    return text, hashlib.sha256(text.encode()).hexdigest()
+
+
 def compute_content_hash(item: dict) -> str:
     """SHA-256 of canonical JSON excluding volatile fields.
 
     Volatile fields (status, approval metadata, content_hash itself, modified_at)
     are excluded so the hash covers only the substantive content.
     """
-    hashable = {k: v for k, v in item.items() if k not in HASH_EXCLUDE_KEYS}
-    canonical = json.dumps(hashable, sort_keys=True, default=str)
-    return hashlib.sha256(canonical.encode()).hexdigest()
+    return canonicalize(item)[1]
 
 
 def hmac_text(item: dict) -> str:
@@ -390,14 +1488,15 @@ def hmac_text(item: dict) -> str:
     metadata. Same exclusion set as compute_content_hash(). Used for
     both findings and timeline events (same formula, no type branching).
     """
-    hashable = {k: v for k, v in item.items() if k not in HASH_EXCLUDE_KEYS}
-    return json.dumps(hashable, sort_keys=True, default=str)
+    return canonicalize(item)[0]
 
 
 # --- Integrity verification ---
 
 
-def verify_approval_integrity(case_dir: Path) -> list[dict]:
+def verify_approval_integrity(
+    case_dir: Path, texts: dict[str, str] | None = None
+) -> list[dict]:
     """Cross-reference findings against approvals.
 
     Returns findings with an added 'verification' field:
@@ -408,8 +1507,11 @@ def verify_approval_integrity(case_dir: Path) -> list[dict]:
 
     Cross-file check: if the approval record also has a content_hash, both
     findings.json and approvals.jsonl hashes must match the recomputed hash.
+
+    If texts is given, the canonical text of each finding hashed here is
+    stored in it by ID, for callers that also check HMAC snapshots.
     """
-    findings = load_findings(case_dir)
+    findings = _load_store(case_dir, "findings.json")
     approvals = load_approval_log(case_dir)
 
     # Build lookup: item_id -> last approval record
@@ -427,7 +1529,9 @@ def verify_approval_integrity(case_dir: Path) -> list[dict]:
             result["verification"] = "draft"
         elif record:
             if record["action"] == status:
-                recomputed = compute_content_hash(f)
+                text, recomputed = canonicalize(f)
+                if texts is not None:
+                    texts[fid] = text
                 finding_hash = f.get("content_hash")
                 approval_hash = record.get("content_hash")
                 # Check findings.json content hash
@@ -490,12 +1594,8 @@ def export_bundle(case_dir: Path, since: str = "") -> dict:
     timeline = load_timeline(case_dir)
 
     if since:
-        findings = [
-            f for f in findings if f.get("modified_at", f.get("staged", "")) >= since
-        ]
-        timeline = [
-            t for t in timeline if t.get("modified_at", t.get("staged", "")) >= since
-        ]
+        findings = list(_changed_since(findings, since))
+        timeline = list(_changed_since(timeline, since))
 
     return {
         "case_id": meta.get("case_id", ""),
@@ -506,6 +1606,138 @@ def export_bundle(case_dir: Path, since: str = "") -> dict:
     }
 
 
+def _item_ts(item: dict) -> str:
+    return item.get("modified_at", item.get("staged", "")) or ""
+
+
+def _changed_since(items: list[dict], since: str):
+    """Items modified at or after since (ISO timestamps compared as times)."""
+    cutoff = _parse_ts(since)
+    return (item for item in items if _parse_ts(_item_ts(item)) >= cutoff)
+
+
+def write_export_bundle(
+    case_dir: Path, out: TextIO, since: str = "", compact: bool = False
+) -> dict:
+    """Stream an export bundle (export_bundle's format) to out.
+
+    Items are serialized one at a time from the cached store parse, so no
+    bundle dict or whole-document string is built. compact=True drops the
+    indentation and separator whitespace.
+
+    Returns:
+        Summary: case_id, examiner, exported_at, findings and timeline
+        counts, and latest (the newest modified_at written, "" if none).
+    """
+    meta = load_case_meta(case_dir)
+    summary = {
+        "case_id": meta.get("case_id", ""),
+        "examiner": get_examiner(case_dir),
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+    }
+    if compact:
+        dumps = partial(json.dumps, separators=(",", ":"), default=str)
+        newline, pad = "", ""
+    else:
+        dumps = partial(json.dumps, indent=2, default=str)
+        newline, pad = "\n", "  "
+
+    out.write("{")
+    for key, value in summary.items():
+        out.write(f"{newline}{pad}{json.dumps(key)}:{pad and ' '}{dumps(value)},")
+    latest = ""
+    latest_ts = _parse_ts("")
+    for key, filename in (("findings", "findings.json"), ("timeline", "timeline.json")):
+        items = _load_store(case_dir, filename)
+        if since:
+            items = _changed_since(items, since)
+        out.write(f"{newline}{pad}{json.dumps(key)}:{pad and ' '}[")
+        count = 0
+        for item in items:
+            text = dumps(item)
+            if not compact:
+                text = text.replace("\n", "\n    ")
+            out.write(f"{',' if count else ''}{newline}{pad * 2}{text}")
+            count += 1
+            ts = _parse_ts(_item_ts(item))
+            if ts > latest_ts:
+                latest, latest_ts = _item_ts(item), ts
+        out.write(f"{newline}{pad}]" if count else "]")
+        out.write("," if key == "findings" else "")
+        summary[key] = count
+    out.write(f"{newline}}}{newline}")
+    summary["latest"] = latest
+    return summary
+
+
+# --- Export cursors ---
+#
+# .export-cursors.json remembers, per peer examiner, the newest modified_at
+# already exported to them. `vhir export --peer bob` exports from that
+# cursor and advances it once the bundle is safely written, so recurring
+# syncs only carry items changed since the last one. Items stamped exactly
+# at the cursor are exported again; merge skips them as not newer.
+
+EXPORT_CURSORS = ".export-cursors.json"
+
+
+def load_export_cursors(case_dir: Path) -> dict[str, dict]:
+    """Per-peer export cursors ({peer: {"since": ts, "exported_at": ts}})."""
+    try:
+        data = json.loads((case_dir / EXPORT_CURSORS).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"WARNING: Unreadable {EXPORT_CURSORS}: {e}", file=sys.stderr)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def get_export_cursor(case_dir: Path, peer: str) -> str:
+    """Timestamp the next export to peer starts from ("" = everything)."""
+    _validate_examiner(peer)
+    entry = load_export_cursors(case_dir).get(peer)
+    return entry.get("since", "") if isinstance(entry, dict) else ""
+
+
+def save_export_cursor(case_dir: Path, peer: str, since: str, exported_at: str) -> None:
+    """Advance peer's cursor to since (never moves it backwards)."""
+    _validate_examiner(peer)
+    cursors = load_export_cursors(case_dir)
+    entry = cursors.get(peer)
+    current = entry.get("since", "") if isinstance(entry, dict) else ""
+    if current and _parse_ts(current) > _parse_ts(since):
+        since = current
+    cursors[peer] = {"since": since, "exported_at": exported_at}
+    _atomic_write(case_dir / EXPORT_CURSORS, json.dumps(cursors, indent=2))
+
+
+# --- Derived files ---
+#
+# Files in a case directory that hold no case data of their own: caches
+# rebuilt on demand, this examiner's sync cursors, and the fixed-name
+# temporaries of atomic writes. Paths are relative to the case directory
+# (POSIX separators); a directory entry covers everything under it.
+# Backups leave them out. New caches belong in this list.
+
+IOC_INDEX = ".ioc-index.json"
+EVIDENCE_VERIFY_CACHE = ".evidence-verify.json"
+
+CASE_CACHE_PATHS = frozenset(
+    {
+        COUPLING_INDEX,
+        COUPLING_INDEX + ".tmp",
+        COUPLING_LOCK,
+        IOC_INDEX,
+        IOC_INDEX + ".tmp",
+        EXPORT_CURSORS,
+        EVIDENCE_VERIFY_CACHE,
+        TXN_FILE + ".tmp",
+        "audit/.index",
+    }
+)
+
+
 def import_bundle(case_dir: Path, bundle: dict | list) -> dict:
     """Merge incoming bundle into local findings + timeline.
 
@@ -539,79 +1771,248 @@ def import_bundle(case_dir: Path, bundle: dict | list) -> dict:
     }
 
 
+_BUNDLE_STORES = {"findings": "findings.json", "timeline": "timeline.json"}
+
+
+def import_bundle_stream(case_dir: Path, f: TextIO) -> dict:
+    """import_bundle() for a bundle read incrementally from a text stream.
+
+    Items are parsed and merged one at a time, so memory is bounded by the
+    local stores rather than the bundle. Nothing is written until the
+    whole bundle has parsed; each store is then written once.
+
+    Raises:
+        json.JSONDecodeError: If the bundle is not valid JSON.
+    """
+    merges: dict[str, _StoreMerge] = {}
+    try:
+        for key, value in iter_bundle(f):
+            filename = _BUNDLE_STORES.get(key)
+            if filename is None:
+                continue
+            if key not in merges:
+                merges[key] = _StoreMerge(case_dir, filename, "id")
+            merges[key].add(value)
+    except json.JSONDecodeError:
+        raise
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    for merge in merges.values():
+        merge.save()
+    empty = {"added": 0, "updated": 0, "skipped": 0}
+    return {
+        "status": "merged",
+        "findings": merges["findings"].result if "findings" in merges else empty,
+        "timeline": merges["timeline"].result if "timeline" in merges else empty,
+    }
+
+
+def iter_bundle(f: TextIO, chunk_size: int = 1 << 20):
+    """Yield the top-level (key, value) pairs of a JSON bundle from a stream.
+
+    The findings and timeline arrays are yielded as lazy iterators over
+    their items, which must be consumed before the next pair is read; other
+    values are decoded whole. A bare top-level array (forensic-mcp export)
+    yields ("findings", items).
+
+    Raises:
+        json.JSONDecodeError: On malformed JSON.
+        ValueError: If the top level is not an object or array.
+    """
+    reader = _JsonStreamReader(f, chunk_size)
+    first = reader.peek()
+    if first == "[":
+        items = reader.array_items()
+        yield "findings", items
+        for _ in items:
+            pass  # drain what the consumer left
+    elif first == "{":
+        reader.take("{")
+        if reader.peek() == "}":
+            reader.take("}")
+        else:
+            while True:
+                key = reader.value()
+                if not isinstance(key, str):
+                    raise reader.error("Expecting property name")
+                reader.take(":")
+                if key in _BUNDLE_STORES and reader.peek() == "[":
+                    items = reader.array_items()
+                    yield key, items
+                    for _ in items:
+                        pass  # drain what the consumer left
+                else:
+                    yield key, reader.value()
+                if reader.peek() == ",":
+                    reader.take(",")
+                    continue
+                reader.take("}")
+                break
+    else:
+        raise ValueError("Bundle must be a JSON object or array")
+    if reader.peek():
+        raise reader.error("Extra data")
+
+
+class _JsonStreamReader:
+    """Incremental JSON tokenizer over a text stream (raw_decode per value)."""
+
+    _WS = " \t\n\r"
+
+    def __init__(self, f: TextIO, chunk_size: int) -> None:
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # stream position of buf[0], for error messages
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        data = self.f.read(size)
+        if not data:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buf = self.buf[self.pos :] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self._WS:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill(self.chunk_size):
+                return self.buf[self.pos : self.pos + 1]
+
+    def take(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self.pos += 1
+
+    def error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Possibly cut off at the buffer end: read more and retry
+                if self.eof or not self._fill(max(self.chunk_size, len(self.buf))):
+                    raise
+                continue
+            # A number ending the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill(self.chunk_size):
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self):
+        """Iterate the items of the array starting at the next character."""
+        self.take("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.take("]")
+            return
+
+
 def _parse_ts(ts: str) -> datetime:
     """Parse ISO timestamp, normalizing Z to +00:00."""
     if ts.endswith("Z"):
         ts = ts[:-1] + "+00:00"
     try:
-        return datetime.fromisoformat(ts)
+        parsed = datetime.fromisoformat(ts)
     except (ValueError, TypeError):
         return datetime.min.replace(tzinfo=timezone.utc)
+    # Naive timestamps are UTC (comparing naive with aware would raise)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
-def _merge_items(
-    case_dir: Path, filename: str, incoming: list[dict], id_field: str
-) -> dict:
-    """Merge incoming items into a local JSON file using last-write-wins."""
-    local_file = case_dir / filename
-    local: list[dict] = []
-    if local_file.exists():
+# Protected fields that cannot be smuggled via merge
+_MERGE_PROTECTED_FIELDS = {
+    "id",
+    "status",
+    "staged",
+    "modified_at",
+    "created_by",
+    "examiner",
+    "provenance",
+}
+
+
+class _StoreMerge:
+    """Last-write-wins merge of incoming items into one local store.
+
+    The local store is loaded once and indexed by ID (CaseModel); items
+    are applied one at a time as they arrive, and save() writes the
+    result in a single store write.
+    """
+
+    def __init__(self, case_dir: Path, filename: str, id_field: str) -> None:
+        self.case_dir = case_dir
+        self.filename = filename
+        self.id_field = id_field
+        local: list[dict] = []
         try:
-            local = json.loads(local_file.read_text())
+            local = _read_store(case_dir / filename)[0]
         except json.JSONDecodeError:
             pass
-
-    local_by_id = {item[id_field]: item for item in local if id_field in item}
-    added = 0
-    updated = 0
-    skipped = 0
-    protected = 0
-
-    # Protected fields that cannot be smuggled via merge
-    _MERGE_PROTECTED_FIELDS = {
-        "id",
-        "status",
-        "staged",
-        "modified_at",
-        "created_by",
-        "examiner",
-        "provenance",
-    }
-
-    for item in incoming:
-        item_id = item.get(id_field, "")
+        self.local = local
+        self.model = CaseModel({filename: local}, id_field)
+        self.changed: list[int] = []
+        self.result = {"added": 0, "updated": 0, "skipped": 0, "protected": 0}
+
+    def add(self, incoming) -> None:
+        for item in incoming:
+            self._add_one(item)
+
+    def _add_one(self, item) -> None:
+        id_field = self.id_field
+        item_id = item.get(id_field, "") if isinstance(item, dict) else ""
         if not item_id:
-            skipped += 1
-            continue
+            self.result["skipped"] += 1
+            return
 
         # Strip approval/integrity fields — merged items always enter as DRAFT
         cleaned = {k: v for k, v in item.items() if k not in _MERGE_PROTECTED_FIELDS}
         cleaned["status"] = "DRAFT"
         cleaned[id_field] = item_id  # Restore id after stripping
 
-        if item_id not in local_by_id:
-            local.append(cleaned)
-            local_by_id[item_id] = cleaned
-            added += 1
+        existing = self.model.get(item_id)
+        if existing is None:
+            self.changed.append(self.model.put(self.filename, cleaned))
+            self.result["added"] += 1
+            return
+        if existing.get("status") == "APPROVED":
+            self.result["protected"] += 1
+            return
+        inc_ts = item.get("modified_at", item.get("staged", ""))
+        loc_ts = existing.get("modified_at", existing.get("staged", ""))
+        if _parse_ts(inc_ts) > _parse_ts(loc_ts):
+            self.changed.append(self.model.put(self.filename, cleaned))
+            self.result["updated"] += 1
         else:
-            existing = local_by_id[item_id]
-            if existing.get("status") == "APPROVED":
-                protected += 1
-                continue
-            inc_ts = item.get("modified_at", item.get("staged", ""))
-            loc_ts = existing.get("modified_at", existing.get("staged", ""))
-            if _parse_ts(inc_ts) > _parse_ts(loc_ts):
-                idx = next(i for i, x in enumerate(local) if x.get(id_field) == item_id)
-                local[idx] = cleaned
-                local_by_id[item_id] = cleaned
-                updated += 1
-            else:
-                skipped += 1
+            self.result["skipped"] += 1
 
-    _protected_write(local_file, json.dumps(local, indent=2, default=str))
-    return {
-        "added": added,
-        "updated": updated,
-        "skipped": skipped,
-        "protected": protected,
-    }
+    def save(self) -> None:
+        _save_store(self.case_dir, self.filename, self.local, self.changed)
+
+
+def _merge_items(
+    case_dir: Path, filename: str, incoming: list[dict], id_field: str
+) -> dict:
+    """Merge incoming items into a local JSON file using last-write-wins."""
+    merge = _StoreMerge(case_dir, filename, id_field)
+    merge.add(incoming)
+    merge.save()
+    return merge.result
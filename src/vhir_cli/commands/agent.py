@@ -0,0 +1,113 @@
+"""Key agent management: vhir agent start|stop|status."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+from vhir_cli.approval_auth import (
+    _check_lockout,
+    _clear_failures,
+    _record_failure,
+    get_analyst_salt,
+    getpass_prompt,
+    has_password,
+    verify_password,
+)
+from vhir_cli.key_agent import (
+    DEFAULT_IDLE_TIMEOUT,
+    KeyAgent,
+    agent_socket,
+    agent_status,
+    clear_agent,
+    record_agent,
+    serve,
+    start_daemon,
+    stop_agent,
+)
+
+
+def cmd_agent(args, identity: dict) -> None:
+    """Start, stop or query the local key agent."""
+    action = getattr(args, "agent_action", None)
+    if action == "start":
+        _agent_start(args, identity)
+    elif action == "stop":
+        stopped = stop_agent()
+        clear_agent()
+        if stopped:
+            print("Key agent stopped; key wiped from memory.")
+        else:
+            print("No key agent running.")
+    elif action == "status":
+        status = agent_status()
+        if status is None:
+            print("No key agent running.")
+        else:
+            print(
+                f"Key agent running (pid {status.get('pid')}) for examiner "
+                f"{status.get('examiner')} at {agent_socket()}"
+            )
+    else:
+        print("Usage: vhir agent {start|stop|status}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _agent_start(args, identity: dict) -> None:
+    config_path = Path.home() / ".vhir" / "config.yaml"
+    examiner = identity["examiner"]
+    if agent_status() is not None:
+        print("Key agent already running (vhir agent stop to replace it).")
+        return
+    if not has_password(config_path, examiner):
+        print(
+            "No approval password configured. Set one with:\n  vhir config --setup-password\n",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    timeout = getattr(args, "timeout", None) or DEFAULT_IDLE_TIMEOUT
+    if timeout <= 0:
+        print("--timeout must be positive", file=sys.stderr)
+        sys.exit(1)
+
+    _check_lockout(examiner)
+    try:
+        password = getpass_prompt("Enter password to unlock key agent: ")
+    except RuntimeError as e:
+        print(f"Cannot read password: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not verify_password(config_path, examiner, password):
+        _record_failure(examiner)
+        print("Incorrect password.", file=sys.stderr)
+        sys.exit(1)
+    _clear_failures(examiner)
+
+    from vhir_cli.verification import derive_hmac_key
+
+    salt = get_analyst_salt(config_path, examiner)
+    agent = KeyAgent(examiner, salt, derive_hmac_key(password, salt), password)
+    del password
+
+    # Clients only talk to the process recorded here, after the password
+    # was verified locally above.
+    if getattr(args, "foreground", False):
+        record_agent(os.getpid(), examiner)
+        print(f"Key agent listening on {agent_socket()} (Ctrl-C to stop)")
+        try:
+            serve(agent, agent_socket(), timeout)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            clear_agent()
+        return
+    pid = start_daemon(agent, timeout)
+    record_agent(pid, examiner)
+    if agent_status() is None:
+        clear_agent()
+        print("Key agent failed to start.", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"Key agent started (pid {pid}); exits after {timeout:.0f}s idle. "
+        "Approvals still ask for your password."
+    )
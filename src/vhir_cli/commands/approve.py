@@ -27,18 +27,19 @@ import yaml
 
 from vhir_cli.approval_auth import require_confirmation
 from vhir_cli.case_io import (
+    CaseModel,
+    CaseTransaction,
+    approval_log_entry,
+    canonicalize,
     check_case_file_integrity,
-    compute_content_hash,
-    find_draft_item,
+    commit_transaction,
+    coupled_items,
     get_case_dir,
     hmac_text,
     load_findings,
+    load_iocs,
     load_timeline,
     load_todos,
-    save_findings,
-    save_timeline,
-    save_todos,
-    write_approval_log,
 )
 
 
@@ -113,10 +114,11 @@ def _approve_specific(
     check_case_file_integrity(case_dir, "timeline.json")
     findings = load_findings(case_dir)
     timeline = load_timeline(case_dir)
+    model = CaseModel({"findings.json": findings, "timeline.json": timeline})
     to_approve = []
 
     for item_id in ids:
-        item = find_draft_item(item_id, findings, timeline)
+        item = model.find_draft(item_id)
         if item is None:
             print(f"  {item_id}: not found or not DRAFT", file=sys.stderr)
             continue
@@ -139,10 +141,12 @@ def _approve_specific(
     print(f"\n{len(to_approve)} item(s) to approve.")
     mode, password = require_confirmation(config_path, identity["examiner"])
 
+    iocs = load_iocs(case_dir)
     now = datetime.now(timezone.utc).isoformat()
+    texts: dict[str, str] = {}  # canonical text per item, reused for the HMAC
     for item in to_approve:
         staging_hash = item.get("content_hash", "")
-        new_hash = compute_content_hash(item)
+        texts[item["id"]], new_hash = canonicalize(item)
         if staging_hash and staging_hash != new_hash:
             print(
                 f"  NOTE: Finding {item['id']} was modified since staging "
@@ -159,23 +163,19 @@ def _approve_specific(
         item["id"] for item in to_approve if item.get("status") == "APPROVED"
     }
     coupled_events = []
-    for tl_event in timeline:
-        auto_from = tl_event.get("auto_created_from", "")
-        if not auto_from or auto_from not in approved_ids:
-            continue
+    linked_tl, linked_iocs = coupled_items(case_dir, approved_ids, timeline, iocs)
+    for tl_event in linked_tl:
         if tl_event.get("examiner_modifications"):
             continue
         tl_event["status"] = "APPROVED"
         tl_event["approved_at"] = now
         tl_event["approved_by"] = identity["examiner"]
         tl_event["modified_at"] = now
-        new_hash = compute_content_hash(tl_event)
+        texts[tl_event["id"]], new_hash = canonicalize(tl_event)
         tl_event["content_hash"] = new_hash
         coupled_events.append(tl_event)
 
     # IOC approval coupling
-    from vhir_cli.case_io import load_iocs, save_iocs
-
     # Build lookup for all findings (not just ones being approved)
     all_findings = load_findings(case_dir)
     finding_status = {fi["id"]: fi.get("status", "DRAFT") for fi in all_findings}
@@ -183,14 +183,11 @@ def _approve_specific(
     for item in to_approve:
         finding_status[item["id"]] = item.get("status", "DRAFT")
 
-    iocs = load_iocs(case_dir)
     iocs_modified = False
-    for ioc in iocs:
+    for ioc in linked_iocs:
         if ioc.get("manually_reviewed"):
             continue
         source_ids = ioc.get("source_findings", [])
-        if not source_ids:
-            continue
         # ALL source findings must be APPROVED
         all_approved = all(
             finding_status.get(sid, "DRAFT") == "APPROVED" for sid in source_ids
@@ -203,37 +200,36 @@ def _approve_specific(
             iocs_modified = True
             coupled_events.append(ioc)
 
-    # Step 1: Persist primary data FIRST
-    try:
-        save_findings(case_dir, findings)
-        save_timeline(case_dir, timeline)
-        if iocs_modified:
-            save_iocs(case_dir, iocs)
-    except OSError as e:
-        print(f"CRITICAL: Failed to save case data: {e}", file=sys.stderr)
-        print(
-            "No changes were committed. Retry after fixing the issue.", file=sys.stderr
-        )
-        sys.exit(1)
-
-    # Step 2: Audit log (best-effort, warn on failure)
-    log_failures = []
+    # Case data, approval log and HMAC ledger commit as one transaction
+    txn = CaseTransaction(case_dir)
+    txn.save_store("findings.json", findings)
+    txn.save_store("timeline.json", timeline)
+    if iocs_modified:
+        txn.save_store("iocs.json", iocs)
     all_approved = list(to_approve) + coupled_events
-    for item in all_approved:
-        if not write_approval_log(
-            case_dir,
-            item["id"],
-            "APPROVED",
-            identity,
-            mode=mode,
-            content_hash=item["content_hash"],
-        ):
-            log_failures.append(item["id"])
-
-    # Step 3: HMAC ledger (warn on failure)
+    txn.append_approval_logs(
+        [
+            approval_log_entry(
+                item["id"],
+                "APPROVED",
+                identity,
+                mode=mode,
+                content_hash=item["content_hash"],
+            )
+            for item in all_approved
+        ]
+    )
     hmac_failures = _write_verification_entries(
-        case_dir, all_approved, identity, config_path, password, now
+        case_dir,
+        all_approved,
+        identity,
+        config_path,
+        password,
+        now,
+        txn=txn,
+        texts=texts,
     )
+    commit_transaction(txn)
 
     result_ids = [item["id"] for item in to_approve]
     print(f"Approved: {', '.join(result_ids)}")
@@ -244,8 +240,6 @@ def _approve_specific(
             print(f"  Auto-approved timeline events: {', '.join(coupled_tl)}")
         if coupled_ioc:
             print(f"  Auto-approved IOCs: {', '.join(coupled_ioc)}")
-    if log_failures:
-        print(f"  WARNING: Approval log failed for: {', '.join(log_failures)}")
     if hmac_failures:
         print(f"  WARNING: HMAC ledger failed for: {', '.join(hmac_failures)}")
         print("  Re-run 'vhir approve' on these items to generate HMAC entries.")
@@ -365,17 +359,20 @@ def _interactive_review(
     if not approvals and not rejections:
         # Still create TODOs even if nothing to commit
         if todos_to_create:
-            _create_todos(case_dir, todos_to_create, identity)
+            txn = CaseTransaction(case_dir)
+            _create_todos(txn, todos_to_create, identity)
+            commit_transaction(txn)
         print("Nothing to commit.")
         return
 
     now = datetime.now(timezone.utc).isoformat()
+    texts: dict[str, str] = {}  # canonical text per item, reused for the HMAC
 
     # Apply approvals (in-memory)
     for item in all_items:
         if item["id"] in approvals:
             staging_hash = item.get("content_hash", "")
-            new_hash = compute_content_hash(item)
+            texts[item["id"]], new_hash = canonicalize(item)
             if staging_hash and staging_hash != new_hash:
                 print(
                     f"  NOTE: Finding {item['id']} was modified since staging "
@@ -405,14 +402,14 @@ def _interactive_review(
     # Timeline approval coupling: auto-created events follow their finding
     coupled_tl = []
     coupled_ioc = []
-    finding_by_id = {f["id"]: f for f in findings}
-    for tl_event in timeline:
-        auto_from = tl_event.get("auto_created_from", "")
-        if not auto_from:
-            continue
+    model = CaseModel({"findings.json": findings})
+    iocs = load_iocs(case_dir)
+    decided = {fid for fid in (*approvals, *rejections) if fid in model}
+    linked_tl, linked_iocs = coupled_items(case_dir, decided, timeline, iocs)
+    for tl_event in linked_tl:
         if tl_event.get("examiner_modifications"):
             continue
-        source = finding_by_id.get(auto_from)
+        source = model.get(tl_event.get("auto_created_from", ""))
         if not source:
             continue
         if source["id"] in approvals:
@@ -420,7 +417,7 @@ def _interactive_review(
             tl_event["approved_at"] = now
             tl_event["approved_by"] = identity["examiner"]
             tl_event["modified_at"] = now
-            new_hash = compute_content_hash(tl_event)
+            texts[tl_event["id"]], new_hash = canonicalize(tl_event)
             tl_event["content_hash"] = new_hash
             coupled_tl.append(tl_event)
         elif source["id"] in rejections:
@@ -432,17 +429,12 @@ def _interactive_review(
             coupled_tl.append(tl_event)
 
     # IOC approval/rejection coupling
-    from vhir_cli.case_io import load_iocs, save_iocs
-
     all_finding_status = {f["id"]: f.get("status", "DRAFT") for f in findings}
-    iocs = load_iocs(case_dir)
     iocs_modified = False
-    for ioc in iocs:
+    for ioc in linked_iocs:
         if ioc.get("manually_reviewed"):
             continue
         source_ids = ioc.get("source_findings", [])
-        if not source_ids:
-            continue
         statuses = {all_finding_status.get(sid, "DRAFT") for sid in source_ids}
         if statuses == {"APPROVED"} and ioc.get("status") != "APPROVED":
             ioc["status"] = "APPROVED"
@@ -460,39 +452,34 @@ def _interactive_review(
             iocs_modified = True
             coupled_ioc.append(ioc)
 
-    # Step 1: Persist primary data FIRST
-    try:
-        save_findings(case_dir, findings)
-        save_timeline(case_dir, timeline)
-        if iocs_modified:
-            save_iocs(case_dir, iocs)
-    except OSError as e:
-        print(f"CRITICAL: Failed to save case data: {e}", file=sys.stderr)
-        print(
-            "No changes were committed. Retry after fixing the issue.", file=sys.stderr
-        )
-        sys.exit(1)
+    # Case data, approval log, HMAC ledger and TODOs commit as one transaction
+    txn = CaseTransaction(case_dir)
+    txn.save_store("findings.json", findings)
+    txn.save_store("timeline.json", timeline)
+    if iocs_modified:
+        txn.save_store("iocs.json", iocs)
 
-    # Step 2: Approval log (best-effort, collect failures)
-    log_failures = []
+    log_entries = []
     for item in all_items:
-        if item["id"] in approvals and not write_approval_log(
-            case_dir,
-            item["id"],
-            "APPROVED",
-            identity,
-            mode=mode,
-            content_hash=item["content_hash"],
-        ):
-            log_failures.append(item["id"])
+        if item["id"] in approvals:
+            log_entries.append(
+                approval_log_entry(
+                    item["id"],
+                    "APPROVED",
+                    identity,
+                    mode=mode,
+                    content_hash=item["content_hash"],
+                )
+            )
     for item in all_items:
         disp = dispositions.get(item["id"])
         if disp and disp[0] == "reject":
             reason = disp[1] or ""
-            if not write_approval_log(
-                case_dir, item["id"], "REJECTED", identity, reason=reason, mode=mode
-            ):
-                log_failures.append(item["id"])
+            log_entries.append(
+                approval_log_entry(
+                    item["id"], "REJECTED", identity, reason=reason, mode=mode
+                )
+            )
     # Coupled items also need audit log entries
     for item in coupled_tl:
         status = item.get("status", "")
@@ -501,39 +488,42 @@ def _interactive_review(
             if status == "REJECTED"
             else ""
         )
-        if not write_approval_log(
-            case_dir,
-            item["id"],
-            status,
-            identity,
-            mode=mode,
-            coupled_from=item.get("auto_created_from", ""),
-            content_hash=item.get("content_hash", ""),
-            reason=reason,
-        ):
-            log_failures.append(item["id"])
+        log_entries.append(
+            approval_log_entry(
+                item["id"],
+                status,
+                identity,
+                mode=mode,
+                coupled_from=item.get("auto_created_from", ""),
+                content_hash=item.get("content_hash", ""),
+                reason=reason,
+            )
+        )
     for item in coupled_ioc:
         status = item.get("status", "")
         reason = item.get("rejection_reason", "") if status == "REJECTED" else ""
-        if not write_approval_log(
-            case_dir, item["id"], status, identity, mode=mode, reason=reason
-        ):
-            log_failures.append(item["id"])
+        log_entries.append(
+            approval_log_entry(item["id"], status, identity, mode=mode, reason=reason)
+        )
+    txn.append_approval_logs(log_entries)
 
-    # Step 3: HMAC ledger (warn on failure)
     approved_items = [item for item in all_items if item["id"] in approvals]
     approved_items += [item for item in coupled_tl if item.get("status") == "APPROVED"]
     approved_items += [item for item in coupled_ioc if item.get("status") == "APPROVED"]
     hmac_failures = _write_verification_entries(
-        case_dir, approved_items, identity, config_path, password, now
+        case_dir,
+        approved_items,
+        identity,
+        config_path,
+        password,
+        now,
+        txn=txn,
+        texts=texts,
     )
 
-    # Step 4: TODOs (best-effort)
     if todos_to_create:
-        try:
-            _create_todos(case_dir, todos_to_create, identity)
-        except OSError as e:
-            print(f"  WARNING: Failed to create TODOs: {e}", file=sys.stderr)
+        _create_todos(txn, todos_to_create, identity)
+    commit_transaction(txn)
 
     print(f"Committed {len(approvals) + len(rejections)} disposition(s).")
     if coupled_tl:
@@ -542,8 +532,6 @@ def _interactive_review(
         )
     if coupled_ioc:
         print(f"  Auto-coupled IOCs: {', '.join(e['id'] for e in coupled_ioc)}")
-    if log_failures:
-        print(f"  WARNING: Approval log failed for: {', '.join(log_failures)}")
     if hmac_failures:
         print(f"  WARNING: HMAC ledger failed for: {', '.join(hmac_failures)}")
         print("  Re-run 'vhir approve' on these items to generate HMAC entries.")
@@ -556,8 +544,15 @@ def _write_verification_entries(
     config_path: Path,
     password: str | None,
     now: str,
+    txn: CaseTransaction | None = None,
+    texts: dict[str, str] | None = None,
 ) -> list[str]:
-    """Write HMAC verification ledger entries. Returns list of failed item IDs."""
+    """Write HMAC verification ledger entries. Returns list of failed item IDs.
+
+    With txn, the entries are staged in the case transaction instead of
+    written directly. texts maps item IDs to the canonical text computed
+    with their content hash; other items are serialized here.
+    """
     if not password:
         return []  # No password — HMAC not applicable, not a failure
 
@@ -566,7 +561,8 @@ def _write_verification_entries(
         from vhir_cli.verification import (
             compute_hmac,
             derive_hmac_key,
-            write_ledger_entry,
+            ledger_path,
+            write_ledger_entries,
         )
     except ImportError:
         return [item.get("id", "") for item in items]
@@ -576,7 +572,19 @@ def _write_verification_entries(
     except (ValueError, OSError):
         return [item.get("id", "") for item in items]
 
-    derived_key = derive_hmac_key(password, salt)
+    # Signed by the key agent when one is unlocked (no PBKDF2 per approval)
+    known = texts or {}
+    snapshots = [known.get(item.get("id")) or hmac_text(item) for item in items]
+    macs = None
+    try:
+        from vhir_cli.key_agent import agent_sign
+
+        macs = agent_sign(identity["examiner"], salt, password, snapshots)
+    except ImportError:
+        pass
+    if macs is None:
+        derived_key = derive_hmac_key(password, salt)
+        macs = [compute_hmac(derived_key, desc) for desc in snapshots]
 
     # Resolve case_id from CASE.yaml
     case_id = ""
@@ -592,8 +600,8 @@ def _write_verification_entries(
     if not case_id:
         case_id = case_dir.name
 
-    failures: list[str] = []
-    for item in items:
+    entries = []
+    for item, desc, mac in zip(items, snapshots, macs, strict=True):
         item_id = item.get("id", "")
         item_type = (
             "timeline"
@@ -602,23 +610,36 @@ def _write_verification_entries(
             if item_id.startswith("IOC-")
             else "finding"
         )
-        desc = hmac_text(item)
         entry = {
             "finding_id": item_id,
             "type": item_type,
-            "hmac": compute_hmac(derived_key, desc),
+            "hmac": mac,
             "hmac_version": 2,
             "content_snapshot": desc,
             "approved_by": identity["examiner"],
             "approved_at": now,
             "case_id": case_id,
         }
-        try:
-            write_ledger_entry(case_id, entry)
-        except OSError:
-            failures.append(item_id)
+        entries.append(entry)
 
-    return failures
+    if txn is not None:
+        # Check writability now: a ledger that can't be written must not
+        # leave the case with a commit record that can never be replayed.
+        try:
+            path = ledger_path(case_id)
+            path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            writable = os.access(path if path.exists() else path.parent, os.W_OK)
+        except (OSError, ValueError):
+            writable = False
+        if not writable:
+            return [entry["finding_id"] for entry in entries]
+        txn.append_lines(path, entries, mode=0o600)
+        return []
+    try:
+        write_ledger_entries(case_id, entries)
+    except (OSError, ValueError):
+        return [entry["finding_id"] for entry in entries]
+    return []
 
 
 def _prompt_choice() -> str:
@@ -770,9 +791,11 @@ def _apply_note(item: dict, note: str, identity: dict) -> None:
     )
 
 
-def _create_todos(case_dir: Path, todos_to_create: list[dict], identity: dict) -> None:
-    """Create TODO items in the case."""
-    todos = load_todos(case_dir)
+def _create_todos(
+    txn: CaseTransaction, todos_to_create: list[dict], identity: dict
+) -> None:
+    """Stage new TODO items in the case transaction."""
+    todos = load_todos(txn.case_dir)
     examiner = identity["examiner"]
     for td in todos_to_create:
         # Find next sequence for this examiner
@@ -800,7 +823,7 @@ def _create_todos(case_dir: Path, todos_to_create: list[dict], identity: dict) -
         }
         todos.append(todo)
         print(f"  Created {todo_id}: {td['description']}")
-    save_todos(case_dir, todos)
+    txn.save_todos(todos)
 
 
 def _display_item(item: dict) -> None:
@@ -1051,19 +1074,12 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
     check_case_file_integrity(case_dir, "timeline.json")
     findings = load_findings(case_dir)
     timeline = load_timeline(case_dir)
-
-    from vhir_cli.case_io import load_iocs, save_iocs
-
     iocs = load_iocs(case_dir)
 
-    # Build lookup by ID — includes findings, timeline, AND IOCs
-    item_by_id: dict[str, dict] = {}
-    for f in findings:
-        item_by_id[f["id"]] = f
-    for t in timeline:
-        item_by_id[t["id"]] = t
-    for ioc in iocs:
-        item_by_id[ioc["id"]] = ioc
+    # Lookup by ID — includes findings, timeline, AND IOCs
+    model = CaseModel(
+        {"findings.json": findings, "timeline.json": timeline, "iocs.json": iocs}
+    )
 
     # Categorize delta items
     approvals = []
@@ -1075,7 +1091,7 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
     for entry in items:
         item_id = entry.get("id", "")
         action = entry.get("action", "").lower()
-        item = item_by_id.get(item_id)
+        item = model.get(item_id)
 
         # Check content hash staleness
         hash_at_review = entry.get("content_hash_at_review", "")
@@ -1116,13 +1132,14 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
     # Password confirmation
     mode, password = require_confirmation(config_path, identity["examiner"])
     now = datetime.now(timezone.utc).isoformat()
+    texts: dict[str, str] = {}  # canonical text per item, reused for the HMAC
 
     # Process approvals (in-memory)
     skipped = []
     approved_ids = []
     for entry in approvals:
         item_id = entry.get("id", "")
-        item = item_by_id.get(item_id)
+        item = model.get(item_id)
         if item is None:
             skipped.append((item_id, "not found"))
             continue
@@ -1161,7 +1178,7 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
             _apply_note(item, note, identity)
 
         # Compute content hash AFTER modifications
-        new_hash = compute_content_hash(item)
+        texts[item_id], new_hash = canonicalize(item)
         item["content_hash"] = new_hash
         item["status"] = "APPROVED"
         item["approved_at"] = now
@@ -1176,7 +1193,7 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
     edited_ids = []
     for entry in edits:
         item_id = entry.get("id", "")
-        item = item_by_id.get(item_id)
+        item = model.get(item_id)
         if item is None:
             skipped.append((item_id, "not found"))
             continue
@@ -1210,7 +1227,7 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
             }
 
         # Recompute hash
-        new_hash = compute_content_hash(item)
+        texts[item_id], new_hash = canonicalize(item)
         item["content_hash"] = new_hash
         item["modified_at"] = now
         edited_ids.append(item_id)
@@ -1219,7 +1236,7 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
     rejected_ids = []
     for entry in rejections:
         item_id = entry.get("id", "")
-        item = item_by_id.get(item_id)
+        item = model.get(item_id)
         if item is None:
             skipped.append((item_id, "not found"))
             continue
@@ -1237,13 +1254,13 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
         rejected_ids.append(item_id)
 
     # Timeline approval coupling: auto-created events follow their finding
-    for tl_event in timeline:
-        auto_from = tl_event.get("auto_created_from", "")
-        if not auto_from:
-            continue
+    linked_tl, linked_iocs = coupled_items(
+        case_dir, approved_ids + rejected_ids, timeline, iocs
+    )
+    for tl_event in linked_tl:
         if tl_event.get("examiner_modifications"):
             continue
-        source = item_by_id.get(auto_from)
+        source = model.get(tl_event.get("auto_created_from", ""))
         if not source:
             continue
         if source.get("status") == "APPROVED":
@@ -1251,7 +1268,7 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
             tl_event["approved_at"] = now
             tl_event["approved_by"] = identity["examiner"]
             tl_event["modified_at"] = now
-            new_hash = compute_content_hash(tl_event)
+            texts[tl_event["id"]], new_hash = canonicalize(tl_event)
             tl_event["content_hash"] = new_hash
             approved_ids.append(tl_event["id"])
         elif source.get("status") == "REJECTED":
@@ -1268,11 +1285,11 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
         aid.startswith("IOC-") for aid in approved_ids + rejected_ids + edited_ids
     )
     iocs_modified = any_ioc_acted
-    for ioc in iocs:
+    for ioc in linked_iocs:
         if ioc.get("manually_reviewed"):
             continue
         source_ids = ioc.get("source_findings", [])
-        relevant = [item_by_id.get(sid) for sid in source_ids if item_by_id.get(sid)]
+        relevant = [model.get(sid) for sid in source_ids if model.get(sid)]
         if not relevant:
             continue
         statuses = {r.get("status", "DRAFT") for r in relevant}
@@ -1292,58 +1309,62 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
             iocs_modified = True
             rejected_ids.append(ioc["id"])
 
-    # Step 1: Persist primary data FIRST
-    try:
-        save_findings(case_dir, findings)
-        save_timeline(case_dir, timeline)
-        if iocs_modified:
-            save_iocs(case_dir, iocs)
-    except OSError as e:
-        print(f"CRITICAL: Failed to save case data: {e}", file=sys.stderr)
-        print("The .processing file has been preserved for retry.", file=sys.stderr)
-        sys.exit(1)
+    # Case data, approval log, HMAC ledger and TODOs commit as one transaction
+    txn = CaseTransaction(case_dir)
+    txn.save_store("findings.json", findings)
+    txn.save_store("timeline.json", timeline)
+    if iocs_modified:
+        txn.save_store("iocs.json", iocs)
 
-    # Step 2: Approval log (best-effort, collect failures)
-    log_failures = []
+    log_entries = []
     for item_id in approved_ids:
-        item = item_by_id.get(item_id)
-        if item and not write_approval_log(
-            case_dir,
-            item_id,
-            "APPROVED",
-            identity,
-            mode=mode,
-            content_hash=item.get("content_hash", ""),
-            stale_at_approval=item_id in stale_warnings,
-        ):
-            log_failures.append(item_id)
+        item = model.get(item_id)
+        if item:
+            log_entries.append(
+                approval_log_entry(
+                    item_id,
+                    "APPROVED",
+                    identity,
+                    mode=mode,
+                    content_hash=item.get("content_hash", ""),
+                    stale_at_approval=item_id in stale_warnings,
+                )
+            )
     for entry in rejections:
         item_id = entry.get("id", "")
         if item_id in rejected_ids:
             reason = entry.get("rejection_reason", "") or entry.get("reason", "")
-            if not write_approval_log(
-                case_dir, item_id, "REJECTED", identity, reason=reason, mode=mode
-            ):
-                log_failures.append(item_id)
+            log_entries.append(
+                approval_log_entry(
+                    item_id, "REJECTED", identity, reason=reason, mode=mode
+                )
+            )
     for item_id in edited_ids:
-        item = item_by_id.get(item_id)
-        if item and not write_approval_log(
-            case_dir,
-            item_id,
-            "EDITED",
-            identity,
-            mode=mode,
-            content_hash=item.get("content_hash", ""),
-        ):
-            log_failures.append(item_id)
+        item = model.get(item_id)
+        if item:
+            log_entries.append(
+                approval_log_entry(
+                    item_id,
+                    "EDITED",
+                    identity,
+                    mode=mode,
+                    content_hash=item.get("content_hash", ""),
+                )
+            )
+    txn.append_approval_logs(log_entries)
 
-    # Step 3: HMAC ledger (warn on failure)
-    approved_items = [item_by_id[aid] for aid in approved_ids if aid in item_by_id]
+    approved_items = [model.get(aid) for aid in approved_ids if aid in model]
     hmac_failures = _write_verification_entries(
-        case_dir, approved_items, identity, config_path, password, now
+        case_dir,
+        approved_items,
+        identity,
+        config_path,
+        password,
+        now,
+        txn=txn,
+        texts=texts,
     )
 
-    # Step 4: TODOs (best-effort)
     if todos:
         todos_to_create = []
         for entry in todos:
@@ -1357,12 +1378,10 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
                     "related_findings": [entry.get("id", "")],
                 }
             )
-        try:
-            _create_todos(case_dir, todos_to_create, identity)
-        except OSError as e:
-            print(f"  WARNING: Failed to create TODOs: {e}", file=sys.stderr)
+        _create_todos(txn, todos_to_create, identity)
+    commit_transaction(txn, "The .processing file has been preserved for retry.")
 
-    # Step 5: Cleanup .processing
+    # Cleanup .processing
     try:
         processing_path.unlink(missing_ok=True)
     except OSError:
@@ -1384,8 +1403,6 @@ def _review_mode(case_dir: Path, identity: dict, config_path: Path) -> None:
         f"\nApplied: {len(approved_ids)} approved, {len(rejected_ids)} rejected, "
         f"{len(edited_ids)} edited, {len(todos)} TODO(s)."
     )
-    if log_failures:
-        print(f"  WARNING: Approval log failed for: {', '.join(log_failures)}")
     if hmac_failures:
         print(f"  WARNING: HMAC ledger failed for: {', '.join(hmac_failures)}")
         print("  Re-run 'vhir approve' on these items to generate HMAC entries.")
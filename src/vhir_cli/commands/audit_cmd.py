@@ -7,10 +7,9 @@ Read and summarize audit entries from the case directory:
 
 from __future__ import annotations
 
-import json
 import sys
-from pathlib import Path
 
+from vhir_cli.audit_io import tail_audit_entries
 from vhir_cli.case_io import get_case_dir
 
 
@@ -26,64 +25,9 @@ def cmd_audit(args, identity: dict) -> None:
         sys.exit(1)
 
 
-def _load_audit_entries(case_dir: Path) -> list[dict]:
-    """Load all audit entries from audit/*.jsonl and approvals.jsonl."""
-    entries: list[dict] = []
-    corrupt_lines = 0
-
-    audit_dir = case_dir / "audit"
-    if audit_dir.is_dir():
-        for jsonl_file in sorted(audit_dir.glob("*.jsonl")):
-            try:
-                with open(jsonl_file, encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entry = json.loads(line)
-                            # Derive mcp name from filename if not present
-                            if "mcp" not in entry:
-                                entry["mcp"] = jsonl_file.stem
-                            entries.append(entry)
-                        except json.JSONDecodeError:
-                            corrupt_lines += 1
-            except OSError as e:
-                print(f"  Warning: could not read {jsonl_file}: {e}", file=sys.stderr)
-                continue
-
-    approvals_file = case_dir / "approvals.jsonl"
-    if approvals_file.exists():
-        try:
-            with open(approvals_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        entry.setdefault("tool", "approval")
-                        entry.setdefault("mcp", "vhir-cli")
-                        entries.append(entry)
-                    except json.JSONDecodeError:
-                        corrupt_lines += 1
-        except OSError:
-            pass
-
-    if corrupt_lines:
-        print(
-            f"  Warning: {corrupt_lines} corrupt JSONL line(s) skipped in audit trail",
-            file=sys.stderr,
-        )
-
-    entries.sort(key=lambda e: e.get("ts", ""))
-    return entries
-
-
 def _audit_log(args) -> None:
     """Show audit log entries with optional filters."""
     case_dir = get_case_dir(getattr(args, "case", None))
-    entries = _load_audit_entries(case_dir)
 
     mcp_filter = getattr(args, "mcp", None)
     tool_filter = getattr(args, "tool", None)
@@ -92,12 +36,7 @@ def _audit_log(args) -> None:
         print("Error: --limit must be a positive integer.", file=sys.stderr)
         sys.exit(1)
 
-    if mcp_filter:
-        entries = [e for e in entries if e.get("mcp", "") == mcp_filter]
-    if tool_filter:
-        entries = [e for e in entries if e.get("tool", "") == tool_filter]
-
-    entries = entries[-limit:]
+    entries = tail_audit_entries(case_dir, limit, mcp=mcp_filter, tool=tool_filter)
 
     if not entries:
         print("No audit entries found.")
@@ -127,32 +66,21 @@ def audit_summary_data(case_dir) -> dict:
     """
     from pathlib import Path
 
-    case_dir = Path(case_dir)
-    entries = _load_audit_entries(case_dir)
-
-    mcp_counts: dict[str, int] = {}
-    tool_counts: dict[str, dict[str, int]] = {}
-    audit_ids: set[str] = set()
+    from vhir_cli.audit_io import audit_counts
 
-    for e in entries:
-        mcp = e.get("mcp", "unknown")
-        tool = e.get("tool", "unknown")
-        eid = e.get("audit_id", "")
-
-        mcp_counts[mcp] = mcp_counts.get(mcp, 0) + 1
-
-        if mcp not in tool_counts:
-            tool_counts[mcp] = {}
-        tool_counts[mcp][tool] = tool_counts[mcp].get(tool, 0) + 1
-
-        if eid:
-            audit_ids.add(eid)
+    counts = audit_counts(Path(case_dir))
+    if counts["corrupt_lines"]:
+        print(
+            f"  Warning: {counts['corrupt_lines']} corrupt JSONL line(s) skipped "
+            "in audit trail",
+            file=sys.stderr,
+        )
 
     return {
-        "total_entries": len(entries),
-        "audit_ids": len(audit_ids),
-        "by_mcp": mcp_counts,
-        "by_tool": tool_counts,
+        "total_entries": counts["total_entries"],
+        "audit_ids": counts["audit_ids"],
+        "by_mcp": counts["by_mcp"],
+        "by_tool": counts["by_tool"],
     }
 
 
@@ -8,22 +8,64 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-import shutil
 import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
-from vhir_cli.case_io import get_case_dir, load_case_meta
+from vhir_cli.archive import (
+    ARCHIVE_SUFFIX,
+    ArchiveWriter,
+    check_codec,
+    extract_member,
+    hash_member,
+    read_archive_manifest,
+    sidecar_path,
+)
+from vhir_cli.case_io import CASE_CACHE_PATHS, get_case_dir, load_case_meta
+from vhir_cli.hashing import (
+    DEFAULT_WORKERS,
+    copy_and_hash,
+    format_throughput,
+    hash_file,
+)
 from vhir_cli.verification import VERIFICATION_DIR
 
-_SKIP_NAMES = {"__pycache__", ".DS_Store", "examiners.bak"}
+_SKIP_NAMES = {
+    "__pycache__",
+    ".DS_Store",
+    "examiners.bak",
+}
 
 
 def cmd_backup(args, identity: dict) -> None:
     """Entry point for 'vhir backup'."""
     verify_path = getattr(args, "verify", None)
-    if verify_path:
-        ok = _verify_backup(Path(verify_path))
+    extract = getattr(args, "extract", None)
+    if extract:
+        archive_path, rel_path = extract
+        try:
+            data = extract_backup_file(
+                Path(archive_path),
+                rel_path,
+                Path(getattr(args, "output", None) or "."),
+                force=getattr(args, "force", False),
+            )
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Extracted: {data['path']} ({human_size(data['bytes'])})")
+        print(f"  SHA256: {data['sha256']} (matches manifest)")
+    elif verify_path:
+        ok = _verify_backup(
+            Path(verify_path),
+            workers=getattr(args, "workers", None),
+            fail_fast=getattr(args, "fail_fast", False),
+            resume=getattr(args, "resume", False),
+        )
         if not ok:
             sys.exit(1)
     else:
@@ -35,7 +77,10 @@ def _create_backup(args, identity: dict) -> None:
     case_dir = get_case_dir(getattr(args, "case", None))
     destination = getattr(args, "destination", None)
     if not destination:
-        print("Error: destination is required (unless using --verify)", file=sys.stderr)
+        print(
+            "Error: destination is required (unless using --verify or --extract)",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
     examiner = identity.get("examiner", "unknown")
@@ -86,8 +131,11 @@ def _create_backup(args, identity: dict) -> None:
             include_evidence=include_evidence,
             include_extractions=include_extractions,
             progress_fn=progress,
+            base=getattr(args, "base", None),
+            archive=getattr(args, "archive", None),
+            level=getattr(args, "level", None),
         )
-    except OSError as e:
+    except (OSError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -107,6 +155,19 @@ def _create_backup(args, identity: dict) -> None:
     print(f"Backup complete: {result['backup_path']}")
     print(f"  Files: {result['file_count']}")
     print(f"  Size:  {human_size(result['total_bytes'])}")
+    if result.get("archive"):
+        print(
+            f"  Archive: {human_size(result['stored_bytes'])} stored "
+            f"({result['archive']} per member)"
+        )
+    if result.get("parent"):
+        print(f"  Base:  {result['parent']}")
+        print(
+            f"  Copied {result['copied_files']} changed file(s) "
+            f"({human_size(result['copied_bytes'])}), "
+            f"hardlinked {result['linked_files']}, "
+            f"referenced {result['referenced_files']} from base"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -123,12 +184,32 @@ def create_backup_data(
     include_extractions: bool = False,
     purpose: str = "",
     progress_fn=None,
+    workers: int | None = None,
+    base: str | None = None,
+    archive: str | None = None,
+    level: int | None = None,
 ) -> dict:
     """Create a case backup and return result dict.
 
     This is the shared implementation used by both the CLI and the MCP tool.
     No TTY interaction — callers handle prompts and output.
 
+    Files are copied concurrently and hashed from the same read, so the
+    manifest is built without re-reading the backup.
+
+    With ``base`` (a previous backup of the same case) the backup is
+    incremental: files whose size and mtime match the base manifest are
+    hardlinked from the base instead of copied. Where a hardlink is not
+    possible (another filesystem, or the base itself only references the
+    file) the manifest entry is marked ``ref`` and its content is resolved
+    through the ``parent`` pointer at verify time.
+
+    With ``archive`` (a codec from archive.CODECS) the backup is a single
+    ``{case_id}-{date}.tar`` instead of a directory: each file is read
+    once, hashed, compressed on its own and streamed in, and the manifest
+    records each member's offset for single-file extraction. The archive
+    is written as ``.tar.partial`` and renamed when complete.
+
     Args:
         case_dir: Resolved case directory path.
         destination: Directory to create the backup in.
@@ -137,34 +218,54 @@ def create_backup_data(
         include_extractions: Include extractions/ files.
         purpose: Why the backup is being made (stored in manifest).
         progress_fn: Optional callback(label, i, total) for progress.
+        workers: Concurrent file copies (default: hashing.DEFAULT_WORKERS).
+        base: Previous backup directory to build an incremental backup on.
+        archive: Write a single-file archive with this member codec.
+        level: Compression level for the archive codec.
 
     Returns:
         Dict with backup_path, file_count, total_bytes, manifest,
-        symlinks, includes_verification_ledger, ledger_note.
+        symlinks, includes_verification_ledger, ledger_note; incremental
+        backups add parent, copied_files, copied_bytes, linked_files,
+        referenced_files; archives add archive, stored_bytes.
 
     Raises:
         OSError: If backup directory cannot be created or files cannot be copied.
+        ValueError: If the base is not a complete backup of this case, or
+            the archive options are invalid.
     """
     meta = load_case_meta(case_dir)
     case_id = meta.get("case_id", case_dir.name)
     dest = Path(destination)
+    parent = None
+    if archive:
+        if base:
+            raise ValueError("Incremental (--base) backups cannot be archives")
+        check_codec(archive, level)
+    if base:
+        base_dir = Path(base)
+        base_manifest = _load_base_manifest(base_dir, case_id)
+        base_index = {f["path"]: f for f in base_manifest.get("files", [])}
 
     # Create backup dir with collision avoidance (atomic mkdir to avoid TOCTOU)
     date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     backup_name = f"{case_id}-{date_str}"
-    backup_dir = dest / backup_name
-    suffix = 0
-    while True:
-        try:
-            backup_dir.mkdir(parents=True, exist_ok=False)
-            break
-        except FileExistsError:
-            suffix += 1
-            backup_dir = dest / f"{backup_name}-{suffix}"
+    if archive:
+        writer, backup_dir = _open_archive(dest, backup_name, archive, level)
+    else:
+        backup_dir = dest / backup_name
+        suffix = 0
+        while True:
+            try:
+                backup_dir.mkdir(parents=True, exist_ok=False)
+                break
+            except FileExistsError:
+                suffix += 1
+                backup_dir = dest / f"{backup_name}-{suffix}"
 
-    # Write in-progress marker
-    marker = backup_dir / ".backup-in-progress"
-    marker.touch()
+        # Write in-progress marker
+        marker = backup_dir / ".backup-in-progress"
+        marker.touch()
 
     # Scan case directory
     scan = scan_case_dir(case_dir)
@@ -176,50 +277,82 @@ def create_backup_data(
     if include_extractions:
         files_to_copy.extend(scan["extractions"])
 
+    # Source stats, taken before copying so a file that changes mid-copy
+    # differs from its manifest entry and is copied again next time
+    sources: dict[str, os.stat_result] = {}
+    for rel_path, abs_path, _size in files_to_copy:
+        try:
+            sources[rel_path] = os.stat(abs_path)
+        except OSError:
+            pass  # surfaces as a copy error
+
+    # Incremental: reuse files unchanged since the base backup
+    reused: dict[str, tuple[int, str]] = {}
+    refs: set[str] = set()
+    if base:
+        parent = {
+            "path": os.path.relpath(base_dir.resolve(), backup_dir.resolve()),
+            "timestamp": base_manifest.get("timestamp", ""),
+            "manifest_sha256": hash_file(base_dir / "backup-manifest.json")["sha256"],
+        }
+        remaining = []
+        for rel_path, abs_path, size in files_to_copy:
+            prev = base_index.get(rel_path)
+            st = sources.get(rel_path)
+            if (
+                prev is None
+                or st is None
+                or prev.get("mtime_ns") != st.st_mtime_ns
+                or prev.get("bytes") != st.st_size
+            ):
+                remaining.append((rel_path, abs_path, size))
+                continue
+            reused[rel_path] = (prev["bytes"], prev["sha256"])
+            if not _link_from_base(base_dir, prev, backup_dir / rel_path):
+                refs.add(rel_path)
+        files_to_copy = remaining
+
     # Copy verification ledger if it exists
     ledger_path = VERIFICATION_DIR / f"{case_id}.jsonl"
-    ledger_included = False
+    ledger_rel = str(Path("verification") / f"{case_id}.jsonl")
     ledger_note = ""
     if ledger_path.is_file():
-        try:
-            vdir = backup_dir / "verification"
-            vdir.mkdir(exist_ok=True)
-            shutil.copy2(str(ledger_path), str(vdir / f"{case_id}.jsonl"))
-            ledger_included = True
-        except OSError:
-            ledger_note = "Warning: could not copy verification ledger"
+        files_to_copy.append((ledger_rel, str(ledger_path), 0))
     else:
         ledger_note = "Note: no verification ledger found for this case"
 
-    # Copy files
-    total_files = len(files_to_copy)
-    for i, (rel_path, abs_path, _size) in enumerate(files_to_copy, 1):
-        dst = backup_dir / rel_path
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(abs_path), str(dst))
-        if progress_fn:
-            progress_fn("Copying", i, total_files)
-
-    # Generate manifest — walk the backup dir (not source)
-    all_backup_files = []
-    for root, _dirs, filenames in os.walk(backup_dir, followlinks=True):
-        for fname in filenames:
-            if fname == ".backup-in-progress":
-                continue
-            fpath = Path(root) / fname
-            rel = fpath.relative_to(backup_dir)
-            all_backup_files.append((str(rel), fpath))
+    # Copy + hash in one read per file
+    members: dict[str, dict] = {}
+    if archive:
+        try:
+            copied = _archive_files(
+                writer, files_to_copy, members, progress_fn, optional={ledger_rel}
+            )
+        except BaseException:
+            writer.abort()
+            raise
+    else:
+        copied = _copy_files(
+            backup_dir, files_to_copy, workers, progress_fn, optional={ledger_rel}
+        )
+    ledger_included = ledger_rel in copied
+    if ledger_path.is_file() and not ledger_included:
+        ledger_note = "Warning: could not copy verification ledger"
 
     manifest_files = []
     total_bytes = 0
-    total_manifest = len(all_backup_files)
-    for i, (rel, fpath) in enumerate(sorted(all_backup_files), 1):
-        fsize = fpath.stat().st_size
-        fhash = sha256_file(fpath)
-        manifest_files.append({"path": rel, "sha256": fhash, "bytes": fsize})
+    copied_bytes = sum(fsize for fsize, _ in copied.values())
+    for rel in sorted({**reused, **copied}):
+        fsize, fhash = copied.get(rel) or reused[rel]
+        entry = {"path": rel, "sha256": fhash, "bytes": fsize}
+        if rel in sources:
+            entry["mtime_ns"] = sources[rel].st_mtime_ns
+        if rel in refs:
+            entry["ref"] = True
+        if rel in members:
+            entry.update(members[rel])
+        manifest_files.append(entry)
         total_bytes += fsize
-        if progress_fn:
-            progress_fn("Generating manifest", i, total_manifest)
 
     manifest = {
         "version": 1,
@@ -237,20 +370,26 @@ def create_backup_data(
     }
     if purpose:
         manifest["purpose"] = purpose
+    if parent:
+        manifest["parent"] = parent
 
-    manifest_path = backup_dir / "backup-manifest.json"
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
-        f.flush()
-        os.fsync(f.fileno())
+    if archive:
+        manifest["archive"] = {"format": "tar", "codec": archive}
+        backup_dir = _close_archive(writer, manifest)
+    else:
+        manifest_path = backup_dir / "backup-manifest.json"
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
 
-    # Remove in-progress marker
-    try:
-        marker.unlink()
-    except OSError:
-        pass
+        # Remove in-progress marker
+        try:
+            marker.unlink()
+        except OSError:
+            pass
 
-    return {
+    result = {
         "backup_path": str(backup_dir),
         "file_count": len(manifest_files),
         "total_bytes": total_bytes,
@@ -260,70 +399,216 @@ def create_backup_data(
         "ledger_note": ledger_note,
         "symlinks": scan["symlinks"],
     }
+    if parent:
+        result.update(
+            parent=str(base_dir),
+            copied_files=len(copied),
+            copied_bytes=copied_bytes,
+            linked_files=len(reused) - len(refs),
+            referenced_files=len(refs),
+        )
+    if archive:
+        result.update(archive=archive, stored_bytes=writer.stored_bytes)
+    return result
 
 
-# ---------------------------------------------------------------------------
-# Verify
-# ---------------------------------------------------------------------------
-
+def _open_archive(
+    dest: Path, backup_name: str, codec: str, level: int | None
+) -> tuple[ArchiveWriter, Path]:
+    """Create ``<name>.tar.partial`` with collision avoidance."""
+    dest.mkdir(parents=True, exist_ok=True)
+    suffix = 0
+    while True:
+        name = backup_name if not suffix else f"{backup_name}-{suffix}"
+        final = dest / f"{name}{ARCHIVE_SUFFIX}"
+        partial = final.with_name(final.name + ".partial")
+        if not final.exists():
+            try:
+                return ArchiveWriter(partial, codec, level), final
+            except FileExistsError:
+                pass
+        suffix += 1
+
+
+def _archive_files(
+    writer: ArchiveWriter,
+    files_to_copy: list[tuple[str, str, int]],
+    members: dict[str, dict],
+    progress_fn,
+    optional: set[str] = frozenset(),
+) -> dict[str, tuple[int, str]]:
+    """Stream files into an archive (serially: one output stream).
+
+    Returns {relative path: (bytes, sha256)} like _copy_files and fills
+    ``members`` with each file's offset/stored/codec fields. A failed
+    optional file is dropped; the archive stays consistent because the
+    writer rewinds to the member's header.
+    """
+    copied: dict[str, tuple[int, str]] = {}
+    total_files = len(files_to_copy)
+    for i, (rel_path, abs_path, _size) in enumerate(sorted(files_to_copy), 1):
+        try:
+            info = writer.add_file(rel_path, abs_path)
+        except OSError:
+            if rel_path not in optional:
+                raise
+        else:
+            copied[rel_path] = (info.pop("bytes"), info.pop("sha256"))
+            members[rel_path] = info
+        if progress_fn:
+            progress_fn("Archiving", i, total_files)
+    return copied
 
-def _verify_backup(backup_path: Path) -> bool:
-    """Verify a backup's integrity. Returns True if all checks pass."""
-    if not backup_path.is_dir():
-        print(f"Error: not a directory: {backup_path}", file=sys.stderr)
-        return False
 
-    # Check for incomplete backup
-    if (backup_path / ".backup-in-progress").exists():
-        print("FAILED: Incomplete backup — copy was interrupted")
-        return False
+def _close_archive(writer: ArchiveWriter, manifest: dict) -> Path:
+    """Seal the archive, write the manifest sidecar, publish the file."""
+    writer.close(manifest)
+    final = writer.path.with_name(writer.path.name.removesuffix(".partial"))
+    sidecar = sidecar_path(final)
+    with open(sidecar, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(writer.path, final)
+    return final
 
-    manifest_file = backup_path / "backup-manifest.json"
-    if not manifest_file.exists():
-        print("FAILED: backup-manifest.json not found", file=sys.stderr)
-        return False
 
+def _load_base_manifest(base_dir: Path, case_id: str) -> dict:
+    """Load the manifest of a base backup, checking it is usable."""
+    if not base_dir.is_dir():
+        raise ValueError(f"Base backup is not a directory: {base_dir}")
+    if (base_dir / ".backup-in-progress").exists():
+        raise ValueError(f"Base backup is incomplete: {base_dir}")
     try:
-        manifest = json.loads(manifest_file.read_text())
+        manifest = json.loads((base_dir / "backup-manifest.json").read_text())
     except (json.JSONDecodeError, OSError) as e:
-        print(f"FAILED: cannot read manifest: {e}", file=sys.stderr)
+        raise ValueError(f"Cannot read base backup manifest: {e}") from e
+    if manifest.get("case_id") != case_id:
+        raise ValueError(
+            f"Base backup is for case {manifest.get('case_id')!r}, not {case_id!r}"
+        )
+    return manifest
+
+
+def _link_from_base(base_dir: Path, prev: dict, dst: Path) -> bool:
+    """Hardlink an unchanged file from the base backup. False if not possible."""
+    if prev.get("ref"):
+        return False  # content lives further up the chain
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(base_dir / prev["path"], dst)
+    except OSError:
         return False
+    return True
 
-    files = manifest.get("files", [])
-    ok_count = 0
-    mismatch_count = 0
-    missing_count = 0
-    total = len(files)
-
-    for i, entry in enumerate(files, 1):
-        rel_path = entry["path"]
-        expected_hash = entry["sha256"]
-        fpath = backup_path / rel_path
-
-        if not fpath.exists():
-            print(f"  MISSING: {rel_path}")
-            missing_count += 1
-        else:
-            actual_hash = sha256_file(fpath)
-            if actual_hash != expected_hash:
-                print(f"  MISMATCH: {rel_path}")
-                mismatch_count += 1
-            else:
-                ok_count += 1
 
+def _copy_files(
+    backup_dir: Path,
+    files_to_copy: list[tuple[str, str, int]],
+    workers: int | None,
+    progress_fn,
+    optional: set[str] = frozenset(),
+) -> dict[str, tuple[int, str]]:
+    """Copy files into backup_dir concurrently, hashing as they stream.
+
+    Returns {relative path: (bytes, sha256)}. Failures of paths in
+    ``optional`` are tolerated (left out of the result); any other
+    failure is raised once the in-flight copies finish.
+    """
+    copied: dict[str, tuple[int, str]] = {}
+    if not files_to_copy:
+        return copied
+    for rel_path, _abs, _size in files_to_copy:
+        (backup_dir / rel_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def copy_one(rel_path: str, abs_path: str) -> tuple[int, str]:
+        nbytes, digests = copy_and_hash(abs_path, backup_dir / rel_path)
+        return nbytes, digests["sha256"]
+
+    first_error: OSError | None = None
+    total_files = len(files_to_copy)
+    workers = max(1, min(workers or DEFAULT_WORKERS, total_files))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Largest first so one big image doesn't start last
+        futures = {
+            pool.submit(copy_one, rel, src): rel
+            for rel, src, _size in sorted(files_to_copy, key=lambda f: -f[2])
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            rel = futures[future]
+            try:
+                copied[rel] = future.result()
+            except OSError as e:
+                if rel not in optional and not first_error:
+                    first_error = e
+            if progress_fn:
+                progress_fn("Copying", i, total_files)
+    if first_error:
+        raise first_error
+    return copied
+
+
+# ---------------------------------------------------------------------------
+# Verify
+# ---------------------------------------------------------------------------
+
+
+_VERIFY_CHECKPOINT = ".verify-checkpoint.jsonl"
+
+
+def _verify_backup(
+    backup_path: Path,
+    workers: int | None = None,
+    fail_fast: bool = False,
+    resume: bool = False,
+) -> bool:
+    """Verify a backup's integrity. Returns True if all checks pass."""
+
+    def progress(label: str, i: int, total: int) -> None:
         if i % 50 == 0 or i == total:
-            print(f"Checking... {i}/{total}", end="\r")
-    if total:
+            print(f"{label}... {i}/{total}", end="\r")
+
+    try:
+        data = verify_backup_data(
+            backup_path,
+            workers=workers,
+            fail_fast=fail_fast,
+            resume=resume,
+            progress_fn=progress,
+        )
+    except ValueError as e:
+        print(f"FAILED: {e}", file=sys.stderr)
+        return False
+    if data["checked"]:
         print()
 
-    print(f"\nVerification: {ok_count} OK", end="")
-    if mismatch_count:
-        print(f", {mismatch_count} MISMATCH", end="")
-    if missing_count:
-        print(f", {missing_count} MISSING", end="")
+    if data["resumed"]:
+        print(f"Resumed: {data['resumed']} file(s) already verified by a previous run")
+    for rel_path in data["missing"]:
+        print(f"  MISSING: {rel_path}")
+    for rel_path in data["mismatched"]:
+        print(f"  MISMATCH: {rel_path}")
+    for rel_path, error in data["errors"].items():
+        print(f"  ERROR: {rel_path}: {error}")
+
+    print(f"\nVerification: {data['ok']} OK", end="")
+    if data["mismatched"]:
+        print(f", {len(data['mismatched'])} MISMATCH", end="")
+    if data["missing"]:
+        print(f", {len(data['missing'])} MISSING", end="")
+    if data["errors"]:
+        print(f", {len(data['errors'])} ERROR", end="")
     print()
+    if data["bytes_hashed"]:
+        print(f"Hashed {format_throughput(data['bytes_hashed'], data['seconds'])}")
 
-    if mismatch_count or missing_count:
+    if data["stopped_early"]:
+        print(
+            f"FAILED: stopped at first failure ({data['unchecked']} file(s) "
+            "not checked)"
+        )
+        return False
+    if not data["passed"]:
         print("FAILED: backup integrity check failed")
         return False
 
@@ -331,21 +616,260 @@ def _verify_backup(backup_path: Path) -> bool:
     return True
 
 
+def verify_backup_data(
+    backup_path: Path,
+    *,
+    workers: int | None = None,
+    fail_fast: bool = False,
+    resume: bool = False,
+    progress_fn=None,
+) -> dict:
+    """Verify a backup against its manifest and return structured results.
+
+    Files are hashed concurrently, largest first, so the longest hashes
+    start early. Archives are checked member by member against the
+    manifest sealed inside the archive. Each verified file is appended to
+    a checkpoint in the backup directory, or next to the archive (best
+    effort: read-only media just skips it), and
+    ``resume`` skips files a previous, interrupted run of the same
+    manifest already verified. The checkpoint is removed once a run
+    passes.
+
+    Args:
+        backup_path: Backup directory or archive file.
+        workers: Hashing threads (default: hashing.DEFAULT_WORKERS).
+        fail_fast: Stop at the first MISSING/MISMATCH/unreadable file.
+        resume: Trust files recorded OK in the checkpoint.
+        progress_fn: Optional callback(label, i, total).
+
+    Returns:
+        Dict with passed, total, ok, resumed, checked, unchecked,
+        mismatched, missing (lists of manifest paths), errors ({path:
+        message}), stopped_early, bytes_hashed, seconds.
+
+    Raises:
+        ValueError: If the backup is incomplete or its manifest unreadable.
+    """
+    backup_path = Path(backup_path)
+    is_archive = backup_path.is_file()
+    if backup_path.name.endswith(ARCHIVE_SUFFIX + ".partial"):
+        raise ValueError("Incomplete backup — archive was not finished")
+    if is_archive:
+        manifest = read_archive_manifest(backup_path, use_sidecar=False)
+        manifest_sha = hashlib.sha256(
+            json.dumps(manifest, sort_keys=True).encode()
+        ).hexdigest()
+        checkpoint = backup_path.with_name(backup_path.name + _VERIFY_CHECKPOINT)
+    else:
+        if not backup_path.is_dir():
+            raise ValueError(f"not a directory: {backup_path}")
+        if (backup_path / ".backup-in-progress").exists():
+            raise ValueError("Incomplete backup — copy was interrupted")
+        manifest_file = backup_path / "backup-manifest.json"
+        if not manifest_file.exists():
+            raise ValueError("backup-manifest.json not found")
+        try:
+            manifest_sha = hash_file(manifest_file)["sha256"]
+            manifest = json.loads(manifest_file.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            raise ValueError(f"cannot read manifest: {e}") from e
+        checkpoint = backup_path / _VERIFY_CHECKPOINT
+
+    files = manifest.get("files", [])
+    done = _read_verify_checkpoint(checkpoint, manifest_sha) if resume else set()
+
+    # Resolve locations up front; the parent-manifest cache stays on this thread
+    parents: dict[Path, tuple | None] = {}
+    missing: list[str] = []
+    pending: list[tuple[dict, Callable[[], dict]]] = []
+    resumed = 0
+    for entry in files:
+        if entry["path"] in done:
+            resumed += 1
+            continue
+        if is_archive:
+            if "offset" not in entry:
+                missing.append(entry["path"])
+            else:
+                pending.append((entry, partial(hash_member, backup_path, entry)))
+            continue
+        fpath = _entry_location(backup_path, manifest, entry, parents)
+        if fpath is None or not fpath.exists():
+            missing.append(entry["path"])
+        else:
+            pending.append((entry, partial(hash_file, fpath)))
+    pending.sort(key=lambda p: -p[0].get("bytes", 0))
+
+    mismatched: list[str] = []
+    errors: dict[str, str] = {}
+    ok = resumed
+    checked = 0
+    bytes_hashed = 0
+    stopped_early = bool(fail_fast and missing)
+    start = time.monotonic()
+
+    if pending and not stopped_early:
+        log = _open_verify_checkpoint(checkpoint, manifest_sha, append=bool(done))
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(workers or DEFAULT_WORKERS, len(pending)))
+        )
+        try:
+            futures = {pool.submit(hasher): entry for entry, hasher in pending}
+            for future in as_completed(futures):
+                entry = futures[future]
+                checked += 1
+                try:
+                    actual = future.result()["sha256"]
+                except OSError as e:
+                    errors[entry["path"]] = str(e)
+                else:
+                    bytes_hashed += entry.get("bytes", 0)
+                    if actual == entry["sha256"]:
+                        ok += 1
+                        if log:
+                            log.write(json.dumps({"path": entry["path"]}) + "\n")
+                            log.flush()
+                    else:
+                        mismatched.append(entry["path"])
+                if progress_fn:
+                    progress_fn("Checking", checked, len(pending))
+                if fail_fast and (mismatched or errors):
+                    stopped_early = True
+                    break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            if log:
+                log.close()
+
+    passed = not (missing or mismatched or errors or stopped_early)
+    if passed:
+        try:
+            checkpoint.unlink()
+        except OSError:
+            pass
+
+    return {
+        "passed": passed,
+        "total": len(files),
+        "ok": ok,
+        "resumed": resumed,
+        "checked": checked,
+        "unchecked": len(pending) - checked,
+        "mismatched": sorted(mismatched),
+        "missing": missing,
+        "errors": errors,
+        "stopped_early": stopped_early,
+        "bytes_hashed": bytes_hashed,
+        "seconds": time.monotonic() - start,
+    }
+
+
+def _read_verify_checkpoint(checkpoint: Path, manifest_sha: str) -> set[str]:
+    """Paths a previous run verified OK against this exact manifest."""
+    try:
+        lines = checkpoint.read_text().splitlines()
+    except OSError:
+        return set()
+    done = set()
+    for i, line in enumerate(lines):
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # torn last line of an interrupted run
+        if i == 0:
+            if record.get("manifest_sha256") != manifest_sha:
+                return set()
+        elif "path" in record:
+            done.add(record["path"])
+    return done
+
+
+def _open_verify_checkpoint(checkpoint: Path, manifest_sha: str, append: bool):
+    """Open the checkpoint for appending OK paths; None if not writable."""
+    try:
+        if append:
+            f = open(checkpoint, "a", encoding="utf-8")
+            f.write("\n")  # terminate a possibly torn last line
+        else:
+            f = open(checkpoint, "w", encoding="utf-8")
+            f.write(json.dumps({"manifest_sha256": manifest_sha}) + "\n")
+        return f
+    except OSError:
+        return None
+
+
+def extract_backup_file(
+    archive_path: Path, rel_path: str, output_dir: Path, force: bool = False
+) -> dict:
+    """Restore one file from a backup archive by manifest path.
+
+    Only that member is read; its content is checked against the manifest.
+    An existing file is replaced only with force.
+
+    Returns:
+        Dict with path, sha256, bytes.
+
+    Raises:
+        ValueError: If the path isn't in the archive, fails its hash, or
+            would overwrite an existing file without force.
+        OSError: If reading or writing fails.
+    """
+    return extract_member(Path(archive_path), rel_path, Path(output_dir), force)
+
+
+_MAX_PARENT_DEPTH = 64
+
+
+def _entry_location(
+    backup_path: Path, manifest: dict, entry: dict, parents: dict
+) -> Path | None:
+    """Where a manifest entry's content lives.
+
+    Plain entries are in the backup itself. ``ref`` entries of an
+    incremental backup follow the parent chain; each parent's manifest
+    must still hash to the value recorded by its child. Returns None when
+    the chain is broken. ``parents`` caches loaded parent manifests.
+    """
+    depth = 0
+    while entry.get("ref"):
+        link = manifest.get("parent") or {}
+        if not link.get("path") or depth >= _MAX_PARENT_DEPTH:
+            return None
+        parent_dir = (backup_path / link["path"]).resolve()
+        if parent_dir not in parents:
+            parents[parent_dir] = _load_parent_manifest(parent_dir, link)
+        if parents[parent_dir] is None:
+            return None
+        manifest, index = parents[parent_dir]
+        entry = index.get(entry["path"])
+        if entry is None:
+            return None
+        backup_path = parent_dir
+        depth += 1
+    return backup_path / entry["path"]
+
+
+def _load_parent_manifest(parent_dir: Path, link: dict) -> tuple | None:
+    """Load a parent manifest (and a path index) if it matches the hash
+    recorded by the child; None otherwise."""
+    manifest_file = parent_dir / "backup-manifest.json"
+    try:
+        if hash_file(manifest_file)["sha256"] != link.get("manifest_sha256"):
+            return None
+        manifest = json.loads(manifest_file.read_text())
+    except (json.JSONDecodeError, OSError):
+        return None
+    return manifest, {f["path"]: f for f in manifest.get("files", [])}
+
+
 # ---------------------------------------------------------------------------
 # Helpers (public — used by MCP tool via import)
 # ---------------------------------------------------------------------------
 
 
 def sha256_file(path: Path) -> str:
-    """Compute SHA-256 hash of a file in 64KB chunks."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        while True:
-            chunk = f.read(65536)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+    """Compute SHA-256 hash of a file (shared hashing engine, 1 MiB reads)."""
+    return hash_file(path)["sha256"]
 
 
 def human_size(nbytes: int) -> str:
@@ -371,15 +895,21 @@ def scan_case_dir(case_dir: Path) -> dict:
     symlinks = []
 
     for root, dirs, files in os.walk(case_dir, followlinks=True):
-        # Filter out skip names
-        dirs[:] = [d for d in dirs if d not in _SKIP_NAMES]
-
+        # Filter out skip names and the case's caches
         root_path = Path(root)
+        rel_root = root_path.relative_to(case_dir)
+        dirs[:] = [
+            d
+            for d in dirs
+            if d not in _SKIP_NAMES
+            and (rel_root / d).as_posix() not in CASE_CACHE_PATHS
+        ]
+
         for fname in files:
-            if fname in _SKIP_NAMES:
-                continue
             abs_path = root_path / fname
             rel_path = abs_path.relative_to(case_dir)
+            if fname in _SKIP_NAMES or rel_path.as_posix() in CASE_CACHE_PATHS:
+                continue
 
             try:
                 size = abs_path.stat().st_size
@@ -92,6 +92,18 @@ _FORENSIC_DENY_RULES = {
     # Sync with template (was in settings.json but missing here)
     "Edit(**/pending-reviews.json)",
     "Write(**/pending-reviews.json)",
+    # Interrupted-commit record: replayed by the CLI without a password
+    "Edit(**/.case-txn.json*)",
+    "Write(**/.case-txn.json*)",
+    # Journal-mode store saves: replayed over findings/timeline/iocs.json
+    "Edit(**/*.journal.jsonl)",
+    "Write(**/*.journal.jsonl)",
+    # Audit offset indexes: lookups trust them to locate audit entries
+    "Edit(**/audit/.index/**)",
+    "Write(**/audit/.index/**)",
+    # Evidence verification cache: quick verify trusts its fingerprints
+    "Edit(**/.evidence-verify.json)",
+    "Write(**/.evidence-verify.json)",
 }
 
 # Old forensic deny rules — removed during migration re-deploy
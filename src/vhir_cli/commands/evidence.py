@@ -1,9 +1,9 @@
 """Evidence management commands: lock, unlock, register, list, verify, log.
 
 Subcommand group:
-  vhir evidence register <path> [--description]
+  vhir evidence register <path> [--description] [--recursive]
   vhir evidence list
-  vhir evidence verify
+  vhir evidence verify [--full | --quick | --rolling BYTES]
   vhir evidence log [--path <filter>]
   vhir evidence lock
   vhir evidence unlock
@@ -16,16 +16,23 @@ Legacy aliases (backward compat):
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import stat
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 from vhir_cli.approval_auth import require_tty_confirmation
-from vhir_cli.case_io import get_case_dir
+from vhir_cli.case_io import EVIDENCE_VERIFY_CACHE, get_case_dir
+from vhir_cli.hashing import (
+    COURT_ALGORITHMS,
+    DEFAULT_ALGORITHMS,
+    format_throughput,
+    hash_file,
+    hash_files,
+)
 
 
 def cmd_evidence(args, identity: dict) -> None:
@@ -123,20 +130,28 @@ def cmd_unlock_evidence(args, identity: dict) -> None:
 
 
 def register_evidence_data(
-    case_dir, path: str, examiner: str, description: str = ""
+    case_dir,
+    path: str,
+    examiner: str,
+    description: str = "",
+    algorithms=DEFAULT_ALGORITHMS,
 ) -> dict:
     """Register an evidence file and return structured data.
 
-    Validates path, computes SHA-256, writes registry.
+    Validates path, computes SHA-256 (plus any extra digests in one read
+    pass), writes registry.
 
     Args:
         case_dir: Path to the active case directory.
         path: Path to the evidence file.
         examiner: Examiner identity slug.
         description: Optional description.
+        algorithms: Digests to record; SHA-256 is always included.
+            COURT_ALGORITHMS adds SHA-1 and MD5.
 
     Returns:
-        Dict with path, sha256, description, registered_at, registered_by.
+        Dict with path, sha256 (and sha1/md5 when requested), description,
+        registered_at, registered_by, bytes_hashed, seconds.
 
     Raises:
         FileNotFoundError: If evidence file doesn't exist.
@@ -158,45 +173,25 @@ def register_evidence_data(
     if evidence_path.is_dir():
         raise ValueError(
             f"'{path}' is a directory. evidence_register works on individual "
-            "files. Register key files individually, or use a container "
-            "file (VHDX, E01, 7z) for directory-based evidence."
+            "files. Register key files individually, use a container "
+            "file (VHDX, E01, 7z), or register the whole tree with "
+            "'vhir evidence register --recursive'."
         )
 
-    # Validate path is within case directory
-    resolved = evidence_path.resolve()
-    case_resolved = case_dir.resolve()
-    in_case = (
-        str(resolved).startswith(str(case_resolved) + os.sep)
-        or resolved == case_resolved
-    )
-    if not in_case:
-        # Resolved path is outside — check unresolved (symlink in case dir)
-        evidence_path_abs = (
-            evidence_path if evidence_path.is_absolute() else case_dir / evidence_path
-        )
-        normalized = Path(os.path.normpath(evidence_path_abs))
-        case_norm = Path(os.path.normpath(case_resolved))
-        if not (
-            str(normalized).startswith(str(case_norm) + os.sep)
-            or normalized == case_norm
-        ):
-            raise ValueError(
-                f"Evidence path must be within the case directory.\n"
-                f"  Path:     {evidence_path}\n"
-                f"  Resolved: {resolved}\n"
-                f"  Case dir: {case_resolved}\n"
-                f"Copy evidence into the case evidence directory first:\n"
-                f"  cp {evidence_path} {case_dir / 'evidence' / evidence_path.name}\n"
-                f"Or create a symlink:\n"
-                f"  ln -s {resolved} {case_dir / 'evidence' / evidence_path.name}"
-            )
-
-    # Compute SHA256
-    sha = hashlib.sha256()
-    with open(evidence_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha.update(chunk)
-    file_hash = sha.hexdigest()
+    resolved = _resolve_in_case(case_dir, evidence_path)
+
+    # Compute SHA256 (and any extra digests) in one read. Fingerprint
+    # first so a write racing the hash shows up as a change next verify.
+    algorithms = _with_sha256(algorithms)
+    fingerprint = _fingerprint(evidence_path)
+    start = time.monotonic()
+    digests = hash_file(evidence_path, algorithms)
+    stats = {
+        "bytes_hashed": evidence_path.stat().st_size,
+        "seconds": time.monotonic() - start,
+    }
+    file_hash = digests["sha256"]
+    extra_digests = {k: v for k, v in digests.items() if k != "sha256"}
 
     # Record in evidence registry
     reg_file = case_dir / "evidence.json"
@@ -212,13 +207,31 @@ def register_evidence_data(
     for existing in registry.get("files", []):
         if existing.get("path") == str(resolved):
             if existing.get("sha256") == file_hash:
+                missing = {
+                    k: v for k, v in extra_digests.items() if existing.get(k) != v
+                }
+                if missing:
+                    # Same file; record newly requested digests
+                    existing.update(missing)
+                    _atomic_write(
+                        reg_file,
+                        json.dumps(registry, indent=2, default=str),
+                    )
+                _save_verification_cache(
+                    case_dir, {existing["path"]: _cache_record(existing, fingerprint)}
+                )
                 return {
                     **existing,
+                    **stats,
                     "note": "already registered (same path and hash)",
                 }
             else:
                 # Same path, different hash — file changed. Update entry.
                 existing["sha256"] = file_hash
+                for k in COURT_ALGORITHMS:
+                    if k != "sha256":
+                        existing.pop(k, None)
+                existing.update(extra_digests)
                 existing["registered_at"] = datetime.now(timezone.utc).isoformat()
                 existing["registered_by"] = examiner
                 if description:
@@ -227,14 +240,19 @@ def register_evidence_data(
                     reg_file,
                     json.dumps(registry, indent=2, default=str),
                 )
+                _save_verification_cache(
+                    case_dir, {existing["path"]: _cache_record(existing, fingerprint)}
+                )
                 return {
                     **existing,
+                    **stats,
                     "note": "updated (same path, hash changed)",
                 }
 
     entry = {
         "path": str(resolved),
         "sha256": file_hash,
+        **extra_digests,
         "description": description,
         "registered_at": datetime.now(timezone.utc).isoformat(),
         "registered_by": examiner,
@@ -242,20 +260,299 @@ def register_evidence_data(
     registry["files"].append(entry)
 
     _atomic_write(reg_file, json.dumps(registry, indent=2, default=str))
+    _save_verification_cache(
+        case_dir, {entry["path"]: _cache_record(entry, fingerprint)}
+    )
+
+    return {**entry, **stats}
+
+
+BULK_CHECKPOINT = 5000  # files hashed between registry writes
+
+
+def register_evidence_bulk_data(
+    case_dir,
+    path: str,
+    examiner: str,
+    description: str = "",
+    algorithms=DEFAULT_ALGORITHMS,
+    workers: int | None = None,
+    checkpoint: int = BULK_CHECKPOINT,
+    progress_fn=None,
+) -> dict:
+    """Register every file under a directory and return a summary.
+
+    Files are hashed concurrently and merged into evidence.json through a
+    path-keyed index, one atomic registry write per ``checkpoint`` files
+    (so an interrupted run keeps what it finished). Dedup follows
+    register_evidence_data: same path and hash is left alone (new digests
+    and fingerprint are recorded), same path with a new hash is updated.
+
+    Args:
+        case_dir: Path to the active case directory.
+        path: Directory to walk (relative paths resolve against case_dir).
+        examiner: Examiner identity slug.
+        description: Optional description applied to new entries.
+        algorithms: Digests to record; SHA-256 is always included.
+        workers: Hashing threads (default: hashing.DEFAULT_WORKERS).
+        checkpoint: Files per registry write.
+        progress_fn: Optional callback(label, done, total).
+
+    Returns:
+        Dict with root, files, registered, updated, unchanged, errors
+        (list of {path, error}), bytes_hashed, seconds.
+
+    Raises:
+        FileNotFoundError: If the directory doesn't exist.
+        ValueError: If path is not a directory or is outside the case.
+        OSError: If a registry write fails.
+    """
+    case_dir = Path(case_dir)
+    root = Path(path)
+    if not root.is_absolute():
+        root = case_dir / root
+    if not root.exists():
+        raise FileNotFoundError(f"Directory not found: {path}")
+    if not root.is_dir():
+        raise ValueError(f"'{path}' is not a directory")
+    root_resolved = _resolve_in_case(case_dir, root)
+
+    # Walk the tree; symlinks must still land inside the case directory
+    errors: list[dict] = []
+    targets: list[tuple[Path, Path]] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            file_path = Path(dirpath) / name
+            try:
+                if file_path.is_file():
+                    targets.append((file_path, _resolve_in_case(case_dir, file_path)))
+            except (ValueError, OSError) as e:
+                errors.append({"path": str(file_path), "error": str(e).split("\n")[0]})
+
+    algorithms = _with_sha256(algorithms)
+    checkpoint = max(1, checkpoint)
+    counts = {"registered": 0, "updated": 0, "unchanged": 0}
+    bytes_hashed = 0
+    seconds = 0.0
+
+    for start in range(0, len(targets), checkpoint):
+        batch = targets[start : start + checkpoint]
+        fingerprints = {}
+        for file_path, _ in batch:
+            try:
+                fingerprints[str(file_path)] = _fingerprint(file_path)
+            except OSError:
+                pass  # reported by the hash pass
+        batch_progress = None
+        if progress_fn:
+
+            def batch_progress(label, i, _n, offset=start):
+                progress_fn(label, offset + i, len(targets))
+
+        report = hash_files(
+            [p for p, _ in batch],
+            algorithms,
+            workers=workers,
+            progress_fn=batch_progress,
+        )
+        bytes_hashed += report["bytes"]
+        seconds += report["seconds"]
+
+        entries = []
+        batch_fingerprints = {}
+        now = datetime.now(timezone.utc).isoformat()
+        for file_path, resolved in batch:
+            digests = report["results"].get(str(file_path), {})
+            if "error" in digests or str(file_path) not in fingerprints:
+                errors.append(
+                    {
+                        "path": str(file_path),
+                        "error": digests.get("error", "stat failed"),
+                    }
+                )
+                continue
+            entries.append(
+                {
+                    "path": str(resolved),
+                    **digests,
+                    "description": description,
+                    "registered_at": now,
+                    "registered_by": examiner,
+                }
+            )
+            batch_fingerprints[str(resolved)] = fingerprints[str(file_path)]
+        merged = _merge_registrations(case_dir, entries, batch_fingerprints)
+        for status, n in merged.items():
+            counts[status] += n
+
+    return {
+        "root": str(root_resolved),
+        "files": len(targets),
+        **counts,
+        "errors": errors,
+        "bytes_hashed": bytes_hashed,
+        "seconds": seconds,
+    }
+
+
+def _merge_registrations(
+    case_dir: Path, entries: list[dict], fingerprints: dict[str, dict]
+) -> dict:
+    """Merge new registry entries into evidence.json with one write.
+
+    The registry is re-read so registrations made since the last
+    checkpoint are kept, and is left untouched when every entry is
+    already registered with the same digests. fingerprints (by entry
+    path) go to the verification cache. Returns counts of
+    registered/updated/unchanged.
+    """
+    from vhir_cli.case_io import _atomic_write
+
+    counts = {"registered": 0, "updated": 0, "unchanged": 0}
+    if not entries:
+        return counts
+    reg_file = case_dir / "evidence.json"
+    try:
+        registry = json.loads(reg_file.read_text()) if reg_file.exists() else {}
+    except (json.JSONDecodeError, OSError):
+        registry = {}
+    files = registry.setdefault("files", [])
+    index = {e.get("path"): e for e in files}
+    dirty = False
+
+    for entry in entries:
+        existing = index.get(entry["path"])
+        if existing is None:
+            files.append(entry)
+            index[entry["path"]] = entry
+            counts["registered"] += 1
+            dirty = True
+        elif existing.get("sha256") == entry["sha256"]:
+            for k in COURT_ALGORITHMS:
+                if entry.get(k) and existing.get(k) != entry[k]:
+                    existing[k] = entry[k]
+                    dirty = True
+            counts["unchanged"] += 1
+        else:
+            for k in COURT_ALGORITHMS:
+                existing.pop(k, None)
+            description = entry["description"] or existing.get("description", "")
+            existing.update(entry, description=description)
+            counts["updated"] += 1
+            dirty = True
+
+    if dirty:
+        _atomic_write(reg_file, json.dumps(registry, indent=2, default=str))
+    _save_verification_cache(
+        case_dir,
+        {
+            path: _cache_record(index[path], fingerprint)
+            for path, fingerprint in fingerprints.items()
+        },
+    )
+    return counts
+
+
+def _resolve_in_case(case_dir: Path, evidence_path: Path) -> Path:
+    """Resolve an evidence path, requiring it to live in the case directory.
+
+    A symlink inside the case directory pointing elsewhere is accepted.
+
+    Raises:
+        ValueError: If the path is outside the case directory.
+    """
+    resolved = evidence_path.resolve()
+    case_resolved = case_dir.resolve()
+    in_case = (
+        str(resolved).startswith(str(case_resolved) + os.sep)
+        or resolved == case_resolved
+    )
+    if not in_case:
+        # Resolved path is outside — check unresolved (symlink in case dir)
+        evidence_path_abs = (
+            evidence_path if evidence_path.is_absolute() else case_dir / evidence_path
+        )
+        normalized = Path(os.path.normpath(evidence_path_abs))
+        case_norm = Path(os.path.normpath(case_resolved))
+        if not (
+            str(normalized).startswith(str(case_norm) + os.sep)
+            or normalized == case_norm
+        ):
+            raise ValueError(
+                f"Evidence path must be within the case directory.\n"
+                f"  Path:     {evidence_path}\n"
+                f"  Resolved: {resolved}\n"
+                f"  Case dir: {case_resolved}\n"
+                f"Copy evidence into the case evidence directory first:\n"
+                f"  cp {evidence_path} {case_dir / 'evidence' / evidence_path.name}\n"
+                f"Or create a symlink:\n"
+                f"  ln -s {resolved} {case_dir / 'evidence' / evidence_path.name}"
+            )
 
-    return entry
+    return resolved
+
+
+def _with_sha256(algorithms) -> tuple[str, ...]:
+    """SHA-256 first (the registry key), then any extra requested digests."""
+    return ("sha256", *(a for a in dict.fromkeys(algorithms) if a != "sha256"))
+
+
+def _recorded_algorithms(entry: dict) -> tuple[str, ...]:
+    """Digests recorded for a registry entry, SHA-256 first."""
+    return _with_sha256(a for a in COURT_ALGORITHMS if entry.get(a))
+
+
+def _fingerprint(path: Path) -> dict:
+    """Stat fingerprint of an evidence file.
+
+    Any write bumps ctime, which user space cannot set back, so an
+    unchanged fingerprint means the content has not been rewritten.
+    """
+    st = path.stat()
+    return {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "ino": st.st_ino,
+        "ctime_ns": st.st_ctime_ns,
+    }
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as "500G", "1.5TB" or "1048576".
+
+    Raises:
+        ValueError: If the text is not a size.
+    """
+    units = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    value = text.strip().upper().removesuffix("B").removesuffix("I")
+    unit = value[-1:] if value[-1:] in units else ""
+    try:
+        number = float(value[: len(value) - len(unit)])
+    except ValueError:
+        raise ValueError(f"Invalid size: {text!r}") from None
+    if number < 0:
+        raise ValueError(f"Invalid size: {text!r}")
+    return int(number * units[unit])
 
 
 def cmd_register_evidence(args, identity: dict) -> None:
     """CLI wrapper — registers evidence and prints summary."""
     case_dir = get_case_dir(getattr(args, "case", None))
 
+    if getattr(args, "recursive", False):
+        _register_evidence_bulk(args, identity, case_dir)
+        return
+
     try:
         data = register_evidence_data(
             case_dir=case_dir,
             path=args.path,
             examiner=identity.get("examiner", identity.get("analyst", "")),
             description=args.description,
+            algorithms=COURT_ALGORITHMS
+            if getattr(args, "all_hashes", False)
+            else DEFAULT_ALGORITHMS,
         )
     except FileNotFoundError as e:
         print(str(e), file=sys.stderr)
@@ -274,7 +571,66 @@ def cmd_register_evidence(args, identity: dict) -> None:
 
     print(f"Registered: {data['path']}")
     print(f"  SHA256: {data['sha256']}")
+    if data.get("sha1"):
+        print(f"  SHA1:   {data['sha1']}")
+    if data.get("md5"):
+        print(f"  MD5:    {data['md5']}")
     print("  Integrity: SHA-256 hash recorded")
+    print(f"  Hashed {format_throughput(data['bytes_hashed'], data['seconds'])}")
+
+
+def _register_evidence_bulk(args, identity: dict, case_dir: Path) -> None:
+    """CLI body for register --recursive — one summary line per run."""
+
+    def progress(label: str, done: int, total: int) -> None:
+        if done == total or done % 1000 == 0:
+            print(f"  {label} {done}/{total}", file=sys.stderr)
+
+    try:
+        data = register_evidence_bulk_data(
+            case_dir=case_dir,
+            path=args.path,
+            examiner=identity.get("examiner", identity.get("analyst", "")),
+            description=args.description,
+            algorithms=COURT_ALGORITHMS
+            if getattr(args, "all_hashes", False)
+            else DEFAULT_ALGORITHMS,
+            progress_fn=progress,
+        )
+    except FileNotFoundError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except OSError as e:
+        print(f"Failed to write evidence registry: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    _log_evidence_action(
+        case_dir,
+        "register_bulk",
+        data["root"],
+        identity,
+        files=data["files"],
+        registered=data["registered"],
+        updated=data["updated"],
+        unchanged=data["unchanged"],
+        errors=len(data["errors"]),
+    )
+
+    print(f"Registered tree: {data['root']}")
+    print(
+        f"  {data['registered']} new, {data['updated']} updated, "
+        f"{data['unchanged']} unchanged, {len(data['errors'])} errors"
+    )
+    for err in data["errors"][:20]:
+        print(f"  ERROR {err['path']}: {err['error']}")
+    if len(data["errors"]) > 20:
+        print(f"  ... {len(data['errors']) - 20} more errors")
+    print(f"  Hashed {format_throughput(data['bytes_hashed'], data['seconds'])}")
+    if data["errors"]:
+        sys.exit(1)
 
 
 def _log_evidence_action(
@@ -353,38 +709,135 @@ def cmd_list_evidence(args, identity: dict) -> None:
     print(f"\n{len(files)} evidence file(s) registered")
 
 
-def verify_evidence_data(case_dir) -> dict:
+VERIFY_MODES = ("full", "quick", "rolling")
+
+
+def verify_evidence_data(
+    case_dir,
+    workers: int | None = None,
+    mode: str = "full",
+    budget: int | None = None,
+) -> dict:
     """Verify evidence integrity and return structured results.
 
+    Files are hashed concurrently; every digest recorded for an entry
+    (SHA-256 and, when registered with them, SHA-1/MD5) is checked from
+    the same read. Each file's stat fingerprint and last full
+    verification time are kept in the verification cache
+    (.evidence-verify.json); evidence.json is never written.
+
+    Modes:
+        full: rehash every file.
+        quick: rehash only files whose fingerprint changed; the rest
+            are reported OK with checked="fingerprint".
+        rolling: like quick, then also rehash the least recently
+            verified files until ``budget`` bytes have been read (at least
+            one file per run), so repeated runs cycle through the set.
+
     Args:
         case_dir: Path to the active case directory.
+        workers: Hashing threads (default: hashing.DEFAULT_WORKERS).
+        mode: One of VERIFY_MODES.
+        budget: Byte budget for rolling mode (required there).
 
     Returns:
-        Dict with "results" list and summary counts (verified, modified,
-        missing, errors).
+        Dict with "results" list, summary counts (verified, modified,
+        missing, errors, fingerprint_only) and throughput figures
+        (bytes_hashed, seconds).
 
     Raises:
+        ValueError: If mode is unknown or rolling mode lacks a budget.
         OSError: If registry can't be read.
     """
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"Unknown verify mode: {mode}")
+    if mode == "rolling" and budget is None:
+        raise ValueError("Rolling verification requires a byte budget")
+
     case_dir = Path(case_dir)
     reg_file = case_dir / "evidence.json"
+    empty = {
+        "results": [],
+        "verified": 0,
+        "modified": 0,
+        "missing": 0,
+        "errors": 0,
+        "fingerprint_only": 0,
+        "bytes_hashed": 0,
+        "seconds": 0.0,
+    }
 
     if not reg_file.exists():
-        return {"results": [], "verified": 0, "modified": 0, "missing": 0, "errors": 0}
+        return empty
 
     registry = json.loads(reg_file.read_text())
     files = registry.get("files", [])
     if not files:
-        return {"results": [], "verified": 0, "modified": 0, "missing": 0, "errors": 0}
+        return empty
+
+    cache = _load_verification_cache(case_dir)
+
+    def cached(entry: dict) -> dict:
+        record = cache.get(entry.get("path", ""))
+        if isinstance(record, dict) and record.get("sha256") == entry.get("sha256"):
+            return record
+        return {}
+
+    # Stat every entry; pick which present files need a full hash
+    stats: dict[str, dict | None] = {}
+    for entry in files:
+        path = entry.get("path", "")
+        try:
+            stats[path] = _fingerprint(Path(path)) if path else None
+        except OSError:
+            stats[path] = None
+    present = [e for e in files if stats[e.get("path", "")] is not None]
+    if mode == "full":
+        to_hash = present
+    else:
+        to_hash = [
+            e for e in present if cached(e).get("fingerprint") != stats[e["path"]]
+        ]
+        if mode == "rolling":
+            spent = 0
+            chosen = {id(e) for e in to_hash}
+            stale = sorted(
+                (e for e in present if id(e) not in chosen),
+                key=lambda e: cached(e).get("verified_at") or "",
+            )
+            for entry in stale:
+                size = stats[entry["path"]]["size"]
+                if spent and spent + size > budget:
+                    break
+                to_hash.append(entry)
+                spent += size
+    hash_paths = {e["path"] for e in to_hash}
+
+    # Hash, grouped by the digests recorded for each entry
+    groups: dict[tuple[str, ...], list[str]] = {}
+    for entry in to_hash:
+        groups.setdefault(_recorded_algorithms(entry), []).append(entry["path"])
+    actual: dict[str, dict] = {}
+    bytes_hashed = 0
+    seconds = 0.0
+    for algorithms, paths in groups.items():
+        report = hash_files(paths, algorithms, workers=workers)
+        actual.update(report["results"])
+        bytes_hashed += report["bytes"]
+        seconds += report["seconds"]
 
     results = []
-    verified = modified = missing = errors = 0
+    verified = modified = missing = errors = fingerprint_only = 0
+    verified_at = datetime.now(timezone.utc).isoformat()
+    fresh: dict[str, dict] = {}
 
     for entry in files:
-        path = Path(entry.get("path", ""))
+        key = entry.get("path", "")
+        path = Path(key)
         expected_hash = entry.get("sha256", "")
+        digests = actual.get(key)
 
-        if not path.exists():
+        if stats[key] is None:
             results.append(
                 {
                     "path": str(path),
@@ -396,45 +849,56 @@ def verify_evidence_data(case_dir) -> dict:
             missing += 1
             continue
 
-        try:
-            sha = hashlib.sha256()
-            with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha.update(chunk)
-            actual_hash = sha.hexdigest()
-        except OSError as e:
+        if key not in hash_paths:
             results.append(
                 {
                     "path": str(path),
-                    "status": "ERROR",
+                    "status": "OK",
                     "expected_hash": expected_hash,
                     "actual_hash": None,
-                    "error": str(e),
+                    "checked": "fingerprint",
+                    "verified_at": cached(entry).get("verified_at"),
                 }
             )
-            errors += 1
+            verified += 1
+            fingerprint_only += 1
             continue
 
-        if actual_hash == expected_hash:
+        if digests is None or "error" in digests:
             results.append(
                 {
                     "path": str(path),
-                    "status": "OK",
-                    "expected_hash": expected_hash,
-                    "actual_hash": actual_hash,
-                }
-            )
-            verified += 1
-        else:
-            results.append(
-                {
-                    "path": str(path),
-                    "status": "MODIFIED",
+                    "status": "ERROR",
                     "expected_hash": expected_hash,
-                    "actual_hash": actual_hash,
+                    "actual_hash": None,
+                    "error": (digests or {}).get("error", "not hashed"),
                 }
             )
+            errors += 1
+            continue
+
+        mismatched = [a for a in digests if digests[a] != entry.get(a)]
+        result = {
+            "path": str(path),
+            "status": "MODIFIED" if mismatched else "OK",
+            "expected_hash": expected_hash,
+            "actual_hash": digests["sha256"],
+            "checked": "hash",
+        }
+        if len(digests) > 1:
+            result["algorithms"] = list(digests)
+        if mismatched:
+            result["mismatched"] = mismatched
             modified += 1
+        else:
+            # Only a clean hash refreshes the cache; a modified file keeps
+            # its old fingerprint so every later quick run flags it again.
+            fresh[key] = _cache_record(entry, stats[key], verified_at)
+            verified += 1
+        results.append(result)
+
+    if fresh:
+        _save_verification_cache(case_dir, fresh)
 
     return {
         "results": results,
@@ -442,15 +906,75 @@ def verify_evidence_data(case_dir) -> dict:
         "modified": modified,
         "missing": missing,
         "errors": errors,
+        "fingerprint_only": fingerprint_only,
+        "bytes_hashed": bytes_hashed,
+        "seconds": seconds,
     }
 
 
+def _cache_record(
+    entry: dict, fingerprint: dict, verified_at: str | None = None
+) -> dict:
+    """Verification cache record for a registry entry hashed clean."""
+    return {
+        "sha256": entry.get("sha256"),
+        "fingerprint": fingerprint,
+        "verified_at": verified_at or datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def _load_verification_cache(case_dir: Path) -> dict[str, dict]:
+    """Verification cache records by registry path ({} if absent or unreadable)."""
+    try:
+        data = json.loads((case_dir / EVIDENCE_VERIFY_CACHE).read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_verification_cache(case_dir: Path, records: dict[str, dict]) -> None:
+    """Merge records into the verification cache.
+
+    The cache is re-read first so records written by a concurrent run are
+    kept. A record only counts while its SHA-256 matches the registry
+    entry, so a re-registered file is rehashed. The cache is advisory:
+    failures warn and the next run simply rehashes more.
+    """
+    from vhir_cli.case_io import _atomic_write
+
+    if not records:
+        return
+    cache = _load_verification_cache(case_dir)
+    cache.update(records)
+    try:
+        _atomic_write(
+            case_dir / EVIDENCE_VERIFY_CACHE, json.dumps(cache, indent=2, default=str)
+        )
+    except OSError as e:
+        print(
+            f"WARNING: failed to update evidence verification cache: {e}",
+            file=sys.stderr,
+        )
+
+
 def cmd_verify_evidence(args, identity: dict) -> None:
     """CLI wrapper — prints formatted verification results."""
     case_dir = get_case_dir(getattr(args, "case", None))
 
+    mode = "full"
+    budget = None
+    if getattr(args, "quick", False):
+        mode = "quick"
+    elif getattr(args, "rolling", None):
+        mode = "rolling"
+        try:
+            budget = parse_size(args.rolling)
+        except ValueError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+
     try:
-        data = verify_evidence_data(case_dir)
+        data = verify_evidence_data(case_dir, mode=mode, budget=budget)
     except (json.JSONDecodeError, OSError) as e:
         print(f"Failed to read evidence registry: {e}", file=sys.stderr)
         sys.exit(1)
@@ -464,16 +988,26 @@ def cmd_verify_evidence(args, identity: dict) -> None:
     print("-" * 70)
 
     for r in results:
-        print(f"{r['status']:<12} {r['path']}")
+        cached = " (fingerprint unchanged)" if r.get("checked") == "fingerprint" else ""
+        print(f"{r['status']:<12} {r['path']}{cached}")
         if r["status"] == "MODIFIED":
             print(f"             Expected: {r['expected_hash']}")
             print(f"             Actual:   {r['actual_hash']}")
+            if r.get("mismatched", ["sha256"]) != ["sha256"]:
+                print(f"             Mismatched: {', '.join(r['mismatched'])}")
         elif r["status"] == "ERROR" and r.get("error"):
             print(f"             Error: {r['error']}")
 
     print(
         f"\n{data['verified']} verified, {data['modified']} MODIFIED, {data['missing']} missing, {data['errors']} errors"
     )
+    if data["fingerprint_only"]:
+        print(
+            f"{data['fingerprint_only']} file(s) checked by fingerprint only "
+            "(use --full to rehash everything)"
+        )
+    if data["bytes_hashed"]:
+        print(f"Hashed {format_throughput(data['bytes_hashed'], data['seconds'])}")
     if data["modified"]:
         print("ALERT: Evidence files have been modified since registration.")
         sys.exit(2)
@@ -11,14 +11,16 @@ from pathlib import Path
 
 from vhir_cli.approval_auth import require_confirmation
 from vhir_cli.case_io import (
+    CaseModel,
+    CaseTransaction,
+    approval_log_entry,
     check_case_file_integrity,
-    find_draft_item,
+    commit_transaction,
+    coupled_items,
     get_case_dir,
     load_findings,
+    load_iocs,
     load_timeline,
-    save_findings,
-    save_timeline,
-    write_approval_log,
 )
 
 
@@ -47,10 +49,11 @@ def cmd_reject(args, identity: dict) -> None:
     check_case_file_integrity(case_dir, "timeline.json")
     findings = load_findings(case_dir)
     timeline = load_timeline(case_dir)
+    model = CaseModel({"findings.json": findings, "timeline.json": timeline})
     to_reject = []
 
     for item_id in args.ids:
-        item = find_draft_item(item_id, findings, timeline)
+        item = model.find_draft(item_id)
         if item is None:
             print(f"  {item_id}: not found or not DRAFT", file=sys.stderr)
             continue
@@ -70,13 +73,13 @@ def cmd_reject(args, identity: dict) -> None:
 
     # Reload from disk to preserve any concurrent MCP writes
     reject_ids = [item["id"] for item in to_reject]
-    findings = load_findings(case_dir)
-    timeline = load_timeline(case_dir)
+    model = CaseModel.load(case_dir, iocs=False)
+    findings, timeline = model.findings, model.timeline
 
     now = datetime.now(timezone.utc).isoformat()
     rejected = []
     for item_id in reject_ids:
-        item = find_draft_item(item_id, findings, timeline)
+        item = model.find_draft(item_id)
         if item is None:
             continue
         item["status"] = "REJECTED"
@@ -92,10 +95,9 @@ def cmd_reject(args, identity: dict) -> None:
         return
 
     # Timeline rejection coupling: auto-created events follow their finding
-    for tl_event in timeline:
-        auto_from = tl_event.get("auto_created_from", "")
-        if not auto_from or auto_from not in rejected:
-            continue
+    iocs = load_iocs(case_dir)
+    linked_tl, linked_iocs = coupled_items(case_dir, rejected, timeline, iocs)
+    for tl_event in linked_tl:
         if tl_event.get("examiner_modifications"):
             continue
         tl_event["status"] = "REJECTED"
@@ -106,22 +108,17 @@ def cmd_reject(args, identity: dict) -> None:
         rejected.append(tl_event["id"])
 
     # IOC rejection coupling
-    from vhir_cli.case_io import load_iocs, save_iocs
-
     # Build lookup for all finding statuses
     all_findings = load_findings(case_dir)
     finding_status = {fi["id"]: fi.get("status", "DRAFT") for fi in all_findings}
     for rid in rejected:
         finding_status[rid] = "REJECTED"
 
-    iocs = load_iocs(case_dir)
     iocs_modified = False
-    for ioc in iocs:
+    for ioc in linked_iocs:
         if ioc.get("manually_reviewed"):
             continue
         source_ids = ioc.get("source_findings", [])
-        if not source_ids:
-            continue
         all_rejected = all(
             finding_status.get(sid, "DRAFT") == "REJECTED" for sid in source_ids
         )
@@ -134,33 +131,23 @@ def cmd_reject(args, identity: dict) -> None:
             iocs_modified = True
             rejected.append(ioc["id"])
 
-    # Step 1: Persist primary data FIRST
-    try:
-        save_findings(case_dir, findings)
-        save_timeline(case_dir, timeline)
-        if iocs_modified:
-            save_iocs(case_dir, iocs)
-    except OSError as e:
-        print(f"CRITICAL: Failed to save case data: {e}", file=sys.stderr)
-        print(
-            "No changes were committed. Retry after fixing the issue.", file=sys.stderr
-        )
-        sys.exit(1)
-
-    # Step 2: Audit log (best-effort)
-    log_failures = []
-    for item_id in rejected:
-        if not write_approval_log(
-            case_dir, item_id, "REJECTED", identity, reason=reason, mode=mode
-        ):
-            log_failures.append(item_id)
+    # Case data and approval log commit as one transaction
+    txn = CaseTransaction(case_dir)
+    txn.save_store("findings.json", findings)
+    txn.save_store("timeline.json", timeline)
+    if iocs_modified:
+        txn.save_store("iocs.json", iocs)
+    log_entries = [
+        approval_log_entry(item_id, "REJECTED", identity, reason=reason, mode=mode)
+        for item_id in rejected
+    ]
+    txn.append_approval_logs(log_entries)
+    commit_transaction(txn)
 
     msg = f"Rejected: {', '.join(rejected)}"
     if reason:
         msg += f" — reason: {reason}"
     print(msg)
-    if log_failures:
-        print(f"  WARNING: Approval log failed for: {', '.join(log_failures)}")
 
 
 def _interactive_reject(case_dir: Path, identity: dict, config_path: Path) -> None:
@@ -215,13 +202,13 @@ def _interactive_reject(case_dir: Path, identity: dict, config_path: Path) -> No
         return
 
     # Reload and apply
-    findings = load_findings(case_dir)
-    timeline = load_timeline(case_dir)
+    model = CaseModel.load(case_dir, iocs=False)
+    findings, timeline = model.findings, model.timeline
     now = datetime.now(timezone.utc).isoformat()
     rejected = []
 
     for item_id, reason in to_reject:
-        item = find_draft_item(item_id, findings, timeline)
+        item = model.find_draft(item_id)
         if item is None:
             continue
         item["status"] = "REJECTED"
@@ -237,10 +224,9 @@ def _interactive_reject(case_dir: Path, identity: dict, config_path: Path) -> No
         return
 
     # Timeline rejection coupling
-    for tl_event in timeline:
-        auto_from = tl_event.get("auto_created_from", "")
-        if not auto_from or auto_from not in rejected:
-            continue
+    iocs = load_iocs(case_dir)
+    linked_tl, linked_iocs = coupled_items(case_dir, rejected, timeline, iocs)
+    for tl_event in linked_tl:
         if tl_event.get("examiner_modifications"):
             continue
         tl_event["status"] = "REJECTED"
@@ -251,22 +237,17 @@ def _interactive_reject(case_dir: Path, identity: dict, config_path: Path) -> No
         rejected.append(tl_event["id"])
 
     # IOC rejection coupling (interactive)
-    from vhir_cli.case_io import load_iocs, save_iocs
-
     # Build lookup for all finding statuses
     all_findings_2 = load_findings(case_dir)
     finding_status_2 = {fi["id"]: fi.get("status", "DRAFT") for fi in all_findings_2}
     for rid in rejected:
         finding_status_2[rid] = "REJECTED"
 
-    iocs = load_iocs(case_dir)
     iocs_modified = False
-    for ioc in iocs:
+    for ioc in linked_iocs:
         if ioc.get("manually_reviewed"):
             continue
         source_ids = ioc.get("source_findings", [])
-        if not source_ids:
-            continue
         all_rejected = all(
             finding_status_2.get(sid, "DRAFT") == "REJECTED" for sid in source_ids
         )
@@ -279,60 +260,49 @@ def _interactive_reject(case_dir: Path, identity: dict, config_path: Path) -> No
             iocs_modified = True
             rejected.append(ioc["id"])
 
-    # Step 1: Persist primary data FIRST
-    try:
-        save_findings(case_dir, findings)
-        save_timeline(case_dir, timeline)
-        if iocs_modified:
-            save_iocs(case_dir, iocs)
-    except OSError as e:
-        print(f"CRITICAL: Failed to save case data: {e}", file=sys.stderr)
-        print(
-            "No changes were committed. Retry after fixing the issue.", file=sys.stderr
-        )
-        sys.exit(1)
-
-    # Step 2: Audit log (best-effort)
-    log_failures = []
-    for item_id, reason in to_reject:
-        if item_id in rejected and not write_approval_log(
-            case_dir, item_id, "REJECTED", identity, reason=reason, mode=mode
-        ):
-            log_failures.append(item_id)
+    # Case data and approval log commit as one transaction
+    txn = CaseTransaction(case_dir)
+    txn.save_store("findings.json", findings)
+    txn.save_store("timeline.json", timeline)
+    if iocs_modified:
+        txn.save_store("iocs.json", iocs)
+    rejected_ids = set(rejected)
+    log_entries = [
+        approval_log_entry(item_id, "REJECTED", identity, reason=reason, mode=mode)
+        for item_id, reason in to_reject
+        if item_id in rejected_ids
+    ]
     # Coupled timeline events also need audit log entries
     for tl_event in timeline:
-        if (
-            tl_event.get("auto_created_from")
-            and tl_event["id"] in rejected
-            and not write_approval_log(
-                case_dir,
-                tl_event["id"],
-                "REJECTED",
-                identity,
-                reason="Source finding rejected",
-                mode=mode,
+        if tl_event.get("auto_created_from") and tl_event["id"] in rejected_ids:
+            log_entries.append(
+                approval_log_entry(
+                    tl_event["id"],
+                    "REJECTED",
+                    identity,
+                    reason="Source finding rejected",
+                    mode=mode,
+                )
             )
-        ):
-            log_failures.append(tl_event["id"])
     # Cascaded IOC rejections also need audit log entries
     for ioc in iocs:
         if (
-            ioc["id"] in rejected
+            ioc["id"] in rejected_ids
             and ioc.get("rejection_reason") == "All source findings rejected"
-            and not write_approval_log(
-                case_dir,
-                ioc["id"],
-                "REJECTED",
-                identity,
-                reason="All source findings rejected",
-                mode=mode,
-            )
         ):
-            log_failures.append(ioc["id"])
+            log_entries.append(
+                approval_log_entry(
+                    ioc["id"],
+                    "REJECTED",
+                    identity,
+                    reason="All source findings rejected",
+                    mode=mode,
+                )
+            )
+    txn.append_approval_logs(log_entries)
+    commit_transaction(txn)
 
     print(f"\nRejected {len(rejected)} item(s): {', '.join(rejected)}")
-    if log_failures:
-        print(f"  WARNING: Approval log failed for: {', '.join(log_failures)}")
 
 
 def _display_item(item: dict) -> None:
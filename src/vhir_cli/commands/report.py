@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import json
 import os
-import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -25,6 +24,7 @@ from vhir_cli.case_io import (
     load_timeline,
     load_todos,
 )
+from vhir_cli.ioc_extract import extract_iocs, index_iocs, load_ioc_index
 
 
 def cmd_report(args, identity: dict) -> None:
@@ -112,49 +112,22 @@ def _status_counts(items: list[dict]) -> dict[str, int]:
     return counts
 
 
-def _extract_all_iocs(findings: list[dict]) -> dict[str, list[str]]:
-    """Extract IOCs from findings, returning type -> sorted unique values."""
-    collected: dict[str, set[str]] = {}
-
-    for f in findings:
-        iocs_field = f.get("iocs")
-        if isinstance(iocs_field, dict):
-            for ioc_type, values in iocs_field.items():
-                if ioc_type not in collected:
-                    collected[ioc_type] = set()
-                if isinstance(values, list):
-                    collected[ioc_type].update(str(v) for v in values)
-                else:
-                    collected[ioc_type].add(str(values))
-        elif isinstance(iocs_field, list):
-            for ioc in iocs_field:
-                if isinstance(ioc, dict):
-                    ioc_type = ioc.get("type", "Unknown")
-                    ioc_value = ioc.get("value", "")
-                    if ioc_type not in collected:
-                        collected[ioc_type] = set()
-                    collected[ioc_type].add(str(ioc_value))
-
-        # Text extraction from observation/interpretation
-        text = f"{f.get('observation', '')} {f.get('interpretation', '')}"
-        ipv4_pattern = r"\b(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\b"
-        for ip in re.findall(ipv4_pattern, text):
-            if not ip.startswith(("0.", "127.", "255.")):
-                collected.setdefault("IPv4", set()).add(ip)
-        for h in re.findall(r"\b[a-fA-F0-9]{64}\b", text):
-            collected.setdefault("SHA256", set()).add(h.lower())
-        for h in re.findall(r"(?<![a-fA-F0-9])[a-fA-F0-9]{40}(?![a-fA-F0-9])", text):
-            collected.setdefault("SHA1", set()).add(h.lower())
-        for h in re.findall(r"(?<![a-fA-F0-9])[a-fA-F0-9]{32}(?![a-fA-F0-9])", text):
-            collected.setdefault("MD5", set()).add(h.lower())
-        for fp in re.findall(r"[A-Z]:\\(?:[^\s,;]+)", text):
-            collected.setdefault("File", set()).add(fp)
-        for d in re.findall(
-            r"\b(?:[a-zA-Z0-9-]+\.)+(?:com|net|org|io|ru|cn|info|biz|xyz|top|cc|tk)\b",
-            text,
-        ):
-            collected.setdefault("Domain", set()).add(d.lower())
+def _extract_all_iocs(
+    findings: list[dict], case_dir: Path | None = None
+) -> dict[str, list[str]]:
+    """Extract IOCs from findings, returning type -> sorted unique values.
 
+    With case_dir, findings are read from the case's IOC index instead of
+    being scanned (the list must come from that case's findings.json).
+    """
+    if case_dir is None:
+        collected = extract_iocs(findings)
+    else:
+        ids = [f.get("id") for f in findings]
+        collected = index_iocs(load_ioc_index(case_dir), finding_ids=ids)
+        unindexed = [f for f, fid in zip(findings, ids, strict=True) if not fid]
+        for ioc_type, values in extract_iocs(unindexed).items():
+            collected.setdefault(ioc_type, set()).update(values)
     return {k: sorted(v) for k, v in sorted(collected.items())}
 
 
@@ -189,7 +162,7 @@ def _report_full(case_dir: Path, args) -> None:
         },
         "approved_findings": approved_findings,
         "approved_timeline": approved_timeline,
-        "iocs": _extract_all_iocs(approved_findings),
+        "iocs": _extract_all_iocs(approved_findings, case_dir),
     }
 
     output = json.dumps(report, indent=2, default=str)
@@ -206,7 +179,9 @@ def _report_executive_summary(case_dir: Path, args) -> None:
 
     f_counts = _status_counts(findings)
     t_counts = _status_counts(timeline)
-    iocs = _extract_all_iocs([f for f in findings if f.get("status") == "APPROVED"])
+    iocs = _extract_all_iocs(
+        [f for f in findings if f.get("status") == "APPROVED"], case_dir
+    )
     total_iocs = sum(len(v) for v in iocs.values())
 
     lines = []
@@ -285,7 +260,7 @@ def _report_ioc(case_dir: Path, args) -> None:
         print("No approved findings with IOCs.")
         return
 
-    iocs = _extract_all_iocs(approved)
+    iocs = _extract_all_iocs(approved, case_dir)
     if not iocs:
         print("No IOCs found in approved findings.")
         return
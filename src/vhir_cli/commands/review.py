@@ -15,20 +15,20 @@ Supports multiple view modes:
 from __future__ import annotations
 
 import json
-import re
 import sys
 from pathlib import Path
 
+from vhir_cli.audit_io import lookup_audit_entries, tail_audit_entries
 from vhir_cli.case_io import (
     get_case_dir,
     hmac_text,
-    load_audit_index,
     load_case_meta,
     load_findings,
     load_timeline,
     load_todos,
     verify_approval_integrity,
 )
+from vhir_cli.ioc_extract import index_iocs, load_ioc_index, lookup_ioc
 
 _EM_DASH = "\u2014"
 
@@ -42,6 +42,8 @@ def cmd_review(args, identity: dict) -> None:
         _show_findings_verify(case_dir, identity=identity, mine_only=mine_only)
     elif getattr(args, "todos", False):
         _show_todos(case_dir, open_only=getattr(args, "open", False))
+    elif getattr(args, "ioc_lookup", None):
+        _show_ioc_lookup(case_dir, args.ioc_lookup)
     elif getattr(args, "iocs", False):
         _show_iocs(case_dir)
     elif getattr(args, "timeline", False):
@@ -154,7 +156,9 @@ def _show_findings_detail(case_dir: Path) -> None:
         print("No findings recorded.")
         return
 
-    audit_index = load_audit_index(case_dir)
+    audit_index = lookup_audit_entries(
+        case_dir, (eid for f in findings for eid in f.get("audit_ids", []))
+    )
 
     for f in findings:
         print(f"\n{'=' * 60}")
@@ -250,7 +254,8 @@ def _show_findings_verify(
     mine_only: bool = False,
 ) -> None:
     """Cross-check findings against approvals.jsonl and verification ledger."""
-    results = verify_approval_integrity(case_dir)
+    texts: dict[str, str] = {}
+    results = verify_approval_integrity(case_dir, texts)
     if not results:
         print("No findings recorded.")
         return
@@ -292,27 +297,33 @@ def _show_findings_verify(
         print("WARNING: Some findings have status changes without approval records.")
 
     # --- Ledger reconciliation (no password needed) ---
-    _show_ledger_reconciliation(case_dir)
+    _show_ledger_reconciliation(case_dir, texts)
 
     # --- HMAC verification (requires password) ---
     _show_hmac_verification(case_dir, identity=identity, mine_only=mine_only)
 
 
-def _show_ledger_reconciliation(case_dir: Path) -> None:
-    """Show reconciliation between approved items and verification ledger."""
+def _show_ledger_reconciliation(
+    case_dir: Path, texts: dict[str, str] | None = None
+) -> None:
+    """Show reconciliation between approved items and verification ledger.
+
+    texts holds canonical text already computed for some items, by ID.
+    """
     try:
-        from vhir_cli.verification import read_ledger
+        from vhir_cli.verification import latest_entries
     except ImportError:
         return
 
     meta = load_case_meta(case_dir)
     case_id = meta.get("case_id", case_dir.name)
 
-    ledger = read_ledger(case_id)
+    ledger = latest_entries(case_id)
     if not ledger:
         print(f"\nVerification Ledger: no entries for case {case_id}")
         return
 
+    texts = texts or {}
     findings = load_findings(case_dir)
     timeline = load_timeline(case_dir)
     approved_findings = [f for f in findings if f.get("status") == "APPROVED"]
@@ -338,7 +349,7 @@ def _show_ledger_reconciliation(case_dir: Path) -> None:
             print(f"{item_id:<20} VERIFICATION_NO_FINDING")
             alerts += 1
         elif item and entry:
-            desc = hmac_text(item)
+            desc = texts.get(item_id) or hmac_text(item)
             snap = entry.get("content_snapshot", "")
             if desc != snap:
                 print(f"{item_id:<20} DESCRIPTION_MISMATCH")
@@ -360,7 +371,7 @@ def _show_hmac_verification(
     """Perform full HMAC verification with password prompt."""
     try:
         from vhir_cli.approval_auth import get_analyst_salt, getpass_prompt
-        from vhir_cli.verification import read_ledger, verify_items
+        from vhir_cli.verification import latest_entries, verify_items
     except ImportError:
         return
 
@@ -368,7 +379,7 @@ def _show_hmac_verification(
     case_id = meta.get("case_id", case_dir.name)
     config_path = Path.home() / ".vhir" / "config.yaml"
 
-    ledger = read_ledger(case_id)
+    ledger = latest_entries(case_id)
     if not ledger:
         return
 
@@ -415,21 +426,16 @@ def _show_iocs(case_dir: Path) -> None:
         print("No findings recorded.")
         return
 
-    groups = {"APPROVED": [], "DRAFT": [], "REJECTED": []}
-    for f in findings:
-        status = f.get("status", "DRAFT")
-        if status in groups:
-            groups[status].append(f)
-
     labels = {
         "APPROVED": "IOCs from Approved Findings",
         "DRAFT": "IOCs from Draft Findings (unverified)",
         "REJECTED": "IOCs from Rejected Findings",
     }
 
+    index = load_ioc_index(case_dir)
     any_iocs = False
     for status in ("APPROVED", "DRAFT", "REJECTED"):
-        iocs = _extract_iocs_from_findings(groups[status])
+        iocs = index_iocs(index, status=status)
         if not iocs:
             continue
         any_iocs = True
@@ -441,58 +447,16 @@ def _show_iocs(case_dir: Path) -> None:
         print("No IOCs found in findings.")
 
 
-def _extract_iocs_from_findings(findings: list[dict]) -> dict[str, set[str]]:
-    """Extract IOCs from a list of findings."""
-    collected: dict[str, set[str]] = {}
-
-    for f in findings:
-        iocs_field = f.get("iocs")
-        if isinstance(iocs_field, dict):
-            for ioc_type, values in iocs_field.items():
-                if ioc_type not in collected:
-                    collected[ioc_type] = set()
-                if isinstance(values, list):
-                    collected[ioc_type].update(str(v) for v in values)
-                else:
-                    collected[ioc_type].add(str(values))
-        elif isinstance(iocs_field, list):
-            for ioc in iocs_field:
-                if isinstance(ioc, dict):
-                    ioc_type = ioc.get("type", "Unknown")
-                    ioc_value = ioc.get("value", "")
-                    if ioc_type not in collected:
-                        collected[ioc_type] = set()
-                    collected[ioc_type].add(str(ioc_value))
-
-        text = f"{f.get('observation', '')} {f.get('interpretation', '')}"
-        _extract_text_iocs(text, collected)
-
-    return collected
-
-
-def _extract_text_iocs(text: str, collected: dict[str, set[str]]) -> None:
-    """Extract common IOC patterns from free text."""
-    ipv4_pattern = r"\b(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\b"
-    for ip in re.findall(ipv4_pattern, text):
-        if not ip.startswith(("0.", "127.", "255.")):
-            collected.setdefault("IPv4", set()).add(ip)
-
-    for h in re.findall(r"\b[a-fA-F0-9]{64}\b", text):
-        collected.setdefault("SHA256", set()).add(h.lower())
-
-    for h in re.findall(r"(?<![a-fA-F0-9])[a-fA-F0-9]{40}(?![a-fA-F0-9])", text):
-        collected.setdefault("SHA1", set()).add(h.lower())
-
-    for h in re.findall(r"(?<![a-fA-F0-9])[a-fA-F0-9]{32}(?![a-fA-F0-9])", text):
-        collected.setdefault("MD5", set()).add(h.lower())
-
-    for fp in re.findall(r"[A-Z]:\\(?:[^\s,;]+)", text):
-        collected.setdefault("File", set()).add(fp)
-
-    for d in re.findall(
-        r"\b(?:[a-zA-Z0-9-]+\.)+(?:com|net|org|io|ru|cn|info|biz|xyz|top|cc|tk)\b", text
-    ):
-        collected.setdefault("Domain", set()).add(d.lower())
+def _show_ioc_lookup(case_dir: Path, value: str) -> None:
+    """Show the findings that mention an IOC value."""
+    matches = lookup_ioc(load_ioc_index(case_dir), value)
+    if not matches:
+        print(f"No findings mention {value}.")
+        return
+    for ioc_type, matched, refs in matches:
+        print(f"{matched} ({ioc_type})")
+        for finding_id, status in sorted(refs.items()):
+            print(f"  {finding_id:<24} {status}")
 
 
 def _show_timeline(
@@ -591,53 +555,7 @@ def _show_evidence(case_dir: Path) -> None:
 
 def _show_audit(case_dir: Path, limit: int) -> None:
     """Show audit trail entries from audit/."""
-    entries = []
-
-    # Read from audit/
-    audit_dir = case_dir / "audit"
-    if audit_dir.is_dir():
-        for jsonl_file in audit_dir.glob("*.jsonl"):
-            try:
-                with open(jsonl_file, encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entries.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            print(
-                                f"  Warning: skipping corrupt audit line in {jsonl_file.name}",
-                                file=sys.stderr,
-                            )
-            except OSError as e:
-                print(f"  Warning: could not read {jsonl_file}: {e}", file=sys.stderr)
-                continue
-
-    # Read approvals
-    approvals_file = case_dir / "approvals.jsonl"
-    if approvals_file.exists():
-        try:
-            with open(approvals_file, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        print(
-                            "  Warning: skipping corrupt approval line", file=sys.stderr
-                        )
-                        continue
-                    entry["tool"] = "approval"
-                    entry["mcp"] = "vhir-cli"
-                    entries.append(entry)
-        except OSError as e:
-            print(f"  Warning: could not read {approvals_file}: {e}", file=sys.stderr)
-
-    entries.sort(key=lambda e: e.get("ts", ""))
-    entries = entries[-limit:]
+    entries = tail_audit_entries(case_dir, limit, review_labels=True)
 
     if not entries:
         print("No audit entries.")
@@ -0,0 +1,52 @@
+"""Cross-case search: vhir search TERM [TERM ...].
+
+Finds every case under the cases directory whose findings, IOCs or
+evidence hashes mention all of the given terms (an IP, hash, domain,
+file name or word), using the per-user search index.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+from vhir_cli.case_io import DEFAULT_CASES_DIR
+from vhir_cli.search_index import refresh_index, search
+
+
+def cmd_search(args, identity: dict) -> None:
+    """Search all cases for IOCs, evidence hashes and finding text."""
+    cases_dir = Path(
+        getattr(args, "cases_dir", None)
+        or os.environ.get("VHIR_CASES_DIR", DEFAULT_CASES_DIR)
+    )
+    if not cases_dir.is_dir():
+        print(f"No cases directory found: {cases_dir}", file=sys.stderr)
+        sys.exit(1)
+    limit = getattr(args, "limit", 50) or 50
+    if limit < 1:
+        print("Error: --limit must be a positive integer.", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        refresh_index(cases_dir, rebuild=getattr(args, "rebuild", False))
+        results = search(cases_dir, args.terms)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Search index unavailable: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    query = " ".join(args.terms)
+    if not results:
+        print(f"No cases mention {query}.")
+        return
+
+    cases = {r["case_id"] for r in results}
+    print(f"{len(results)} match(es) in {len(cases)} case(s) for {query}\n")
+    print(f"{'Case ID':<25} {'Reference':<30} Matched as")
+    print("-" * 80)
+    for r in results[:limit]:
+        print(f"{r['case_id']:<25} {r['ref']:<30} {', '.join(r['matches'])}")
+    if len(results) > limit:
+        print(f"... {len(results) - limit} more (use --limit)")
@@ -5,15 +5,20 @@ Export findings/timeline as JSON, merge incoming data with last-write-wins.
 
 from __future__ import annotations
 
+import gzip
+import io
 import json
 import os
 import sys
 from pathlib import Path
 
 from vhir_cli.case_io import (
-    export_bundle,
+    CaseError,
     get_case_dir,
-    import_bundle,
+    get_export_cursor,
+    import_bundle_stream,
+    save_export_cursor,
+    write_export_bundle,
 )
 
 
@@ -22,30 +27,53 @@ def cmd_export(args, identity: dict) -> None:
     case_dir = get_case_dir(getattr(args, "case", None))
     output_file = Path(getattr(args, "file", ""))
     since = getattr(args, "since", "") or ""
+    peer = getattr(args, "peer", None)
+    compact = getattr(args, "compact", False)
+    use_gzip = getattr(args, "gzip", False) or output_file.suffix == ".gz"
 
     if not output_file.name:
         print("--file is required for export", file=sys.stderr)
         sys.exit(1)
 
-    try:
-        bundle = export_bundle(case_dir, since=since)
-    except OSError as e:
-        print(f"Failed to read case data for export: {e}", file=sys.stderr)
-        sys.exit(1)
+    from_cursor = bool(peer and not since)
+    if from_cursor:
+        try:
+            since = get_export_cursor(case_dir, peer)
+        except CaseError as e:
+            print(f"Invalid --peer: {e}", file=sys.stderr)
+            sys.exit(1)
 
     try:
-        with open(output_file, "w") as f:
-            json.dump(bundle, f, indent=2, default=str)
-            f.flush()
-            os.fsync(f.fileno())
-    except (OSError, TypeError) as e:
+        with open(output_file, "wb") as raw:
+            sink = gzip.GzipFile(fileobj=raw, mode="wb") if use_gzip else raw
+            out = io.TextIOWrapper(sink, encoding="utf-8")
+            summary = write_export_bundle(case_dir, out, since=since, compact=compact)
+            out.flush()
+            out.detach()
+            if use_gzip:
+                sink.close()  # writes the gzip trailer; raw stays open
+            raw.flush()
+            os.fsync(raw.fileno())
+    except (OSError, TypeError, ValueError) as e:
         print(f"Failed to write export bundle to {output_file}: {e}", file=sys.stderr)
         sys.exit(1)
 
     print(f"Exported to {output_file}")
-    print(f"  Examiner: {bundle.get('examiner', '?')}")
-    print(f"  Findings: {len(bundle.get('findings', []))}")
-    print(f"  Timeline: {len(bundle.get('timeline', []))}")
+    print(f"  Examiner: {summary.get('examiner', '?')}")
+    print(f"  Findings: {summary.get('findings', 0)}")
+    print(f"  Timeline: {summary.get('timeline', 0)}")
+    if peer:
+        try:
+            save_export_cursor(
+                case_dir, peer, summary["latest"], summary["exported_at"]
+            )
+        except (CaseError, OSError) as e:
+            print(
+                f"  WARNING: export cursor for {peer} not saved: {e}", file=sys.stderr
+            )
+            return
+        if from_cursor:
+            print(f"  Changes since {since or 'case start'} (cursor for {peer})")
 
 
 def cmd_merge(args, identity: dict) -> None:
@@ -61,20 +89,18 @@ def cmd_merge(args, identity: dict) -> None:
         print(f"File not found: {input_file}", file=sys.stderr)
         sys.exit(1)
 
+    # The bundle is parsed and merged item by item; nothing is written
+    # unless the whole file parses.
     try:
-        with open(input_file) as f:
-            bundle = json.load(f)
+        with open(input_file, "rb") as f:
+            gzipped = f.read(2) == b"\x1f\x8b"
+        with (gzip.open if gzipped else open)(input_file, "rt", encoding="utf-8") as f:
+            result = import_bundle_stream(case_dir, f)
     except json.JSONDecodeError as e:
         print(f"Bundle file contains invalid JSON: {e}", file=sys.stderr)
         sys.exit(1)
-    except OSError as e:
-        print(f"Failed to read bundle file {input_file}: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        result = import_bundle(case_dir, bundle)
-    except OSError as e:
-        print(f"Failed to write merged data: {e}", file=sys.stderr)
+    except (OSError, EOFError) as e:
+        print(f"Failed to merge bundle file {input_file}: {e}", file=sys.stderr)
         sys.exit(1)
 
     if result.get("status") == "error":
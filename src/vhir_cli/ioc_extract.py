@@ -0,0 +1,393 @@
+"""IOC extraction shared by review and report.
+
+Every IOC type is registered once (name, regex, optional normalize/accept
+hooks) and all types are compiled into a single alternation of named
+groups, so each text is scanned in one pass instead of once per type.
+Container types (URLs, e-mail addresses, file paths, registry keys) can
+hold other indicators; their matched span is rescanned with the leaf
+types only, so "https://evil.com/x" yields both the URL and the domain.
+
+Extraction results are memoized per finding content hash, and each case
+keeps a materialized index of its findings' IOCs (<case_dir>/.ioc-index.json,
+see load_ioc_index) so IOC reports and value lookups scan no text at all
+while the findings are unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import ipaddress
+import json
+import os
+import re
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from vhir_cli.case_io import (
+    IOC_INDEX,
+    _store_signature,
+    compute_content_hash,
+    load_findings,
+)
+
+INDEX_FILE = IOC_INDEX
+_INDEX_VERSION = 1
+_MEMO_MAX = 20000
+
+# name -> (pattern, normalize, accept, container), in match priority order
+_REGISTRY: dict[str, tuple[str, Callable, Callable | None, bool]] = {}
+_compiled: tuple[re.Pattern, re.Pattern, str] | None = None
+_MEMO: dict[tuple[str, str], dict[str, frozenset[str]]] = {}
+
+
+def register_ioc_type(
+    name: str,
+    pattern: str,
+    normalize: Callable[[str], str] | None = None,
+    accept: Callable[[str], bool] | None = None,
+    container: bool = False,
+    before: str | None = None,
+) -> None:
+    """Add (or replace) an IOC type.
+
+    Args:
+        name: Type label used in results ("IPv4", "Domain", ...). Must be
+            a valid regex group name.
+        pattern: Regex without capturing groups (use (?:...)).
+        normalize: Maps a match to the stored value (default: as matched).
+        accept: Returns False to drop a match (e.g. loopback addresses).
+        container: Rescan matches for leaf (non-container) types.
+        before: Register ahead of this type; alternation order decides
+            which type wins when two patterns match at the same position.
+    """
+    global _compiled
+    if not name.isidentifier():
+        raise ValueError(f"IOC type name must be an identifier: {name!r}")
+    if re.compile(pattern).groups:
+        raise ValueError(f"IOC pattern for {name} must not capture groups")
+    entry = (pattern, normalize or str, accept, container)
+    _REGISTRY.pop(name, None)
+    if before is not None and before in _REGISTRY:
+        items = list(_REGISTRY.items())
+        pos = next(i for i, (key, _) in enumerate(items) if key == before)
+        items.insert(pos, (name, entry))
+        _REGISTRY.clear()
+        _REGISTRY.update(items)
+    else:
+        _REGISTRY[name] = entry
+    _compiled = None
+    _MEMO.clear()
+
+
+def ioc_types() -> list[str]:
+    """Registered IOC type names, in match priority order."""
+    return list(_REGISTRY)
+
+
+def _patterns() -> tuple[re.Pattern, re.Pattern, str]:
+    """(combined pattern, leaf-only pattern, registry fingerprint)."""
+    global _compiled
+    if _compiled is None:
+        full = "|".join(f"(?P<{n}>{spec[0]})" for n, spec in _REGISTRY.items())
+        leaf = "|".join(
+            f"(?P<{n}>{spec[0]})" for n, spec in _REGISTRY.items() if not spec[3]
+        )
+        fingerprint = hashlib.sha256(full.encode()).hexdigest()[:16]
+        _compiled = (re.compile(full), re.compile(leaf or "(?!)"), fingerprint)
+    return _compiled
+
+
+def extract_text_iocs(
+    text: str, collected: dict[str, set[str]] | None = None
+) -> dict[str, set[str]]:
+    """Add the IOCs found in free text to collected (type -> values)."""
+    if collected is None:
+        collected = {}
+    if text:
+        full, leaf, _ = _patterns()
+        _scan(full, leaf, text, collected)
+    return collected
+
+
+def _scan(
+    pattern: re.Pattern, leaf: re.Pattern, text: str, collected: dict[str, set[str]]
+) -> None:
+    for match in pattern.finditer(text):
+        name = match.lastgroup
+        _, normalize, accept, container = _REGISTRY[name]
+        value = match.group()
+        if accept is not None and not accept(value):
+            continue
+        value = normalize(value)
+        collected.setdefault(name, set()).add(value)
+        if container:
+            _scan(leaf, leaf, value, collected)  # e.g. the lowercased email
+
+
+def _structured_iocs(finding: dict, collected: dict[str, set[str]]) -> None:
+    """IOCs recorded in a finding's own "iocs" field (dict or list form)."""
+    iocs_field = finding.get("iocs")
+    if isinstance(iocs_field, dict):
+        for ioc_type, values in iocs_field.items():
+            bucket = collected.setdefault(ioc_type, set())
+            if isinstance(values, list):
+                bucket.update(str(v) for v in values)
+            else:
+                bucket.add(str(values))
+    elif isinstance(iocs_field, list):
+        for ioc in iocs_field:
+            if isinstance(ioc, dict):
+                ioc_type = ioc.get("type", "Unknown")
+                collected.setdefault(ioc_type, set()).add(str(ioc.get("value", "")))
+
+
+def _finding_text(finding: dict) -> str:
+    return f"{finding.get('observation', '')} {finding.get('interpretation', '')}"
+
+
+def finding_iocs(finding: dict) -> dict[str, frozenset[str]]:
+    """IOCs of one finding: its iocs field plus observation/interpretation.
+
+    Memoized per content hash for the life of the process.
+    """
+    key = (_patterns()[2], compute_content_hash(finding))
+    cached = _MEMO.get(key)
+    if cached is None:
+        collected: dict[str, set[str]] = {}
+        _structured_iocs(finding, collected)
+        extract_text_iocs(_finding_text(finding), collected)
+        if len(_MEMO) >= _MEMO_MAX:
+            _MEMO.clear()
+        cached = _MEMO[key] = {k: frozenset(v) for k, v in collected.items()}
+    return cached
+
+
+def extract_iocs(findings: Iterable[dict]) -> dict[str, set[str]]:
+    """Union of the IOCs of findings (type -> values)."""
+    collected: dict[str, set[str]] = {}
+    for finding in findings:
+        for ioc_type, values in finding_iocs(finding).items():
+            collected.setdefault(ioc_type, set()).update(values)
+    return collected
+
+
+# --- Case IOC index ---
+#
+# <case_dir>/.ioc-index.json materializes the IOCs of every finding:
+#   "findings": {finding_id: {"hash", "status", "iocs": {type: [values]}}}
+#   "iocs":     {type: {value: {finding_id: status}}}
+# with the stat signature of findings.json ("sig") and the registry
+# fingerprint. Saves never write the index: a findings save (or an outside
+# rewrite) moves the signature, and the next load refreshes the index,
+# re-extracting only findings whose content hash moved; a status change
+# reuses the stored IOCs. The index is a cache: not fsynced, skipped by
+# backups, and safe to delete.
+
+
+def _read_ioc_index(case_dir: Path) -> dict | None:
+    try:
+        data = json.loads((case_dir / INDEX_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        isinstance(data, dict)
+        and data.get("v") == _INDEX_VERSION
+        and data.get("registry") == _patterns()[2]
+        and isinstance(data.get("findings"), dict)
+        and isinstance(data.get("iocs"), dict)
+    ):
+        return data
+    return None
+
+
+def _write_ioc_index(case_dir: Path, index: dict) -> None:
+    path = case_dir / INDEX_FILE
+    tmp = path.with_name(INDEX_FILE + ".tmp")
+    try:
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the next load rebuilds it
+
+
+def _unindex_finding(index: dict, finding_id: str) -> None:
+    entry = index["findings"].pop(finding_id, None)
+    if not entry:
+        return
+    for ioc_type, values in entry["iocs"].items():
+        by_value = index["iocs"].get(ioc_type, {})
+        for value in values:
+            refs = by_value.get(value, {})
+            refs.pop(finding_id, None)
+            if not refs:
+                by_value.pop(value, None)
+        if not by_value:
+            index["iocs"].pop(ioc_type, None)
+
+
+def _index_finding(index: dict, finding: dict) -> str | None:
+    """(Re)index one finding; returns its ID, or None if it has none."""
+    finding_id = finding.get("id") if isinstance(finding, dict) else None
+    if not isinstance(finding_id, str) or not finding_id:
+        return None
+    content_hash = compute_content_hash(finding)
+    status = finding.get("status", "DRAFT")
+    entry = index["findings"].get(finding_id)
+    if entry and entry["hash"] == content_hash:
+        if entry["status"] == status:
+            return finding_id
+        iocs = entry["iocs"]  # only the status moved
+    else:
+        iocs = {k: sorted(v) for k, v in finding_iocs(finding).items()}
+    _unindex_finding(index, finding_id)
+    index["findings"][finding_id] = {
+        "hash": content_hash,
+        "status": status,
+        "iocs": iocs,
+    }
+    for ioc_type, values in iocs.items():
+        by_value = index["iocs"].setdefault(ioc_type, {})
+        for value in values:
+            by_value.setdefault(value, {})[finding_id] = status
+    return finding_id
+
+
+def _sync_ioc_index(index: dict, findings: list[dict]) -> None:
+    seen = {_index_finding(index, finding) for finding in findings}
+    for finding_id in [fid for fid in index["findings"] if fid not in seen]:
+        _unindex_finding(index, finding_id)
+
+
+def _current_ioc_index(case_dir: Path) -> tuple[dict, bool]:
+    """The case's IOC index brought up to date in memory, and whether the
+    stored copy (if any) was stale.
+    """
+    index = _read_ioc_index(case_dir) or {
+        "v": _INDEX_VERSION,
+        "registry": _patterns()[2],
+        "sig": None,
+        "findings": {},
+        "iocs": {},
+    }
+    signature = _store_signature(case_dir / "findings.json")
+    if index["sig"] == signature:
+        return index, False
+    _sync_ioc_index(index, load_findings(case_dir))
+    index["sig"] = signature
+    return index, True
+
+
+def load_ioc_index(case_dir: Path) -> dict:
+    """The case's IOC index, built or refreshed if findings.json moved."""
+    index, stale = _current_ioc_index(case_dir)
+    if stale:
+        _write_ioc_index(case_dir, index)
+    return index
+
+
+def peek_ioc_index(case_dir: Path) -> dict:
+    """Like load_ioc_index, but never writes .ioc-index.json.
+
+    For readers outside the case workflow (cross-case search): a current
+    stored index is reused, otherwise it is refreshed in memory only.
+    """
+    return _current_ioc_index(case_dir)[0]
+
+
+def index_iocs(
+    index: dict, finding_ids: Iterable[str] | None = None, status: str | None = None
+) -> dict[str, set[str]]:
+    """Indexed IOCs (type -> values), optionally only those mentioned by a
+    finding in finding_ids or by a finding with the given status.
+    """
+    wanted = set(finding_ids) if finding_ids is not None else None
+    collected: dict[str, set[str]] = {}
+    for ioc_type, by_value in index["iocs"].items():
+        for value, refs in by_value.items():
+            if wanted is not None and wanted.isdisjoint(refs):
+                continue
+            if status is not None and status not in refs.values():
+                continue
+            collected.setdefault(ioc_type, set()).add(value)
+    return collected
+
+
+def lookup_ioc(index: dict, value: str) -> list[tuple[str, str, dict[str, str]]]:
+    """(type, value, {finding_id: status}) for every indexed match of value.
+
+    Matches the value as given and in its normalized forms (lowercase,
+    compressed IPv6).
+    """
+    value = value.strip()
+    candidates = [value, value.lower()]
+    try:
+        candidates.append(ipaddress.ip_address(value).compressed)
+    except ValueError:
+        pass
+    matches = []
+    for ioc_type, by_value in index["iocs"].items():
+        for candidate in dict.fromkeys(candidates):
+            refs = by_value.get(candidate)
+            if refs:
+                matches.append((ioc_type, candidate, dict(refs)))
+                break
+    return matches
+
+
+# --- Built-in types ---
+
+
+def _public_ipv4(value: str) -> bool:
+    return not value.startswith(("0.", "127.", "255."))
+
+
+def _valid_ipv6(value: str) -> bool:
+    try:
+        addr = ipaddress.IPv6Address(value)
+    except ValueError:
+        return False  # times, MAC addresses and other colon runs
+    return not (addr.is_loopback or addr.is_unspecified)
+
+
+def _ipv6(value: str) -> str:
+    return ipaddress.IPv6Address(value).compressed
+
+
+def _url(value: str) -> str:
+    return value.rstrip(".,;:!?)]}'\"")
+
+
+_OCTET = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+_TLDS = (
+    "com|net|org|io|ru|cn|info|biz|xyz|top|cc|tk|co|uk|de|fr|nl|eu|jp|kr|in|br"
+    "|su|ir|kp|ua|by|us|ca|au|me|pw|ws|ml|ga|cf|gq|to|onion|online|site|club"
+    "|live|shop|store|app|dev|cloud|link|click|icu|buzz|vip|work|gov|edu|mil|int"
+)
+
+register_ioc_type("URL", r"\b(?:https?|ftp)://[^\s\"'<>]+", _url, container=True)
+register_ioc_type(
+    "Email",
+    r"\b[A-Za-z0-9._%+-]+@(?:[A-Za-z0-9-]+\.)+[A-Za-z]{2,}\b",
+    str.lower,
+    container=True,
+)
+register_ioc_type(
+    "Registry",
+    r"\b(?:HKEY_LOCAL_MACHINE|HKEY_CURRENT_USER|HKEY_CLASSES_ROOT|HKEY_USERS"
+    r"|HKEY_CURRENT_CONFIG|HKLM|HKCU|HKCR|HKU|HKCC)\\[^\s,;\"']+",
+    container=True,
+)
+register_ioc_type("File", r"[A-Z]:\\(?:[^\s,;]+)", container=True)
+register_ioc_type(
+    "IPv6",
+    r"(?<![\w:])(?:[0-9A-Fa-f]{0,4}:){2,7}[0-9A-Fa-f]{0,4}(?![\w:])",
+    _ipv6,
+    _valid_ipv6,
+)
+register_ioc_type("IPv4", rf"\b(?:{_OCTET}\.){{3}}{_OCTET}\b", accept=_public_ipv4)
+register_ioc_type("SHA256", r"\b[a-fA-F0-9]{64}\b", str.lower)
+register_ioc_type("SHA1", r"(?<![a-fA-F0-9])[a-fA-F0-9]{40}(?![a-fA-F0-9])", str.lower)
+register_ioc_type("MD5", r"(?<![a-fA-F0-9])[a-fA-F0-9]{32}(?![a-fA-F0-9])", str.lower)
+# TLDs match in lowercase only, so PascalCase identifiers such as
+# System.Link or Config.Me are not taken for domains
+register_ioc_type("Domain", rf"\b(?:[a-zA-Z0-9-]+\.)+(?:{_TLDS})\b", str.lower)
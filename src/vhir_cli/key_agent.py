@@ -0,0 +1,398 @@
+"""Opt-in local key agent: skip repeated PBKDF2 derivation of the HMAC key.
+
+Every approval, rehmac and ``review --verify`` derives the ledger HMAC key
+with 600,000 PBKDF2 iterations. ``vhir agent start`` pays that cost once:
+after the examiner unlocks it with their password on /dev/tty, a per-user
+daemon keeps the derived key in memory and listens on a 0600 Unix socket
+(in a 0700 directory) until it has been idle for the timeout.
+
+The agent never hands out the key, and the password never crosses the
+socket. Callers still prompt for the password on /dev/tty for every
+approval and answer a single-use challenge from the agent with
+HMAC(nonce, PBKDF2(password, agent salt)), using a cheap iteration count;
+the agent compares that against the verifier it derived at unlock and
+proves the same knowledge back, so a reply from anything that does not
+know the password is ignored. A wrong password counts toward the normal
+lockout, and the agent wipes the key and exits after three wrong
+passwords, so the socket cannot be used to guess the password cheaply.
+
+Clients only talk to the agent that ``vhir agent start`` recorded in
+~/.vhir/config.yaml (written after the password was verified locally),
+and both ends check the other's credentials with SO_PEERCRED: the agent
+refuses other UIDs, and clients refuse any listener that is not the
+recorded agent process.
+
+Every client call returns None when no agent is usable (not enabled, not
+running, stale after a password reset, other examiner, failed peer or
+proof check), and callers fall back to deriving the key themselves.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import socket
+import struct
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from vhir_cli.approval_auth import _load_config, _save_config
+
+AGENT_DIR = Path.home() / ".vhir" / "agent"
+AGENT_CONFIG = Path.home() / ".vhir" / "config.yaml"
+DEFAULT_IDLE_TIMEOUT = 900  # seconds
+_MAX_FAILURES = 3
+_MAX_REQUEST = 64 << 20
+_VERIFIER_ITERATIONS = 20_000
+_CHALLENGE_TTL = 30.0  # seconds
+_MAX_CHALLENGES = 16
+
+
+def agent_socket() -> Path:
+    """Path of this user's agent socket."""
+    return AGENT_DIR / "agent.sock"
+
+
+# --- Enabled-agent record ---
+
+
+def record_agent(pid: int, examiner: str) -> None:
+    """Record pid as this user's agent; clients talk to no other process."""
+    config = _load_config(AGENT_CONFIG)
+    config["key_agent"] = {"pid": pid, "examiner": examiner}
+    _save_config(AGENT_CONFIG, config)
+
+
+def clear_agent() -> None:
+    """Forget the recorded agent; clients stop using the socket."""
+    config = _load_config(AGENT_CONFIG)
+    if config.pop("key_agent", None) is not None:
+        _save_config(AGENT_CONFIG, config)
+
+
+def enabled_agent_pid() -> int | None:
+    """Pid of the agent recorded by ``vhir agent start``, if any."""
+    entry = _load_config(AGENT_CONFIG).get("key_agent")
+    pid = entry.get("pid") if isinstance(entry, dict) else None
+    return pid if isinstance(pid, int) and not isinstance(pid, bool) else None
+
+
+# --- Challenge-response ---
+
+
+def derive_verifier(password: str, salt: bytes) -> bytes:
+    """Password verifier shared by agent and client (never sent)."""
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, _VERIFIER_ITERATIONS)
+
+
+def _proof(verifier: bytes, nonce: bytes, role: bytes) -> str:
+    return hmac.new(verifier, role + nonce, hashlib.sha256).hexdigest()
+
+
+class KeyAgent:
+    """In-memory key holder; ``handle`` answers one decoded request."""
+
+    def __init__(self, examiner: str, salt: bytes, key: bytes, password: str):
+        self.examiner = examiner
+        self.salt = salt.hex()
+        self._key = bytearray(key)
+        self._verifier_salt = secrets.token_bytes(16)
+        self._verifier = derive_verifier(password, self._verifier_salt)
+        self._challenges: dict[bytes, float] = {}
+        self.failures = 0
+        self.stopped = False
+
+    def wipe(self) -> None:
+        """Zero the key and stop serving."""
+        for i in range(len(self._key)):
+            self._key[i] = 0
+        self._verifier = b""
+        self._challenges.clear()
+        self.stopped = True
+
+    def _challenge(self) -> dict:
+        now = time.monotonic()
+        self._challenges = {n: t for n, t in self._challenges.items() if t > now}
+        while len(self._challenges) >= _MAX_CHALLENGES:
+            del self._challenges[next(iter(self._challenges))]
+        nonce = secrets.token_bytes(32)
+        self._challenges[nonce] = now + _CHALLENGE_TTL
+        return {"ok": True, "nonce": nonce.hex(), "salt": self._verifier_salt.hex()}
+
+    def handle(self, request: dict) -> dict:
+        op = request.get("op")
+        if op == "status":
+            return {"ok": True, "examiner": self.examiner, "pid": os.getpid()}
+        if op == "stop":
+            self.wipe()
+            return {"ok": True}
+        if op not in ("challenge", "check", "sign", "verify"):
+            return {"ok": False, "error": f"unknown op: {op}"}
+        if self.stopped:
+            return {"ok": False, "error": "stopped"}
+        if op == "challenge":
+            return self._challenge()
+        if request.get("examiner") != self.examiner or request.get("salt") != self.salt:
+            return {"ok": False, "error": "stale"}
+        try:
+            nonce = bytes.fromhex(str(request.get("nonce", "")))
+        except ValueError:
+            nonce = b""
+        expires = self._challenges.pop(nonce, None)
+        if expires is None or expires < time.monotonic():
+            return {"ok": False, "error": "challenge"}
+        if not hmac.compare_digest(
+            _proof(self._verifier, nonce, b"client:").encode(),
+            str(request.get("proof", "")).encode(),
+        ):
+            self.failures += 1
+            if self.failures >= _MAX_FAILURES:
+                self.wipe()
+            return {"ok": False, "error": "password"}
+        self.failures = 0
+
+        response = {"ok": True, "proof": _proof(self._verifier, nonce, b"agent:")}
+        key = bytes(self._key)
+        if op == "sign":
+            response["hmacs"] = [_hmac(key, text) for text in request.get("texts", [])]
+        elif op == "verify":
+            response["verified"] = [
+                hmac.compare_digest(_hmac(key, text), str(mac))
+                for text, mac in request.get("items", [])
+            ]
+        return response
+
+
+def _hmac(key: bytes, text: str) -> str:
+    # Same construction as verification.compute_hmac (kept import-free)
+    return hmac.new(key, text.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+# --- Server ---
+
+
+def _peer_creds(conn: socket.socket) -> tuple[int, int] | None:
+    """(pid, uid) of the process at the other end of conn."""
+    try:
+        creds = conn.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+    except (AttributeError, OSError):
+        return None
+    pid, uid, _gid = struct.unpack("3i", creds)
+    return pid, uid
+
+
+def serve(
+    agent: KeyAgent,
+    sock_path: Path,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ready: Callable[[], None] | None = None,
+) -> None:
+    """Answer requests on sock_path until stopped, wiped or idle.
+
+    ready, if given, is called once the socket is listening.
+    """
+    sock_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    os.chmod(sock_path.parent, 0o700)
+    try:
+        sock_path.unlink()
+    except FileNotFoundError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(str(sock_path))
+    finally:
+        os.umask(old_umask)
+    os.chmod(sock_path, 0o600)
+    server.listen(8)
+    server.settimeout(1.0)
+    if ready:
+        ready()
+    last_used = time.monotonic()
+    try:
+        while not agent.stopped and time.monotonic() - last_used < idle_timeout:
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                continue
+            with conn:
+                creds = _peer_creds(conn)
+                if creds is None or creds[1] != os.getuid():
+                    continue
+                last_used = time.monotonic()
+                conn.settimeout(10)
+                try:
+                    request = json.loads(_recv_line(conn))
+                    response = agent.handle(request)
+                except (OSError, ValueError) as e:
+                    response = {"ok": False, "error": str(e)}
+                try:
+                    conn.sendall(json.dumps(response).encode() + b"\n")
+                except OSError:
+                    pass
+    finally:
+        agent.wipe()
+        server.close()
+        try:
+            sock_path.unlink()
+        except OSError:
+            pass
+
+
+def _recv_line(conn: socket.socket) -> bytes:
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if chunk.endswith(b"\n"):
+            break
+        if size > _MAX_REQUEST:
+            raise ValueError("request too large")
+    return b"".join(chunks)
+
+
+def start_daemon(agent: KeyAgent, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> int:
+    """Fork the agent into the background; return its pid once listening."""
+    sock_path = agent_socket()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as ready:
+            ready.read(1)  # EOF if the child died before listening
+        agent.wipe()  # the parent's copy is no longer needed
+        return pid
+
+    # Child: detach from the terminal, then serve
+    os.close(read_fd)
+    code = 0
+    try:
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+
+        def ready() -> None:
+            os.write(write_fd, b"1")
+            os.close(write_fd)
+
+        serve(agent, sock_path, idle_timeout, ready)
+    except BaseException:
+        code = 1
+    finally:
+        os._exit(code)
+
+
+# --- Client ---
+
+
+def agent_request(request: dict, timeout: float = 10.0) -> dict | None:
+    """Send one request to the enabled agent. None if no agent answers.
+
+    Nothing is sent unless an agent is recorded and the listener is that
+    process, running as this user.
+    """
+    pid = enabled_agent_pid()
+    sock_path = agent_socket()
+    if pid is None or not sock_path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(str(sock_path))
+            if _peer_creds(conn) != (pid, os.getuid()):
+                return None
+            conn.sendall(json.dumps(request).encode() + b"\n")
+            response = json.loads(_recv_line(conn))
+    except (OSError, ValueError):
+        return None
+    return response if isinstance(response, dict) else None
+
+
+def _keyed_request(op: str, examiner: str, salt: bytes, password: str, **extra):
+    challenge = agent_request({"op": "challenge"})
+    try:
+        nonce = bytes.fromhex(challenge["nonce"])
+        verifier = derive_verifier(password, bytes.fromhex(challenge["salt"]))
+    except (TypeError, KeyError, ValueError):
+        return None  # no agent, or stopped: caller derives the key
+    response = agent_request(
+        {
+            "op": op,
+            "examiner": examiner,
+            "salt": salt.hex(),
+            "nonce": nonce.hex(),
+            "proof": _proof(verifier, nonce, b"client:"),
+            **extra,
+        }
+    )
+    if response is None:
+        return None
+    if response.get("ok"):
+        # The agent must prove it holds the same verifier
+        if hmac.compare_digest(
+            _proof(verifier, nonce, b"agent:").encode(),
+            str(response.get("proof", "")).encode(),
+        ):
+            return response
+        return None
+    if response.get("error") == "password":
+        return response
+    return None  # stale or stopped: caller derives the key
+
+
+def agent_check_password(examiner: str, salt: bytes, password: str) -> bool | None:
+    """True/False if the agent could check the password, None otherwise."""
+    response = _keyed_request("check", examiner, salt, password)
+    return None if response is None else bool(response.get("ok"))
+
+
+def agent_sign(
+    examiner: str, salt: bytes, password: str, texts: list[str]
+) -> list[str] | None:
+    """HMACs of texts signed by the agent, or None (fall back to PBKDF2)."""
+    response = _keyed_request("sign", examiner, salt, password, texts=texts)
+    if not response or not response.get("ok"):
+        return None
+    hmacs = response.get("hmacs")
+    return hmacs if isinstance(hmacs, list) and len(hmacs) == len(texts) else None
+
+
+def agent_verify(
+    examiner: str, salt: bytes, password: str, items: list[tuple[str, str]]
+) -> list[bool] | None:
+    """Check (text, hmac) pairs with the agent's key.
+
+    Returns a list of booleans (all False on a wrong password, matching a
+    locally derived wrong key), or None when no agent is usable.
+    """
+    response = _keyed_request(
+        "verify", examiner, salt, password, items=[list(i) for i in items]
+    )
+    if response is None:
+        return None
+    if not response.get("ok"):
+        return [False] * len(items)
+    verified = response.get("verified")
+    if not isinstance(verified, list) or len(verified) != len(items):
+        return None
+    return [v is True for v in verified]
+
+
+def agent_status() -> dict | None:
+    return agent_request({"op": "status"})
+
+
+def stop_agent() -> bool:
+    """Ask the agent to wipe its key and exit. False if none was running."""
+    return agent_request({"op": "stop"}) is not None
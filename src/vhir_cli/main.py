@@ -17,6 +17,7 @@ import argcomplete
 
 from vhir_cli import __version__
 from vhir_cli.case_io import DEFAULT_CASES_DIR, CaseError
+from vhir_cli.commands.agent import cmd_agent
 from vhir_cli.commands.approve import cmd_approve
 from vhir_cli.commands.audit_cmd import cmd_audit
 from vhir_cli.commands.backup import cmd_backup
@@ -34,6 +35,7 @@ from vhir_cli.commands.migrate import cmd_migrate
 from vhir_cli.commands.reject import cmd_reject
 from vhir_cli.commands.report import cmd_report
 from vhir_cli.commands.review import cmd_review
+from vhir_cli.commands.search import cmd_search
 from vhir_cli.commands.service import cmd_service
 from vhir_cli.commands.setup import cmd_setup
 from vhir_cli.commands.sync import cmd_export, cmd_merge
@@ -66,6 +68,49 @@ def build_parser() -> argparse.ArgumentParser:
     p_backup.add_argument(
         "--verify", metavar="BACKUP_PATH", help="Verify backup integrity"
     )
+    p_backup.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="With --verify: stop at the first missing or mismatched file",
+    )
+    p_backup.add_argument(
+        "--resume",
+        action="store_true",
+        help="With --verify: skip files an interrupted verify already checked",
+    )
+    p_backup.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="With --verify: concurrent hashing threads (default: 4)",
+    )
+    p_backup.add_argument(
+        "--archive",
+        choices=["none", "gz", "bz2", "xz"],
+        help="Write a single .tar archive, members compressed with this codec",
+    )
+    p_backup.add_argument(
+        "--level", type=int, default=None, help="Compression level for --archive"
+    )
+    p_backup.add_argument(
+        "--extract",
+        nargs=2,
+        metavar=("ARCHIVE", "PATH"),
+        help="Restore one file from a backup archive by manifest path",
+    )
+    p_backup.add_argument(
+        "--output", default=None, help="With --extract: output directory"
+    )
+    p_backup.add_argument(
+        "--force",
+        action="store_true",
+        help="With --extract: replace an existing file",
+    )
+    p_backup.add_argument(
+        "--base",
+        metavar="BACKUP_PATH",
+        help="Previous backup of this case: copy only changed files, hardlink the rest",
+    )
 
     # approve
     p_approve = sub.add_parser(
@@ -132,6 +177,12 @@ def build_parser() -> argparse.ArgumentParser:
         "--case-id", default=None, help="Override auto-generated case ID"
     )
     p_case_init.add_argument("--description", default="", help="Case description")
+    p_case_init.add_argument(
+        "--storage",
+        choices=["json", "journal"],
+        default="json",
+        help="Case data backend: json (default) or journal (append-only saves)",
+    )
     p_case_init.add_argument(
         "--cases-dir",
         default=None,
@@ -195,6 +246,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Extract IOCs from findings grouped by status",
     )
+    p_review.add_argument(
+        "--ioc-lookup",
+        metavar="VALUE",
+        help="List findings that mention an IOC value (IP, hash, domain, ...)",
+    )
     p_review.add_argument(
         "--timeline", action="store_true", help="Show timeline events"
     )
@@ -210,6 +266,23 @@ def build_parser() -> argparse.ArgumentParser:
     p_review.add_argument("--type", help="Filter by event type (with --timeline)")
     p_review.add_argument("--limit", type=int, default=50, help="Limit entries shown")
 
+    # search
+    p_search = sub.add_parser(
+        "search", help="Search all cases for IOCs, evidence hashes and text"
+    )
+    p_search.add_argument(
+        "terms", nargs="+", help="IP, hash, domain, file name or words (all must match)"
+    )
+    p_search.add_argument(
+        "--cases-dir",
+        default=None,
+        help="Cases root directory (default: $VHIR_CASES_DIR or ~/cases)",
+    )
+    p_search.add_argument(
+        "--rebuild", action="store_true", help="Re-index every case before searching"
+    )
+    p_search.add_argument("--limit", type=int, default=50, help="Limit matches shown")
+
     # exec
     p_exec = sub.add_parser("exec", help="Execute forensic command with audit trail")
     p_exec.add_argument(
@@ -233,6 +306,16 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_reg.add_argument("path", help="Path to evidence file")
     p_reg.add_argument("--description", default="", help="Description of evidence")
+    p_reg.add_argument(
+        "--all-hashes",
+        action="store_true",
+        help="Also record SHA-1 and MD5 (same read pass as SHA-256)",
+    )
+    p_reg.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Register every file under a directory (parallel hashing)",
+    )
 
     # todo
     p_todo = sub.add_parser("todo", help="Manage investigation TODOs")
@@ -351,6 +434,19 @@ def build_parser() -> argparse.ArgumentParser:
         default="",
         help="Only export records modified after this ISO timestamp",
     )
+    p_export.add_argument(
+        "--peer",
+        help="Examiner this bundle is for: export changes since the last "
+        "export to them, then advance their cursor",
+    )
+    p_export.add_argument(
+        "--compact", action="store_true", help="Write JSON without indentation"
+    )
+    p_export.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the bundle (implied by a .gz file name)",
+    )
 
     # merge
     p_merge = sub.add_parser(
@@ -378,6 +474,28 @@ def build_parser() -> argparse.ArgumentParser:
         help="Reset approval password (requires current password)",
     )
 
+    # agent
+    p_agent = sub.add_parser(
+        "agent", help="Local key agent: cache the approval HMAC key in memory"
+    )
+    agent_sub = p_agent.add_subparsers(dest="agent_action")
+    p_agent_start = agent_sub.add_parser(
+        "start", help="Unlock the key agent (password via /dev/tty)"
+    )
+    p_agent_start.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Idle seconds before the agent wipes its key and exits (default: 900)",
+    )
+    p_agent_start.add_argument(
+        "--foreground",
+        action="store_true",
+        help="Run in the foreground instead of detaching",
+    )
+    agent_sub.add_parser("stop", help="Wipe the key and stop the agent")
+    agent_sub.add_parser("status", help="Show whether an agent is running")
+
     # report
     p_report = sub.add_parser("report", help="Generate case reports")
     p_report.add_argument("--full", action="store_true", help="Full case report (JSON)")
@@ -420,12 +538,39 @@ def build_parser() -> argparse.ArgumentParser:
     p_ev_register.add_argument(
         "--description", default="", help="Description of evidence"
     )
+    p_ev_register.add_argument(
+        "--all-hashes",
+        action="store_true",
+        help="Also record SHA-1 and MD5 (same read pass as SHA-256)",
+    )
+    p_ev_register.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Register every file under a directory (parallel hashing)",
+    )
 
     evidence_sub.add_parser("list", help="List registered evidence files")
 
-    evidence_sub.add_parser(
+    p_ev_verify = evidence_sub.add_parser(
         "verify", help="Re-hash registered evidence, report modifications"
     )
+    ev_verify_mode = p_ev_verify.add_mutually_exclusive_group()
+    ev_verify_mode.add_argument(
+        "--full",
+        action="store_true",
+        help="Rehash every file (default)",
+    )
+    ev_verify_mode.add_argument(
+        "--quick",
+        action="store_true",
+        help="Only rehash files whose stat fingerprint changed",
+    )
+    ev_verify_mode.add_argument(
+        "--rolling",
+        metavar="BUDGET",
+        help="Quick check plus rehash least recently verified files "
+        "up to BUDGET bytes (e.g. 500G) per run",
+    )
 
     p_ev_log = evidence_sub.add_parser("log", help="Show evidence access log")
     p_ev_log.add_argument("--path", dest="path_filter", help="Filter by path substring")
@@ -528,11 +673,13 @@ def main() -> None:
         "approve": cmd_approve,
         "reject": cmd_reject,
         "review": cmd_review,
+        "search": cmd_search,
         "exec": cmd_exec,
         "lock-evidence": cmd_lock_evidence,
         "unlock-evidence": cmd_unlock_evidence,
         "register-evidence": cmd_register_evidence,
         "config": cmd_config,
+        "agent": cmd_agent,
         "todo": cmd_todo,
         "setup": cmd_setup,
         "export": cmd_export,
@@ -596,6 +743,9 @@ def _cmd_case(args, identity: dict) -> None:
 def _case_status_data(case_dir) -> dict:
     """Return case status as structured data.
 
+    Metadata and counts come from the cases root's catalog when the
+    case's entry is current, otherwise from the case files.
+
     Args:
         case_dir: Path to the case directory.
 
@@ -607,42 +757,33 @@ def _case_status_data(case_dir) -> dict:
     """
     from pathlib import Path
 
-    import yaml
-
-    from vhir_cli.case_io import load_findings, load_timeline, load_todos
+    from vhir_cli.case_io import case_catalog_entry
 
     case_dir = Path(case_dir)
     meta_file = case_dir / "CASE.yaml"
     if not meta_file.exists():
         raise ValueError(f"Not a Valhuntir case directory: {case_dir}")
 
-    with open(meta_file) as f:
-        meta = yaml.safe_load(f) or {}
-
-    findings = load_findings(case_dir)
-    timeline = load_timeline(case_dir)
-    todos = load_todos(case_dir)
-
-    draft_f = sum(1 for f in findings if f.get("status") == "DRAFT")
-    approved_f = sum(1 for f in findings if f.get("status") == "APPROVED")
-    draft_t = sum(1 for t in timeline if t.get("status") == "DRAFT")
-    approved_t = sum(1 for t in timeline if t.get("status") == "APPROVED")
-    open_todos = sum(1 for t in todos if t.get("status") == "open")
+    entry = case_catalog_entry(case_dir)
+    findings = entry["counts"]["findings"]
+    timeline = entry["counts"]["timeline"]
+    todos = entry["counts"]["todos"]
 
     return {
-        "case_id": meta.get("case_id", case_dir.name),
-        "name": meta.get("name", "(unnamed)"),
-        "status": meta.get("status", "unknown"),
-        "examiner": meta.get("examiner", "unknown"),
+        "case_id": entry["case_id"],
+        "name": entry["name"] or "(unnamed)",
+        "status": entry["status"],
+        "examiner": entry["examiner"] or "unknown",
         "path": str(case_dir),
-        "finding_count": len(findings),
-        "finding_draft": draft_f,
-        "finding_approved": approved_f,
-        "timeline_count": len(timeline),
-        "timeline_draft": draft_t,
-        "timeline_approved": approved_t,
-        "todo_open": open_todos,
-        "todo_total": len(todos),
+        "finding_count": sum(findings.values()),
+        "finding_draft": findings.get("DRAFT", 0),
+        "finding_approved": findings.get("APPROVED", 0),
+        "timeline_count": sum(timeline.values()),
+        "timeline_draft": timeline.get("DRAFT", 0),
+        "timeline_approved": timeline.get("APPROVED", 0),
+        "todo_open": todos.get("open", 0),
+        "todo_total": sum(todos.values()),
+        "modified": entry["modified"],
     }
 
 
@@ -673,6 +814,8 @@ def _case_status(args, identity: dict) -> None:
         f"  Timeline: {data['timeline_count']} ({data['timeline_draft']} draft, {data['timeline_approved']} approved)"
     )
     print(f"  TODOs:    {data['todo_open']} open / {data['todo_total']} total")
+    if data["modified"]:
+        print(f"  Modified: {data['modified']}")
 
     pending = data["finding_draft"] + data["timeline_draft"]
     if pending:
@@ -682,16 +825,20 @@ def _case_status(args, identity: dict) -> None:
 def _case_list_data(cases_dir=None) -> dict:
     """Return list of cases as structured data.
 
+    Reads the cases root's catalog (.case-catalog.json), re-reading only
+    cases whose files changed since they were cataloged.
+
     Args:
         cases_dir: Path to cases directory. Defaults to VHIR_CASES_DIR env or "cases".
 
     Returns:
-        Dict with "cases" list, each entry having id, name, status, active bool.
+        Dict with "cases" list, each entry having id, name, status, active
+        bool, examiner, modified, and finding/timeline/todo status counts.
     """
     import os
     from pathlib import Path
 
-    import yaml
+    from vhir_cli.case_io import load_case_catalog
 
     if cases_dir is None:
         cases_dir = Path(os.environ.get("VHIR_CASES_DIR", DEFAULT_CASES_DIR))
@@ -715,23 +862,19 @@ def _case_list_data(cases_dir=None) -> dict:
             pass
 
     cases = []
-    for entry in sorted(cases_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        meta_file = entry / "CASE.yaml"
-        if not meta_file.exists():
-            continue
-        try:
-            with open(meta_file) as f:
-                meta = yaml.safe_load(f) or {}
-        except (OSError, yaml.YAMLError):
-            meta = {}
+    for dir_name, entry in load_case_catalog(cases_dir).items():
+        counts = entry["counts"]
         cases.append(
             {
-                "id": meta.get("case_id", entry.name),
-                "name": meta.get("name", ""),
-                "status": meta.get("status", "unknown"),
-                "active": entry.name == active_case_dir_name,
+                "id": entry["case_id"],
+                "name": entry["name"],
+                "status": entry["status"],
+                "active": dir_name == active_case_dir_name,
+                "examiner": entry["examiner"],
+                "modified": entry["modified"],
+                "findings": counts["findings"],
+                "timeline": counts["timeline"],
+                "todos": counts["todos"],
             }
         )
 
@@ -755,15 +898,25 @@ def _case_list(args, identity: dict) -> None:
         print("No cases found.")
         return
 
-    print(f"{'Case ID':<25} {'Status':<10} Name")
-    print("-" * 65)
+    print(f"{'Case ID':<25} {'Status':<10} {'Findings':>8} {'Pending':>8}  Name")
+    print("-" * 80)
     for c in cases:
         marker = " (active)" if c["active"] else ""
-        print(f"{c['id']:<25} {c['status']:<10} {c['name']}{marker}")
+        findings = sum(c["findings"].values())
+        pending = c["findings"].get("DRAFT", 0) + c["timeline"].get("DRAFT", 0)
+        print(
+            f"{c['id']:<25} {c['status']:<10} {findings:>8} {pending:>8}  "
+            f"{c['name']}{marker}"
+        )
 
 
 def _case_init_data(
-    name: str, examiner: str, description: str = "", cases_dir=None, case_id=None
+    name: str,
+    examiner: str,
+    description: str = "",
+    cases_dir=None,
+    case_id=None,
+    storage: str = "json",
 ) -> dict:
     """Create a new case and return structured data.
 
@@ -772,6 +925,7 @@ def _case_init_data(
         examiner: Examiner identity slug.
         description: Optional case description.
         cases_dir: Path to cases directory. Defaults to VHIR_CASES_DIR env or "cases".
+        storage: Case data backend, "json" or "journal".
 
     Returns:
         Dict with case_id, case_dir, examiner, created.
@@ -787,7 +941,10 @@ def _case_init_data(
 
     import yaml
 
-    from vhir_cli.case_io import _atomic_write
+    from vhir_cli.case_io import STORAGE_MODES, _atomic_write
+
+    if storage not in STORAGE_MODES:
+        raise ValueError(f"Unknown storage backend: {storage}")
 
     if cases_dir is None:
         cases_dir = Path(os.environ.get("VHIR_CASES_DIR", DEFAULT_CASES_DIR))
@@ -826,6 +983,8 @@ def _case_init_data(
         "examiner": examiner,
         "created": ts.isoformat(),
     }
+    if storage != "json":
+        case_meta["storage"] = storage
 
     _atomic_write(
         case_dir / "CASE.yaml", yaml.dump(case_meta, default_flow_style=False)
@@ -994,6 +1153,7 @@ def _case_init(args, identity: dict) -> None:
             description=description,
             cases_dir=cases_dir,
             case_id=case_id,
+            storage=getattr(args, "storage", "json") or "json",
         )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -1161,6 +1321,11 @@ def _case_close(args, identity: dict) -> None:
 
     _aw(meta_file, yaml.dump(meta, default_flow_style=False))
 
+    # Fold journal-mode saves back into the JSON snapshots for archiving
+    from vhir_cli.case_io import compact_case_data
+
+    compact_case_data(case_dir)
+
     # Clear wintools share
     if _wintools_configured():
         try:
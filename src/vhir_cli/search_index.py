@@ -0,0 +1,266 @@
+"""Cross-case search index over the cases directory.
+
+One SQLite database per user (~/.vhir/search-index.db) holds an inverted
+index over every case under the cases directory: the IOCs of each finding
+(from the case's IOC index, refreshed in memory; search never writes into
+a case directory), the values in iocs.json, evidence hashes from
+evidence.json, and the words of finding titles and text. Each term maps to
+postings (case, ref, detail), where ref is a finding ID, IOC ID or
+evidence path.
+
+The index is refreshed before every search. Cases are compared by the stat
+signatures of their source files, so only cases whose files changed are
+re-indexed and an unchanged tree costs a few stat calls per case. Cases
+removed from the directory are dropped. The database is a cache: deleting
+it only costs one full rebuild.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import json
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from vhir_cli.case_io import (
+    _file_signature,
+    _store_signature,
+    load_case_meta,
+    load_findings,
+    load_iocs,
+)
+from vhir_cli.ioc_extract import peek_ioc_index
+
+SEARCH_DB = Path.home() / ".vhir" / "search-index.db"
+_SCHEMA_VERSION = 1
+_MIN_TOKEN = 3
+_WORD_RE = re.compile(r"[\w][\w.@:\\/-]*")
+_SPLIT_RE = re.compile(r"[^\w]+")
+_TEXT_FIELDS = ("title", "observation", "interpretation", "description")
+_EVIDENCE_HASHES = ("sha256", "sha1", "md5")
+
+
+def normalize_term(word: str) -> str:
+    """Canonical form of a query word or indexed value."""
+    word = word.strip().rstrip(".,;:!?)]}'\"").lower()
+    try:
+        return ipaddress.ip_address(word).compressed
+    except ValueError:
+        return word
+
+
+def _text_terms(text: str) -> set[str]:
+    """Words of free text, plus the parts of dotted names and paths."""
+    terms = set()
+    for word in _WORD_RE.findall(text):
+        word = normalize_term(word)
+        if len(word) >= _MIN_TOKEN:
+            terms.add(word)
+        terms.update(p for p in _SPLIT_RE.split(word) if len(p) >= _MIN_TOKEN)
+    return terms
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+        conn.executescript(
+            """
+            DROP TABLE IF EXISTS cases;
+            DROP TABLE IF EXISTS postings;
+            CREATE TABLE cases (
+                path TEXT PRIMARY KEY,
+                root TEXT NOT NULL,
+                case_id TEXT NOT NULL,
+                sig TEXT NOT NULL
+            );
+            CREATE TABLE postings (
+                term TEXT NOT NULL,
+                path TEXT NOT NULL,
+                ref TEXT NOT NULL,
+                detail TEXT NOT NULL
+            );
+            CREATE INDEX postings_term ON postings (term);
+            CREATE INDEX postings_path ON postings (path);
+            """
+        )
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.commit()
+    return conn
+
+
+def _case_signature(case_dir: Path) -> str:
+    return json.dumps(
+        [
+            _store_signature(case_dir / "findings.json"),
+            _store_signature(case_dir / "iocs.json"),
+            [
+                list(sig) if sig else None
+                for sig in (
+                    _file_signature(case_dir / "evidence.json"),
+                    _file_signature(case_dir / "CASE.yaml"),
+                )
+            ],
+        ]
+    )
+
+
+def _case_postings(case_dir: Path) -> Iterator[tuple[str, str, str]]:
+    """(term, ref, detail) for everything searchable in one case.
+
+    A store that cannot be read is skipped; the case is indexed again once
+    its files change.
+    """
+    try:
+        findings = load_findings(case_dir)
+    except (OSError, ValueError):
+        findings = []
+    for finding in findings:
+        finding_id = finding.get("id") if isinstance(finding, dict) else None
+        if not isinstance(finding_id, str) or not finding_id:
+            continue
+        text = " ".join(str(finding.get(k, "")) for k in _TEXT_FIELDS)
+        for term in _text_terms(text):
+            yield term, finding_id, "text"
+
+    if findings:
+        try:
+            index = peek_ioc_index(case_dir)
+        except (OSError, ValueError):
+            index = {"iocs": {}}
+        for ioc_type, by_value in index["iocs"].items():
+            for value, refs in by_value.items():
+                term = normalize_term(value)
+                for finding_id, status in refs.items():
+                    yield term, finding_id, f"{ioc_type} ({status})"
+
+    try:
+        iocs = load_iocs(case_dir)
+    except (OSError, ValueError):
+        iocs = []
+    for ioc in iocs:
+        if isinstance(ioc, dict) and ioc.get("id") and ioc.get("value"):
+            detail = f"IOC {ioc.get('type', '?')} ({ioc.get('status', 'DRAFT')})"
+            yield normalize_term(str(ioc["value"])), str(ioc["id"]), detail
+
+    try:
+        registry = json.loads((case_dir / "evidence.json").read_text())
+    except (OSError, ValueError):
+        registry = {}
+    files = registry.get("files", []) if isinstance(registry, dict) else []
+    for entry in files:
+        if not isinstance(entry, dict):
+            continue
+        for algorithm in _EVIDENCE_HASHES:
+            if entry.get(algorithm):
+                yield (
+                    str(entry[algorithm]).lower(),
+                    str(entry.get("path", "?")),
+                    f"evidence {algorithm}",
+                )
+
+
+def _case_dirs(cases_dir: Path) -> dict[str, Path]:
+    cases = {}
+    for entry in sorted(cases_dir.iterdir()):
+        if entry.is_dir() and (entry / "CASE.yaml").exists():
+            cases[str(entry.resolve())] = entry
+    return cases
+
+
+def refresh_index(
+    cases_dir: Path, db_path: Path | None = None, rebuild: bool = False
+) -> dict:
+    """Bring the index for cases_dir up to date.
+
+    Returns {"cases": total, "indexed": re-indexed, "removed": dropped}.
+    """
+    cases_dir = Path(cases_dir)
+    root = str(cases_dir.resolve())
+    present = _case_dirs(cases_dir) if cases_dir.is_dir() else {}
+    conn = _connect(db_path or SEARCH_DB)
+    try:
+        with conn:
+            known = dict(
+                conn.execute("SELECT path, sig FROM cases WHERE root = ?", (root,))
+            )
+            removed = [p for p in known if p not in present]
+            indexed = 0
+            for path in removed:
+                conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+                conn.execute("DELETE FROM cases WHERE path = ?", (path,))
+            for path, case_dir in present.items():
+                signature = _case_signature(case_dir)
+                if not rebuild and known.get(path) == signature:
+                    continue
+                case_id = load_case_meta(case_dir).get("case_id") or case_dir.name
+                conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+                conn.executemany(
+                    "INSERT INTO postings (term, path, ref, detail) VALUES (?, ?, ?, ?)",
+                    (
+                        (term, path, ref, detail)
+                        for term, ref, detail in set(_case_postings(case_dir))
+                    ),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO cases (path, root, case_id, sig)"
+                    " VALUES (?, ?, ?, ?)",
+                    (path, root, str(case_id), signature),
+                )
+                indexed += 1
+    finally:
+        conn.close()
+    return {"cases": len(present), "indexed": indexed, "removed": len(removed)}
+
+
+def search(
+    cases_dir: Path,
+    words: Iterable[str],
+    db_path: Path | None = None,
+) -> list[dict]:
+    """Refs in any case under cases_dir that match every word.
+
+    Returns a list of {"case_id", "case_dir", "ref", "matches"} sorted by
+    case and ref, where matches lists how the ref matched ("text",
+    "IPv4 (APPROVED)", "evidence sha256", ...).
+    """
+    terms = list(dict.fromkeys(normalize_term(w) for w in words if w.strip()))
+    if not terms:
+        return []
+    root = str(Path(cases_dir).resolve())
+    conn = _connect(db_path or SEARCH_DB)
+    try:
+        hits: dict[tuple[str, str], set[str]] | None = None
+        for term in terms:
+            rows = conn.execute(
+                "SELECT p.path, p.ref, p.detail FROM postings p"
+                " JOIN cases c ON c.path = p.path WHERE p.term = ? AND c.root = ?",
+                (term, root),
+            )
+            found: dict[tuple[str, str], set[str]] = {}
+            for path, ref, detail in rows:
+                found.setdefault((path, ref), set()).add(detail)
+            if hits is None:
+                hits = found
+            else:
+                hits = {k: v | found[k] for k, v in hits.items() if k in found}
+            if not hits:
+                return []
+        case_ids = dict(
+            conn.execute("SELECT path, case_id FROM cases WHERE root = ?", (root,))
+        )
+    finally:
+        conn.close()
+    results = [
+        {
+            "case_id": case_ids.get(path, Path(path).name),
+            "case_dir": path,
+            "ref": ref,
+            "matches": sorted(details),
+        }
+        for (path, ref), details in hits.items()
+    ]
+    results.sort(key=lambda r: (r["case_id"], r["ref"]))
+    return results
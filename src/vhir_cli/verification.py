@@ -7,6 +7,12 @@ Claude Code sandbox from any CWD.
 Each entry records an HMAC-SHA256 over the description text, keyed by
 PBKDF2(password, salt). The LLM cannot forge entries because it does not know
 the password-derived key.
+
+The ledger is append-only. The current entry for an item is the latest line
+for its (finding_id, approved_by) pair: re-approvals and password rotation
+append superseding lines instead of rewriting the file. An offset index
+(audit_io.JsonlIndex, sidecar in .index/) makes per-item lookups a seek
+and is caught up incrementally as the ledger grows.
 """
 
 from __future__ import annotations
@@ -16,8 +22,15 @@ import hmac
 import json
 import os
 import shutil
+import sys
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
+from vhir_cli.audit_io import JsonlIndex
+
 VERIFICATION_DIR = Path("/var/lib/vhir/verification")
 PBKDF2_ITERATIONS = 600_000
 
@@ -42,32 +55,117 @@ def compute_hmac(derived_key: bytes, description: str) -> str:
     ).hexdigest()
 
 
-def write_ledger_entry(case_id: str, entry: dict) -> None:
-    """Append entry to /var/lib/vhir/verification/{case_id}.jsonl."""
+def ledger_path(case_id: str) -> Path:
+    """Ledger file for a case (validates case_id)."""
     _validate_case_id(case_id)
+    return VERIFICATION_DIR / f"{case_id}.jsonl"
+
+
+def write_ledger_entries(case_id: str, entries: list[dict]) -> None:
+    """Append entries to the case ledger with one write and one fsync."""
+    if not entries:
+        return
+    path = ledger_path(case_id)
     VERIFICATION_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
-    path = VERIFICATION_DIR / f"{case_id}.jsonl"
     with open(path, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+        f.write("".join(json.dumps(entry) + "\n" for entry in entries))
         f.flush()
         os.fsync(f.fileno())
     os.chmod(path, 0o600)
 
 
+def write_ledger_entry(case_id: str, entry: dict) -> None:
+    """Append entry to /var/lib/vhir/verification/{case_id}.jsonl."""
+    write_ledger_entries(case_id, [entry])
+
+
 def read_ledger(case_id: str) -> list[dict]:
-    """Read all entries from verification ledger."""
-    _validate_case_id(case_id)
-    path = VERIFICATION_DIR / f"{case_id}.jsonl"
+    """Read the current entries of a verification ledger, in ledger order.
+
+    Superseded lines (an earlier approval or pre-rotation signature of the
+    same (finding_id, approved_by) pair) are left out, so each item appears
+    once, as it did when rotation rewrote the file. Use latest_entries()
+    for indexed reads.
+    """
+    path = ledger_path(case_id)
     if not path.exists():
         return []
-    entries = []
-    for line in path.read_text().splitlines():
+    current: dict = {}
+    for n, line in enumerate(path.read_text().splitlines()):
         if line.strip():
             try:
-                entries.append(json.loads(line))
+                entry = json.loads(line)
             except json.JSONDecodeError:
                 continue
-    return entries
+            if not isinstance(entry, dict):
+                continue
+            key = _ledger_key(entry) or n
+            current.pop(key, None)  # re-insert so order follows the latest line
+            current[key] = entry
+    return list(current.values())
+
+
+def _ledger_key(entry: dict) -> str | None:
+    finding_id = entry.get("finding_id")
+    examiner = entry.get("approved_by")
+    if not isinstance(finding_id, str) or not isinstance(examiner, str):
+        return None
+    return f"{finding_id}\t{examiner}"
+
+
+def ledger_index(case_id: str) -> JsonlIndex | None:
+    """Refreshed (finding_id, approved_by) index of a case ledger.
+
+    An interrupted password rotation is completed first, so readers never
+    see a half-rotated set of ledgers.
+
+    Returns None if the case has no ledger. Raises OSError if unreadable.
+    """
+    if (VERIFICATION_DIR / ROTATION_JOURNAL).exists():
+        try:
+            recover_rotation()
+        except OSError as e:
+            print(f"Warning: could not finish password rotation: {e}", file=sys.stderr)
+    return _ledger_index(case_id)
+
+
+def _ledger_index(case_id: str) -> JsonlIndex | None:
+    path = ledger_path(case_id)
+    if not path.exists():
+        return None
+    # .idx suffix: the sidecar must not match the *.jsonl ledger glob
+    sidecar = VERIFICATION_DIR / ".index" / f"{case_id}.idx"
+    return JsonlIndex(path, sidecar, key=_ledger_key).refresh()
+
+
+def latest_entries(case_id: str, examiner: str | None = None) -> list[dict]:
+    """Current entry per (finding_id, approved_by), in ledger order.
+
+    Only the indexed lines are read; examiner restricts the result to one
+    examiner's entries.
+    """
+    index = ledger_index(case_id)
+    if index is None:
+        return []
+    keys = [
+        k
+        for k in index.offsets
+        if examiner is None or k.rpartition("\t")[2] == examiner
+    ]
+    found = index.lookup(keys)
+    return [found[k] for k in sorted(found, key=index.offsets.__getitem__)]
+
+
+def lookup_ledger_entry(case_id: str, finding_id: str, examiner: str) -> dict | None:
+    """Current ledger entry for one item approved by examiner, or None.
+
+    The line read at the indexed offset must carry this (finding_id,
+    approved_by) pair; a stale index is rebuilt rather than trusted.
+    """
+    index = ledger_index(case_id)
+    if index is None:
+        return None
+    return index.get(f"{finding_id}\t{examiner}")
 
 
 def copy_ledger_to_case(case_id: str, case_dir: Path) -> None:
@@ -79,23 +177,35 @@ def copy_ledger_to_case(case_id: str, case_dir: Path) -> None:
 
 
 def verify_items(case_id: str, password: str, salt: bytes, examiner: str) -> list[dict]:
-    """Verify HMAC for all items belonging to examiner."""
-    derived_key = derive_hmac_key(password, salt)
-    entries = read_ledger(case_id)
-    results = []
-    for entry in entries:
-        if entry.get("approved_by") != examiner:
-            continue
-        expected = compute_hmac(derived_key, entry.get("content_snapshot", ""))
-        actual = entry.get("hmac", "")
-        results.append(
-            {
-                "finding_id": entry["finding_id"],
-                "type": entry.get("type", "finding"),
-                "verified": hmac.compare_digest(expected, actual),
-            }
-        )
-    return results
+    """Verify HMAC for all items belonging to examiner.
+
+    Uses the key agent when one is unlocked for examiner; otherwise the
+    key is derived here.
+    """
+    entries = latest_entries(case_id, examiner)
+    pairs = [(e.get("content_snapshot", ""), e.get("hmac", "")) for e in entries]
+    verified = None
+    if pairs:
+        try:
+            from vhir_cli.key_agent import agent_verify
+
+            verified = agent_verify(examiner, salt, password, pairs)
+        except ImportError:
+            pass
+    if verified is None:
+        derived_key = derive_hmac_key(password, salt)
+        verified = [
+            hmac.compare_digest(compute_hmac(derived_key, text), actual)
+            for text, actual in pairs
+        ]
+    return [
+        {
+            "finding_id": entry["finding_id"],
+            "type": entry.get("type", "finding"),
+            "verified": ok,
+        }
+        for entry, ok in zip(entries, verified, strict=True)
+    ]
 
 
 def rehmac_entries(
@@ -111,47 +221,157 @@ def rehmac_entries(
 ) -> int:
     """Re-HMAC all entries for examiner after password rotation. Returns count.
 
+    Only the examiner's current entries are read (via the ledger index).
+    Each one that verifies under the old key is re-signed and appended as a
+    superseding line with a resigned_at timestamp; nothing is rewritten, so
+    ledgers without entries for examiner are not touched at all.
+
     Pass pre-derived old_key/new_key to avoid redundant PBKDF2 derivation
     when calling in a loop across multiple ledger files.
     """
-    _validate_case_id(case_id)
-    path = VERIFICATION_DIR / f"{case_id}.jsonl"
-    if not path.exists():
-        return 0
-
     if old_key is None:
         old_key = derive_hmac_key(old_password, old_salt)
     if new_key is None:
         new_key = derive_hmac_key(new_password, new_salt)
 
-    entries = read_ledger(case_id)
-    count = 0
-    updated = []
-    for entry in entries:
-        if entry.get("approved_by") != examiner:
-            updated.append(entry)
-            continue
+    resigned, _skipped = _stage_rehmac(case_id, examiner, old_key, new_key)
+    if resigned:
+        write_ledger_entries(case_id, resigned)
+    return len(resigned)
+
+
+def _stage_rehmac(
+    case_id: str, examiner: str, old_key: bytes, new_key: bytes
+) -> tuple[list[dict], int]:
+    """Re-signed copies of examiner's current entries, plus the count
+    skipped because they do not verify under the old key."""
+    now = datetime.now(timezone.utc).isoformat()
+    resigned = []
+    skipped = 0
+    for entry in latest_entries(case_id, examiner):
         # Verify old HMAC first
         desc = entry.get("content_snapshot", "")
         expected = compute_hmac(old_key, desc)
         actual = entry.get("hmac", "")
         if not hmac.compare_digest(expected, actual):
             # HMAC doesn't match with old key — skip (don't corrupt)
-            updated.append(entry)
+            skipped += 1
             continue
         # Re-sign with new key
-        entry["hmac"] = compute_hmac(new_key, desc)
-        updated.append(entry)
-        count += 1
+        resigned.append(
+            {**entry, "hmac": compute_hmac(new_key, desc), "resigned_at": now}
+        )
+    return resigned, skipped
+
 
-    # Rewrite the file atomically (temp + rename to prevent truncation on crash)
-    import tempfile
+# --- Batch password rotation ---
+
+ROTATION_JOURNAL = ".rotation-journal.json"
+ROTATE_WORKERS = 8
+
+
+def rotate_ledgers(
+    examiner: str,
+    old_key: bytes,
+    new_key: bytes,
+    *,
+    new_salt: bytes | None = None,
+    on_commit: Callable[[], None] | None = None,
+    workers: int | None = None,
+) -> dict:
+    """Re-sign examiner's entries in every case ledger, all or nothing.
+
+    Runs in two phases. Staging reads and re-signs every ledger on a
+    thread pool without writing anything. If any ledger fails to stage,
+    the rotation stops there: nothing is written and on_commit is not
+    called. Otherwise commit writes all staged entries to a rotation
+    journal (fsynced), calls on_commit (reset_password stores the new
+    password there), then appends the entries to each ledger and removes
+    the journal. If the process dies during commit, the next ledger access
+    replays the journal (recover_rotation), so no ledger is left on the
+    old key while others moved on.
+
+    new_salt ties the journal to the new password: recovery only replays a
+    journal whose salt is the examiner's current one, and discards it if
+    the process died before the password was stored.
+
+    Returns:
+        Dict with "cases" ({case_id: {"resigned": n, "skipped": n} or
+        {"error": message}} for ledgers with entries by examiner or that
+        failed to read), "resigned" (total committed), "errors" (case IDs)
+        and "committed" (False if staging failed).
+
+    Raises:
+        OSError: If the journal cannot be written (nothing is committed).
+        Exceptions from on_commit propagate after the journal is removed.
+    """
+    recover_rotation()
+    report: dict[str, dict] = {}
+    staged: dict[str, list[dict]] = {}
+    case_ids = (
+        sorted(p.stem for p in VERIFICATION_DIR.glob("*.jsonl"))
+        if VERIFICATION_DIR.is_dir()
+        else []
+    )
 
+    if case_ids:
+        workers = max(1, min(workers or ROTATE_WORKERS, len(case_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_stage_rehmac, cid, examiner, old_key, new_key): cid
+                for cid in case_ids
+            }
+            for future in as_completed(futures):
+                cid = futures[future]
+                try:
+                    resigned, skipped = future.result()
+                except (OSError, ValueError) as e:
+                    report[cid] = {"error": str(e)}
+                    continue
+                if resigned or skipped:
+                    report[cid] = {"resigned": len(resigned), "skipped": skipped}
+                if resigned:
+                    staged[cid] = resigned
+
+    errors = sorted(cid for cid, r in report.items() if "error" in r)
+    if errors:
+        return {
+            "cases": dict(sorted(report.items())),
+            "resigned": 0,
+            "errors": errors,
+            "committed": False,
+        }
+
+    journal = VERIFICATION_DIR / ROTATION_JOURNAL
+    if staged:
+        data: dict = {"examiner": examiner, "cases": staged}
+        if new_salt is not None:
+            data["salt"] = new_salt.hex()
+        _write_journal(journal, data)
+    if on_commit is not None:
+        try:
+            on_commit()
+        except BaseException:
+            journal.unlink(missing_ok=True)
+            raise
+    if staged:
+        _apply_rotation(staged, workers)
+        journal.unlink()
+
+    return {
+        "cases": dict(sorted(report.items())),
+        "resigned": sum(len(v) for v in staged.values()),
+        "errors": [],
+        "committed": True,
+    }
+
+
+def _write_journal(path: Path, data: dict) -> None:
     fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
     try:
+        os.fchmod(fd, 0o600)
         with os.fdopen(fd, "w") as f:
-            for entry in updated:
-                f.write(json.dumps(entry) + "\n")
+            json.dump(data, f)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_path, str(path))
@@ -161,5 +381,59 @@ def rehmac_entries(
         except OSError:
             pass
         raise
-    os.chmod(path, 0o600)
-    return count
+
+
+def _apply_rotation(staged: dict[str, list[dict]], workers: int | None = None) -> None:
+    """Append staged entries not already current in each ledger (idempotent)."""
+
+    def apply(case_id: str, entries: list[dict]) -> None:
+        index = _ledger_index(case_id)
+        current = index.lookup(_ledger_key(e) for e in entries) if index else {}
+        missing = [
+            e
+            for e in entries
+            if current.get(_ledger_key(e), {}).get("hmac") != e.get("hmac")
+        ]
+        if missing:
+            write_ledger_entries(case_id, missing)
+
+    workers = max(1, min(workers or ROTATE_WORKERS, len(staged)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(apply, c, e) for c, e in staged.items()]:
+            future.result()
+
+
+def recover_rotation() -> bool:
+    """Finish a rotation interrupted during commit. Returns True if one was."""
+    journal = VERIFICATION_DIR / ROTATION_JOURNAL
+    try:
+        data = json.loads(journal.read_text())
+    except FileNotFoundError:
+        return False
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: unreadable rotation journal {journal}: {e}", file=sys.stderr)
+        return False
+    staged = {
+        cid: entries
+        for cid, entries in data.get("cases", {}).items()
+        if isinstance(entries, list)
+    }
+    if staged and _rotation_password_stored(data):
+        _apply_rotation(staged)
+    journal.unlink()
+    return True
+
+
+def _rotation_password_stored(data: dict) -> bool:
+    """False if the journal's new password was never stored (died before it)."""
+    if "salt" not in data:
+        return True
+    from vhir_cli.approval_auth import get_analyst_salt
+
+    try:
+        current = get_analyst_salt(
+            Path.home() / ".vhir" / "config.yaml", str(data.get("examiner", ""))
+        )
+    except ValueError:
+        return False
+    return current.hex() == data["salt"]
@@ -273,6 +273,28 @@ class TestPasswordReset:
             config_path, "analyst1", "oldpasswd", passwords_dir=passwords_dir
         )
 
+    def test_reset_aborts_if_a_ledger_cannot_be_resigned(
+        self, config_path, passwords_dir, tmp_path, monkeypatch
+    ):
+        ledgers = tmp_path / "verification"
+        ledgers.mkdir()
+        (ledgers / "INC-bad.jsonl").mkdir()  # unreadable ledger
+        monkeypatch.setattr("vhir_cli.verification.VERIFICATION_DIR", ledgers)
+        with patch(
+            "vhir_cli.approval_auth.getpass_prompt",
+            side_effect=["oldpasswd", "oldpasswd"],
+        ):
+            setup_password(config_path, "analyst1", passwords_dir=passwords_dir)
+        with patch(
+            "vhir_cli.approval_auth.getpass_prompt",
+            side_effect=["oldpasswd", "newpasswd", "newpasswd"],
+        ):
+            with pytest.raises(SystemExit):
+                reset_password(config_path, "analyst1", passwords_dir=passwords_dir)
+        assert verify_password(
+            config_path, "analyst1", "oldpasswd", passwords_dir=passwords_dir
+        )
+
     def test_reset_no_password_exits(self, config_path, passwords_dir):
         with pytest.raises(SystemExit):
             reset_password(config_path, "analyst1", passwords_dir=passwords_dir)
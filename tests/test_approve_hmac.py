@@ -84,6 +84,36 @@ def test_approve_writes_ledger_entry(case_dir, config_path, tmp_path):
     assert len(entries[0]["hmac"]) == 64  # hex SHA-256
 
 
+def test_precomputed_text_is_signed(case_dir, config_path, monkeypatch):
+    """Items hashed during the commit reuse their canonical text."""
+    from vhir_cli.case_io import canonicalize
+
+    items = [
+        {"id": "F-alice-20260226-001", "title": "Hashed"},
+        {"id": "F-alice-20260226-002", "title": "Not hashed"},
+    ]
+    text = canonicalize(items[0])[0]
+    calls = []
+    monkeypatch.setattr(
+        "vhir_cli.commands.approve.hmac_text",
+        lambda item: calls.append(item["id"]) or "serialized",
+    )
+
+    _write_verification_entries(
+        case_dir,
+        items,
+        {"examiner": "alice"},
+        config_path,
+        password="testpassword",
+        now="2026-02-26T00:00:00Z",
+        texts={"F-alice-20260226-001": text},
+    )
+
+    entries = read_ledger("INC-2026-TEST")
+    assert [e["content_snapshot"] for e in entries] == [text, "serialized"]
+    assert calls == ["F-alice-20260226-002"]
+
+
 def test_approve_timeline_type_field(case_dir, config_path, tmp_path):
     """Timeline events get type='timeline' in ledger entries."""
     items = [
@@ -182,3 +212,29 @@ def test_no_password_skips_ledger(case_dir, config_path, tmp_path):
 
     entries = read_ledger("INC-2026-TEST")
     assert len(entries) == 0
+
+
+def test_approve_batch_writes_ledger_once(case_dir, config_path, monkeypatch):
+    """Many approved items are appended to the ledger in one write."""
+    import vhir_cli.verification as verification
+
+    calls = []
+    real_write = verification.write_ledger_entries
+
+    def counting_write(case_id, entries):
+        calls.append(len(entries))
+        real_write(case_id, entries)
+
+    monkeypatch.setattr(verification, "write_ledger_entries", counting_write)
+    items = [{"id": f"T-alice-{n:03d}", "description": f"Event {n}"} for n in range(20)]
+    failures = _write_verification_entries(
+        case_dir,
+        items,
+        {"examiner": "alice"},
+        config_path,
+        password="testpassword",
+        now="2026-02-26T00:00:00Z",
+    )
+    assert failures == []
+    assert calls == [20]
+    assert len(read_ledger("INC-2026-TEST")) == 20
@@ -9,11 +9,14 @@ import yaml
 
 from vhir_cli.approval_auth import setup_password
 from vhir_cli.case_io import (
+    compute_content_hash,
     load_approval_log,
     load_findings,
+    load_iocs,
     load_timeline,
     load_todos,
     save_findings,
+    save_iocs,
     save_timeline,
 )
 from vhir_cli.commands.approve import _approve_specific, cmd_approve
@@ -455,6 +458,88 @@ class TestApproveInteractive:
         assert timeline[0]["status"] == "DRAFT"  # Not reviewed
 
 
+class TestApproveCoupling:
+    def test_save_then_approve_does_not_rebuild_index(
+        self, case_dir, identity, staged_finding, pw_config, monkeypatch
+    ):
+        from vhir_cli import case_io
+
+        findings = staged_finding + [
+            {**staged_finding[0], "id": "F-tester-002", "title": "Second"}
+        ]
+        save_findings(case_dir, findings)
+        save_timeline(
+            case_dir,
+            [
+                {
+                    "id": "T-tester-001",
+                    "status": "DRAFT",
+                    "auto_created_from": "F-tester-001",
+                }
+            ],
+        )
+        with patch("vhir_cli.approval_auth.getpass_prompt", return_value="testpass1"):
+            _approve_specific(case_dir, ["F-tester-001"], identity, pw_config)
+        timeline = load_timeline(case_dir)
+        timeline.append(
+            {
+                "id": "T-tester-002",
+                "status": "DRAFT",
+                "auto_created_from": "F-tester-002",
+            }
+        )
+        save_timeline(case_dir, timeline)
+
+        def no_rebuild(*_args):
+            raise AssertionError("coupling index rebuilt")
+
+        monkeypatch.setattr(case_io, "_coupling_entry", no_rebuild)
+        with patch("vhir_cli.approval_auth.getpass_prompt", return_value="testpass1"):
+            _approve_specific(case_dir, ["F-tester-002"], identity, pw_config)
+        assert [e["status"] for e in load_timeline(case_dir)] == ["APPROVED"] * 2
+
+    def _second_finding(self, case_dir, staged_finding):
+        save_findings(
+            case_dir,
+            staged_finding
+            + [{**staged_finding[0], "id": "F-tester-002", "title": "Second"}],
+        )
+
+    def _record_ioc(self, case_dir):
+        ioc = {
+            "id": "IOC-tester-001",
+            "status": "DRAFT",
+            "value": "10.0.0.5",
+            "source_findings": ["F-tester-001"],
+        }
+        ioc["content_hash"] = compute_content_hash(ioc)
+        save_iocs(case_dir, [ioc])
+
+    def test_ioc_recorded_after_approval_is_approved(
+        self, case_dir, identity, staged_finding, pw_config
+    ):
+        """An IOC whose sources were approved before it existed still couples."""
+        self._second_finding(case_dir, staged_finding)
+        with patch("vhir_cli.approval_auth.getpass_prompt", return_value="testpass1"):
+            _approve_specific(case_dir, ["F-tester-001"], identity, pw_config)
+        self._record_ioc(case_dir)
+        with patch("vhir_cli.approval_auth.getpass_prompt", return_value="testpass1"):
+            _approve_specific(case_dir, ["F-tester-002"], identity, pw_config)
+        assert load_iocs(case_dir)[0]["status"] == "APPROVED"
+
+    def test_ioc_recorded_after_rejection_is_rejected(
+        self, case_dir, identity, staged_finding, pw_config
+    ):
+        self._second_finding(case_dir, staged_finding)
+        with patch("vhir_cli.approval_auth.getpass_prompt", return_value="testpass1"):
+            for fid in ("F-tester-001", "F-tester-002"):
+                args = Namespace(ids=[fid], reason="no", case=None, analyst=None)
+                cmd_reject(args, identity)
+                if fid == "F-tester-001":
+                    self._record_ioc(case_dir)
+        assert load_iocs(case_dir)[0]["status"] == "REJECTED"
+
+
 class TestReject:
     def test_reject_finding(self, case_dir, identity, staged_finding, pw_config):
         args = Namespace(
@@ -0,0 +1,246 @@
+"""Tests for incremental JSONL offset indexes."""
+
+import json
+
+import pytest
+
+import vhir_cli.audit_io as audit_io
+from vhir_cli.audit_io import (
+    JsonlIndex,
+    audit_counts,
+    audit_log_index,
+    load_audit_entries,
+    lookup_audit_entries,
+    tail_audit_entries,
+)
+from vhir_cli.case_io import load_audit_index
+
+
+def _append(path, entries):
+    with open(path, "a") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _entry(n, mcp="sift-mcp", tool="run_tool"):
+    return {
+        "ts": f"2026-02-19T10:{n:02d}:00Z",
+        "mcp": mcp,
+        "tool": tool,
+        "audit_id": f"{mcp}-tester-20260219-{n:03d}",
+    }
+
+
+@pytest.fixture
+def case_dir(tmp_path):
+    (tmp_path / "audit").mkdir()
+    _append(tmp_path / "audit" / "sift-mcp.jsonl", [_entry(i) for i in range(1, 6)])
+    _append(
+        tmp_path / "audit" / "forensic-mcp.jsonl",
+        [_entry(i, "forensic-mcp", "record_finding") for i in range(1, 4)],
+    )
+    return tmp_path
+
+
+class TestJsonlIndex:
+    def test_sidecar_written(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        index = audit_log_index(case_dir, log)
+        assert index.lines == 5
+        assert (case_dir / "audit" / ".index" / "sift-mcp.jsonl.idx").exists()
+
+    def test_get_seeks_to_entry(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        index = audit_log_index(case_dir, log)
+        entry = index.get("sift-mcp-tester-20260219-003")
+        assert entry["ts"] == "2026-02-19T10:03:00Z"
+        assert index.get("missing") is None
+
+    def test_catch_up_parses_only_new_lines(self, case_dir, monkeypatch):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        audit_log_index(case_dir, log)
+        _append(log, [_entry(6)])
+
+        parsed = []
+        real_loads = json.loads
+
+        def counting_loads(s, *a, **kw):
+            parsed.append(s)
+            return real_loads(s, *a, **kw)
+
+        monkeypatch.setattr("vhir_cli.audit_io.json.loads", counting_loads)
+        index = audit_log_index(case_dir, log)
+        log_lines = [p for p in parsed if isinstance(p, bytes)]
+        assert len(log_lines) == 1
+        assert index.lines == 6
+        assert index.get("sift-mcp-tester-20260219-006")["ts"].endswith("06:00Z")
+
+    def test_partial_line_waits(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        with open(log, "a") as f:
+            f.write('{"audit_id": "sift-mcp-tester-20260219-099"')
+        index = audit_log_index(case_dir, log)
+        assert "sift-mcp-tester-20260219-099" not in index.offsets
+        with open(log, "a") as f:
+            f.write("}\n")
+        index = audit_log_index(case_dir, log)
+        assert "sift-mcp-tester-20260219-099" in index.offsets
+
+    def test_rewritten_log_rebuilds(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        audit_log_index(case_dir, log)
+        log.write_text(json.dumps(_entry(42, tool="other")) + "\n")
+        index = audit_log_index(case_dir, log)
+        assert index.lines == 1
+        assert list(index.offsets) == ["sift-mcp-tester-20260219-042"]
+
+    def test_torn_sidecar_rebuilds(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        audit_log_index(case_dir, log)
+        sidecar = case_dir / "audit" / ".index" / "sift-mcp.jsonl.idx"
+        sidecar.write_text(sidecar.read_text()[:-20])
+        index = audit_log_index(case_dir, log)
+        assert index.lines == 5
+        assert len(index.offsets) == 5
+
+    def test_rewrite_after_head_detected_by_tail(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        _append(log, [{**_entry(9), "detail": "x" * 5000}, _entry(10)])
+        audit_log_index(case_dir, log)
+        # Same size, first 4 KiB unchanged: only the last line differs
+        lines = log.read_text().splitlines(keepends=True)
+        lines[-1] = lines[-1].replace("run_tool", "other_01")
+        log.write_text("".join(lines))
+        index = audit_log_index(case_dir, log)
+        assert index.tally[("sift-mcp", "other_01")] == 1
+
+    def test_malformed_sidecar_records_rebuild(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        audit_log_index(case_dir, log)
+        sidecar = case_dir / "audit" / ".index" / "sift-mcp.jsonl.idx"
+        header = sidecar.read_text().split("\n")[0]
+        sidecar.write_text(header + '\n[]\n{"end": 3}\n')
+        index = audit_log_index(case_dir, log)
+        assert index.lines == 5
+        assert index.get("sift-mcp-tester-20260219-004")["ts"].endswith("04:00Z")
+
+    def test_lookup_checks_key_and_rescans(self, case_dir):
+        log = case_dir / "audit" / "sift-mcp.jsonl"
+        index = audit_log_index(case_dir, log)
+        # Same-length swap of two lines leaves head, tail and size intact
+        lines = log.read_text().splitlines(keepends=True)
+        lines[1], lines[2] = lines[2], lines[1]
+        log.write_text("".join(lines))
+        entry = index.get("sift-mcp-tester-20260219-002")
+        assert entry["audit_id"] == "sift-mcp-tester-20260219-002"
+        assert index.offsets["sift-mcp-tester-20260219-003"] == len(lines[0])
+
+    def test_in_memory_without_sidecar(self, tmp_path):
+        log = tmp_path / "log.jsonl"
+        _append(log, [_entry(1), _entry(2)])
+        index = JsonlIndex(log, key=lambda e: e.get("audit_id")).refresh()
+        assert index.get("sift-mcp-tester-20260219-002")["ts"].endswith("02:00Z")
+
+
+class TestAuditLookups:
+    def test_lookup_matches_full_index(self, case_dir):
+        ids = ["sift-mcp-tester-20260219-002", "forensic-mcp-tester-20260219-003"]
+        full = load_audit_index(case_dir)
+        assert lookup_audit_entries(case_dir, ids) == {i: full[i] for i in ids}
+
+    def test_counts(self, case_dir):
+        _append(
+            case_dir / "approvals.jsonl",
+            [{"ts": "2026-02-19T11:00:00Z", "item_id": "F-tester-001"}],
+        )
+        with open(case_dir / "audit" / "sift-mcp.jsonl", "a") as f:
+            f.write("not json\n")
+        counts = audit_counts(case_dir)
+        assert counts["total_entries"] == 9
+        assert counts["audit_ids"] == 8
+        assert counts["corrupt_lines"] == 1
+        assert counts["by_mcp"] == {"sift-mcp": 5, "forensic-mcp": 3, "vhir-cli": 1}
+        assert counts["by_tool"]["vhir-cli"] == {"approval": 1}
+
+
+class TestTailAuditEntries:
+    @pytest.fixture
+    def big_case(self, tmp_path):
+        (tmp_path / "audit").mkdir()
+        for name, offset in (("a-mcp", 0), ("b-mcp", 1), ("c-mcp", 2)):
+            _append(
+                tmp_path / "audit" / f"{name}.jsonl",
+                [
+                    {
+                        "ts": f"2026-02-19T10:{(i * 3 + offset) // 60:02d}:"
+                        f"{(i * 3 + offset) % 60:02d}Z",
+                        "mcp": name,
+                        "tool": "run_tool" if i % 2 else "other",
+                        "audit_id": f"{name}-{i}",
+                    }
+                    for i in range(300)
+                ],
+            )
+        _append(
+            tmp_path / "approvals.jsonl",
+            [{"ts": "2026-02-19T10:30:00Z", "item_id": "F-tester-001"}],
+        )
+        return tmp_path
+
+    def test_matches_full_sort(self, big_case):
+        full = load_audit_entries(big_case)
+        assert tail_audit_entries(big_case, 25) == full[-25:]
+
+    def test_filters_pushed_down(self, big_case):
+        full = [
+            e
+            for e in load_audit_entries(big_case)
+            if e["mcp"] == "b-mcp" and e["tool"] == "run_tool"
+        ]
+        got = tail_audit_entries(big_case, 10, mcp="b-mcp", tool="run_tool")
+        assert got == full[-10:]
+
+    def test_approval_defaults(self, big_case):
+        approvals = tail_audit_entries(big_case, 5, tool="approval")
+        assert approvals[0]["mcp"] == "vhir-cli"
+
+    def test_reads_only_the_tail(self, big_case, monkeypatch):
+        monkeypatch.setattr(audit_io, "_TAIL_BLOCK", 1024)
+        parsed = []
+        real_loads = json.loads
+
+        def counting_loads(s, *a, **kw):
+            parsed.append(s)
+            return real_loads(s, *a, **kw)
+
+        monkeypatch.setattr("vhir_cli.audit_io.json.loads", counting_loads)
+        tail_audit_entries(big_case, 10)
+        assert len(parsed) < 100  # of 901 lines on disk
+
+    def test_out_of_order_falls_back(self, big_case):
+        _append(
+            big_case / "audit" / "a-mcp.jsonl",
+            [{"ts": "2026-01-01T00:00:00Z", "mcp": "a-mcp", "tool": "late"}],
+        )
+        full = load_audit_entries(big_case)
+        assert tail_audit_entries(big_case, 20) == full[-20:]
+
+    def test_review_labels_force_approval_labels(self, big_case):
+        _append(
+            big_case / "approvals.jsonl",
+            [{"ts": "2026-02-19T10:31:00Z", "tool": "portal", "mcp": "x"}],
+        )
+        got = tail_audit_entries(big_case, 0, tool="approval", review_labels=True)
+        assert [(e["mcp"], e["tool"]) for e in got] == [("vhir-cli", "approval")] * 2
+        plain = tail_audit_entries(big_case, 0, mcp="x")
+        assert [e["tool"] for e in plain] == ["portal"]
+
+    def test_non_object_lines_skipped(self, big_case, capsys):
+        with open(big_case / "audit" / "c-mcp.jsonl", "a") as f:
+            f.write('["not", "an", "entry"]\n42\n')
+        assert len(tail_audit_entries(big_case, 5)) == 5
+        assert len(load_audit_entries(big_case)) == 901
+        assert "2 corrupt" in capsys.readouterr().err
+
+    def test_empty(self, tmp_path):
+        assert tail_audit_entries(tmp_path, 10) == []
@@ -0,0 +1,429 @@
+"""Tests for vhir backup create and verify."""
+
+import hashlib
+import json
+import tarfile
+
+import pytest
+import yaml
+
+import vhir_cli.commands.backup as backup
+from vhir_cli.commands.backup import (
+    _verify_backup,
+    create_backup_data,
+    extract_backup_file,
+    verify_backup_data,
+)
+from vhir_cli.hashing import copy_and_hash
+
+
+@pytest.fixture
+def case_dir(tmp_path, monkeypatch):
+    case = tmp_path / "cases" / "INC-2026-001"
+    case.mkdir(parents=True)
+    (case / "CASE.yaml").write_text(yaml.dump({"case_id": "INC-2026-001"}))
+    (case / "findings.json").write_text('[{"id": "F-alice-001"}]')
+    (case / "audit").mkdir()
+    (case / "audit" / "sift-mcp.jsonl").write_text('{"tool": "run"}\n')
+    (case / "evidence").mkdir()
+    (case / "evidence" / "disk.E01").write_bytes(b"\x00\x01" * 50000)
+    ledger_dir = tmp_path / "verification"
+    ledger_dir.mkdir()
+    (ledger_dir / "INC-2026-001.jsonl").write_text('{"finding_id": "F-alice-001"}\n')
+    monkeypatch.setattr(backup, "VERIFICATION_DIR", ledger_dir)
+    return case
+
+
+def _no_link(*args):
+    raise OSError("Invalid cross-device link")
+
+
+def _manifest(result):
+    path = backup.Path(result["backup_path"]) / "backup-manifest.json"
+    return json.loads(path.read_text())
+
+
+class TestCopyAndHash:
+    def test_copy_matches_source(self, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(bytes(range(256)) * 100)
+        nbytes, digests = copy_and_hash(
+            src, tmp_path / "dst.bin", ("sha256", "md5"), block_size=1000
+        )
+        assert nbytes == 25600
+        assert (tmp_path / "dst.bin").read_bytes() == src.read_bytes()
+        assert digests["md5"] == hashlib.md5(src.read_bytes()).hexdigest()
+        assert (tmp_path / "dst.bin").stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+class TestCreateBackup:
+    def test_manifest_hashes_match_copies(self, case_dir, tmp_path):
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", include_evidence=True, workers=3
+        )
+        manifest = _manifest(result)
+        paths = [f["path"] for f in manifest["files"]]
+        assert paths == sorted(paths)
+        assert "evidence/disk.E01" in paths
+        assert "verification/INC-2026-001.jsonl" in paths
+        for entry in manifest["files"]:
+            data = (backup.Path(result["backup_path"]) / entry["path"]).read_bytes()
+            assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+            assert entry["bytes"] == len(data)
+        assert result["includes_verification_ledger"] is True
+        assert not (backup.Path(result["backup_path"]) / ".backup-in-progress").exists()
+
+    def test_source_read_once(self, case_dir, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            backup,
+            "hash_file",
+            lambda *a, **kw: pytest.fail("backup re-read a copied file"),
+        )
+        create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+
+    def test_evidence_excluded_by_default(self, case_dir, tmp_path):
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        paths = [f["path"] for f in _manifest(result)["files"]]
+        assert "evidence/disk.E01" not in paths
+
+    def test_caches_excluded(self, case_dir, tmp_path):
+        from vhir_cli.case_io import CASE_CACHE_PATHS
+
+        for rel in CASE_CACHE_PATHS:
+            (case_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+        (case_dir / "audit" / ".index").mkdir()
+        (case_dir / "audit" / ".index" / "sift-mcp.jsonl.idx").write_text("{}\n")
+        for rel in CASE_CACHE_PATHS - {"audit/.index"}:
+            (case_dir / rel).write_text("{}")
+        # Same names below evidence/ are evidence, not caches
+        (case_dir / "evidence" / ".ioc-index.json").write_text("{}")
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", include_evidence=True
+        )
+        paths = {f["path"] for f in _manifest(result)["files"]}
+        assert not any(p.startswith("audit/.index") for p in paths)
+        assert not paths & CASE_CACHE_PATHS
+        assert "evidence/.ioc-index.json" in paths
+
+    def test_copy_failure_raises(self, case_dir, tmp_path, monkeypatch):
+        real = backup.copy_and_hash
+
+        def flaky(src, dst, *a, **kw):
+            if str(src).endswith("findings.json"):
+                raise PermissionError("denied")
+            return real(src, dst, *a, **kw)
+
+        monkeypatch.setattr(backup, "copy_and_hash", flaky)
+        with pytest.raises(OSError):
+            create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+
+    def test_ledger_failure_is_a_note(self, case_dir, tmp_path, monkeypatch):
+        real = backup.copy_and_hash
+
+        def flaky(src, dst, *a, **kw):
+            if "verification" in str(src):
+                raise PermissionError("denied")
+            return real(src, dst, *a, **kw)
+
+        monkeypatch.setattr(backup, "copy_and_hash", flaky)
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        assert result["includes_verification_ledger"] is False
+        assert "could not copy verification ledger" in result["ledger_note"]
+
+
+class TestIncrementalBackup:
+    def test_unchanged_files_hardlinked(self, case_dir, tmp_path):
+        out = tmp_path / "out"
+        first = create_backup_data(case_dir, str(out), "alice", include_evidence=True)
+        (case_dir / "findings.json").write_text('[{"id": "F-alice-002"}]')
+        second = create_backup_data(
+            case_dir,
+            str(out),
+            "alice",
+            include_evidence=True,
+            base=first["backup_path"],
+        )
+        # findings.json changed, ledger is always copied
+        assert second["copied_files"] == 2
+        assert second["linked_files"] == 3
+        old_img = backup.Path(first["backup_path"]) / "evidence" / "disk.E01"
+        new_img = backup.Path(second["backup_path"]) / "evidence" / "disk.E01"
+        assert old_img.stat().st_ino == new_img.stat().st_ino
+        manifest = _manifest(second)
+        assert manifest["parent"]["path"] == (
+            "../" + backup.Path(first["backup_path"]).name
+        )
+        assert _verify_backup(backup.Path(second["backup_path"])) is True
+
+    def test_refs_follow_parent_chain(self, case_dir, tmp_path, monkeypatch):
+        out = tmp_path / "out"
+        first = create_backup_data(case_dir, str(out), "alice", include_evidence=True)
+        monkeypatch.setattr(backup.os, "link", _no_link)
+        second = create_backup_data(
+            case_dir,
+            str(out),
+            "alice",
+            include_evidence=True,
+            base=first["backup_path"],
+        )
+        third = create_backup_data(
+            case_dir,
+            str(out),
+            "alice",
+            include_evidence=True,
+            base=second["backup_path"],
+        )
+        assert third["referenced_files"] == 4
+        third_dir = backup.Path(third["backup_path"])
+        assert not (third_dir / "evidence" / "disk.E01").exists()
+        assert _verify_backup(third_dir) is True
+
+        # Tampering with the content in the root backup is caught
+        (backup.Path(first["backup_path"]) / "findings.json").write_text("[]")
+        assert _verify_backup(third_dir) is False
+
+    def test_swapped_parent_manifest_breaks_chain(
+        self, case_dir, tmp_path, monkeypatch, capsys
+    ):
+        out = tmp_path / "out"
+        first = create_backup_data(case_dir, str(out), "alice")
+        monkeypatch.setattr(backup.os, "link", _no_link)
+        second = create_backup_data(
+            case_dir, str(out), "alice", base=first["backup_path"]
+        )
+        manifest_file = backup.Path(first["backup_path"]) / "backup-manifest.json"
+        manifest_file.write_text(manifest_file.read_text() + " ")
+        assert _verify_backup(backup.Path(second["backup_path"])) is False
+        assert "MISSING" in capsys.readouterr().out
+
+    def test_base_of_other_case_rejected(self, case_dir, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "backup-manifest.json").write_text('{"case_id": "INC-X"}')
+        with pytest.raises(ValueError, match="INC-X"):
+            create_backup_data(
+                case_dir, str(tmp_path / "out"), "alice", base=str(other)
+            )
+        assert not (tmp_path / "out").exists()
+
+
+class TestVerifyBackup:
+    def test_roundtrip(self, case_dir, tmp_path, capsys):
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        assert _verify_backup(backup.Path(result["backup_path"])) is True
+        assert "PASSED" in capsys.readouterr().out
+
+    def test_detects_tamper(self, case_dir, tmp_path, capsys):
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        (backup.Path(result["backup_path"]) / "findings.json").write_text("[]")
+        assert _verify_backup(backup.Path(result["backup_path"])) is False
+        assert "MISMATCH: findings.json" in capsys.readouterr().out
+
+    def test_data_largest_first(self, case_dir, tmp_path, monkeypatch):
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", include_evidence=True
+        )
+        order = []
+        real = backup.hash_file
+
+        def recording(path, *a, **kw):
+            order.append(backup.Path(path).name)
+            return real(path, *a, **kw)
+
+        monkeypatch.setattr(backup, "hash_file", recording)
+        data = verify_backup_data(backup.Path(result["backup_path"]), workers=1)
+        assert data["passed"] is True
+        assert data["ok"] == data["total"]
+        assert order[1] == "disk.E01"  # after the manifest hash itself
+
+    def test_fail_fast_stops(self, case_dir, tmp_path):
+        for i in range(20):
+            (case_dir / f"note{i:02d}.md").write_text("x" * (100 + i))
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        backup_dir = backup.Path(result["backup_path"])
+        (backup_dir / "note19.md").write_text("y" * 119)  # largest note
+        data = verify_backup_data(backup_dir, workers=1, fail_fast=True)
+        assert data["passed"] is False
+        assert data["stopped_early"] is True
+        assert data["mismatched"] == ["note19.md"]
+        assert data["unchecked"] > 0
+
+    def test_fail_fast_on_missing_skips_hashing(self, case_dir, tmp_path):
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        backup_dir = backup.Path(result["backup_path"])
+        (backup_dir / "findings.json").unlink()
+        data = verify_backup_data(backup_dir, fail_fast=True)
+        assert data["missing"] == ["findings.json"]
+        assert data["checked"] == 0
+
+    def test_resume_skips_checkpointed(self, case_dir, tmp_path):
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        backup_dir = backup.Path(result["backup_path"])
+        (backup_dir / "findings.json").write_text("[]")
+        first = verify_backup_data(backup_dir)
+        assert first["passed"] is False
+        assert (backup_dir / ".verify-checkpoint.jsonl").exists()
+
+        (backup_dir / "findings.json").write_text('[{"id": "F-alice-001"}]')
+        second = verify_backup_data(backup_dir, resume=True)
+        assert second["passed"] is True
+        assert second["resumed"] == first["ok"]
+        assert second["checked"] == 1
+        assert not (backup_dir / ".verify-checkpoint.jsonl").exists()
+
+    def test_checkpoint_for_other_manifest_ignored(self, case_dir, tmp_path):
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        backup_dir = backup.Path(result["backup_path"])
+        (backup_dir / ".verify-checkpoint.jsonl").write_text(
+            '{"manifest_sha256": "stale"}\n{"path": "findings.json"}\n'
+        )
+        data = verify_backup_data(backup_dir, resume=True)
+        assert data["resumed"] == 0
+        assert data["passed"] is True
+
+    def test_incomplete_backup_raises(self, case_dir, tmp_path):
+        result = create_backup_data(case_dir, str(tmp_path / "out"), "alice")
+        backup_dir = backup.Path(result["backup_path"])
+        (backup_dir / ".backup-in-progress").touch()
+        with pytest.raises(ValueError, match="Incomplete"):
+            verify_backup_data(backup_dir)
+
+
+class TestArchiveBackup:
+    @pytest.mark.parametrize("codec", ["none", "gz", "bz2", "xz"])
+    def test_archive_roundtrip(self, case_dir, tmp_path, codec):
+        result = create_backup_data(
+            case_dir,
+            str(tmp_path / "out"),
+            "alice",
+            include_evidence=True,
+            archive=codec,
+            level=1 if codec != "none" else None,
+        )
+        archive = backup.Path(result["backup_path"])
+        assert archive.suffix == ".tar"
+        assert not list((tmp_path / "out").glob("*.partial"))
+        if codec != "none":
+            assert result["stored_bytes"] < result["total_bytes"]
+
+        # Standard tar tooling can list it
+        with tarfile.open(archive) as tar:
+            names = tar.getnames()
+        assert names[-1] == "backup-manifest.json"
+
+        data = verify_backup_data(archive)
+        assert data["passed"] is True
+        assert data["ok"] == data["total"] == result["file_count"]
+
+    def test_extract_single_file(self, case_dir, tmp_path, monkeypatch):
+        result = create_backup_data(
+            case_dir,
+            str(tmp_path / "out"),
+            "alice",
+            include_evidence=True,
+            archive="gz",
+        )
+        archive = backup.Path(result["backup_path"])
+        reads = []
+        real_open = open
+
+        def tracking_open(path, mode="r", *a, **kw):
+            if str(path) == str(archive):
+                reads.append(mode)
+            return real_open(path, mode, *a, **kw)
+
+        monkeypatch.setattr("builtins.open", tracking_open)
+        data = extract_backup_file(archive, "findings.json", tmp_path / "restore")
+        monkeypatch.undo()
+        assert len(reads) == 1  # one seek+read, no tar scan (sidecar manifest)
+        restored = tmp_path / "restore" / "findings.json"
+        assert restored.read_text() == (case_dir / "findings.json").read_text()
+        assert data["bytes"] == restored.stat().st_size
+
+    def test_tampered_sidecar_ignored(self, case_dir, tmp_path):
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", archive="none"
+        )
+        archive = backup.Path(result["backup_path"])
+        sidecar = backup.Path(str(archive) + ".manifest.json")
+        manifest = json.loads(sidecar.read_text())
+        entry = next(f for f in manifest["files"] if f["path"] == "findings.json")
+        # Alter the member and "fix" its hash in the sidecar only
+        with open(archive, "r+b") as f:
+            f.seek(entry["offset"])
+            f.write(b"X")
+            f.seek(entry["offset"])
+            altered = f.read(entry["stored"])
+        entry["sha256"] = hashlib.sha256(altered).hexdigest()
+        sidecar.write_text(json.dumps(manifest, indent=2))
+        with pytest.raises(ValueError, match="mismatch"):
+            extract_backup_file(archive, "findings.json", tmp_path / "restore")
+        assert not (tmp_path / "restore" / "findings.json").exists()
+
+    def test_extract_unknown_path(self, case_dir, tmp_path):
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", archive="gz"
+        )
+        with pytest.raises(ValueError, match="Not in archive"):
+            extract_backup_file(result["backup_path"], "nope.json", tmp_path)
+
+    def test_corrupt_member_detected(self, case_dir, tmp_path):
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", archive="none"
+        )
+        archive = backup.Path(result["backup_path"])
+        manifest = json.loads(backup.Path(str(archive) + ".manifest.json").read_text())
+        entry = next(f for f in manifest["files"] if f["path"] == "findings.json")
+        with open(archive, "r+b") as f:
+            f.seek(entry["offset"])
+            f.write(b"X")
+        data = verify_backup_data(archive)
+        assert data["mismatched"] == ["findings.json"]
+        with pytest.raises(ValueError, match="mismatch"):
+            extract_backup_file(archive, "findings.json", tmp_path / "restore")
+        assert not (tmp_path / "restore" / "findings.json").exists()
+
+    def test_extract_refuses_existing_file(self, case_dir, tmp_path):
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", archive="gz"
+        )
+        restored = tmp_path / "restore" / "findings.json"
+        restored.parent.mkdir()
+        restored.write_text("local edits")
+        with pytest.raises(ValueError, match="overwrite"):
+            extract_backup_file(result["backup_path"], "findings.json", restored.parent)
+        assert restored.read_text() == "local edits"
+        extract_backup_file(
+            result["backup_path"], "findings.json", restored.parent, force=True
+        )
+        assert restored.read_text() == (case_dir / "findings.json").read_text()
+
+    def test_failed_extract_keeps_existing_file(self, case_dir, tmp_path):
+        result = create_backup_data(
+            case_dir, str(tmp_path / "out"), "alice", archive="none"
+        )
+        archive = backup.Path(result["backup_path"])
+        manifest = json.loads(backup.Path(str(archive) + ".manifest.json").read_text())
+        entry = next(f for f in manifest["files"] if f["path"] == "findings.json")
+        with open(archive, "r+b") as f:
+            f.seek(entry["offset"])
+            f.write(b"X")
+        restore = tmp_path / "restore"
+        restore.mkdir()
+        (restore / "findings.json").write_text("local edits")
+        with pytest.raises(ValueError, match="mismatch"):
+            extract_backup_file(archive, "findings.json", restore, force=True)
+        assert (restore / "findings.json").read_text() == "local edits"
+        assert [p.name for p in restore.iterdir()] == ["findings.json"]
+
+    def test_archive_with_base_rejected(self, case_dir, tmp_path):
+        with pytest.raises(ValueError):
+            create_backup_data(
+                case_dir, str(tmp_path / "out"), "alice", archive="gz", base="x"
+            )
+
+    def test_partial_archive_rejected(self, tmp_path):
+        partial = tmp_path / "INC-2026-001-2026-03-01.tar.partial"
+        partial.write_bytes(b"")
+        with pytest.raises(ValueError, match="Incomplete"):
+            verify_backup_data(partial)
@@ -1,26 +1,46 @@
 """Tests for shared case I/O module."""
 
+import hashlib
+import io
 import json
+import os
 from argparse import Namespace
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 import yaml
 
+import vhir_cli.case_io as case_io
 from vhir_cli.case_io import (
     CaseError,
+    CaseModel,
+    CaseTransaction,
+    approval_log_entry,
+    canonicalize,
+    check_case_file_integrity,
+    compact_case_data,
     compute_content_hash,
+    coupled_items,
     export_bundle,
     get_case_dir,
+    hmac_text,
     import_bundle,
+    import_bundle_stream,
+    iter_bundle,
+    load_case_catalog,
     load_findings,
+    load_iocs,
     load_timeline,
+    recover_case_transaction,
     save_findings,
+    save_iocs,
     save_timeline,
     verify_approval_integrity,
     write_approval_log,
+    write_approval_logs,
 )
-from vhir_cli.main import _case_list
+from vhir_cli.main import _case_init_data, _case_list, _case_status_data
 
 
 @pytest.fixture
@@ -98,6 +118,217 @@ class TestNoMarkdownGeneration:
         assert not (case_dir / "TIMELINE.md").exists()
 
 
+class TestJournalStorage:
+    """storage: journal appends changed items instead of rewriting the file."""
+
+    @pytest.fixture
+    def journal_case(self, case_dir):
+        (case_dir / "CASE.yaml").write_text(
+            yaml.dump({"case_id": "INC-J", "storage": "journal"})
+        )
+        findings = [
+            {"id": f"F-tester-{i:03d}", "status": "DRAFT", "title": f"Finding {i}"}
+            for i in range(1, 51)
+        ]
+        save_findings(case_dir, findings)
+        return case_dir
+
+    def test_single_update_appends_one_item(self, journal_case):
+        snapshot = journal_case / "findings.json"
+        before = snapshot.read_bytes()
+        findings = load_findings(journal_case)
+        findings[10]["status"] = "APPROVED"
+        save_findings(journal_case, findings)
+
+        assert snapshot.read_bytes() == before
+        journal = journal_case / "findings.journal.jsonl"
+        puts = [
+            json.loads(line)
+            for line in journal.read_text().splitlines()
+            if '"put"' in line
+        ]
+        assert [p["put"]["id"] for p in puts] == ["F-tester-011"]
+        assert load_findings(journal_case)[10]["status"] == "APPROVED"
+        assert oct(journal.stat().st_mode & 0o777) == "0o444"
+
+    def test_unchanged_save_writes_nothing(self, journal_case):
+        save_findings(journal_case, load_findings(journal_case))
+        assert not (journal_case / "findings.journal.jsonl").exists()
+
+    def test_appended_items_are_journaled(self, journal_case):
+        findings = load_findings(journal_case)
+        findings.append({"id": "F-tester-051", "status": "DRAFT", "title": "New"})
+        save_findings(journal_case, findings)
+        loaded = load_findings(journal_case)
+        assert len(loaded) == 51
+        assert loaded[-1]["id"] == "F-tester-051"
+
+    def test_torn_batch_is_ignored(self, journal_case):
+        findings = load_findings(journal_case)
+        findings[0]["title"] = "Committed"
+        save_findings(journal_case, findings)
+        journal = journal_case / "findings.journal.jsonl"
+        journal.chmod(0o644)
+        with open(journal, "a") as f:
+            f.write('{"begin": "x"}\n{"put": {"id": "F-tester-002", "title": "To')
+        loaded = load_findings(journal_case)
+        assert loaded[0]["title"] == "Committed"
+        assert loaded[1]["title"] == "Finding 2"
+
+        # The next save terminates the torn line and commits cleanly
+        loaded[2]["title"] = "After tear"
+        save_findings(journal_case, loaded)
+        reloaded = load_findings(journal_case)
+        assert reloaded[1]["title"] == "Finding 2"
+        assert reloaded[2]["title"] == "After tear"
+
+    def test_removal_compacts(self, journal_case):
+        findings = load_findings(journal_case)
+        findings[0]["title"] = "Changed"
+        save_findings(journal_case, findings)
+        save_findings(journal_case, findings[1:])
+        assert not (journal_case / "findings.journal.jsonl").exists()
+        on_disk = json.loads((journal_case / "findings.json").read_text())
+        assert len(on_disk) == 49
+        assert oct((journal_case / "findings.json").stat().st_mode & 0o777) == "0o444"
+
+    def test_obsolete_journal_not_replayed(self, journal_case):
+        findings = load_findings(journal_case)
+        findings[0]["title"] = "Old"
+        save_findings(journal_case, findings)
+        journal = journal_case / "findings.journal.jsonl"
+        stale = journal.read_text()
+        (journal_case / "CASE.yaml").write_text(yaml.dump({"case_id": "INC-J"}))
+        findings[0]["title"] = "New"
+        save_findings(journal_case, findings)
+        # Simulate a crash between the snapshot replace and the journal unlink
+        snapshot_hash = hashlib.sha256(
+            (journal_case / "findings.json").read_bytes()
+        ).hexdigest()
+        journal.write_text(stale + json.dumps({"compacting": snapshot_hash}) + "\n")
+        assert load_findings(journal_case)[0]["title"] == "New"
+
+    def test_external_rewrite_keeps_journaled_items(self, journal_case):
+        findings = load_findings(journal_case)
+        findings[0]["status"] = "APPROVED"
+        save_findings(journal_case, findings)
+        # Another writer rewrites the snapshot without knowing about the journal
+        snapshot = journal_case / "findings.json"
+        snapshot.chmod(0o644)
+        external = json.loads(snapshot.read_text())
+        external.append({"id": "F-tester-099", "status": "DRAFT"})
+        snapshot.write_text(json.dumps(external))
+        loaded = load_findings(journal_case)
+        assert loaded[0]["status"] == "APPROVED"
+        assert loaded[-1]["id"] == "F-tester-099"
+
+    def test_json_mode_folds_existing_journal(self, journal_case):
+        findings = load_findings(journal_case)
+        findings[3]["title"] = "Edited"
+        save_findings(journal_case, findings)
+        (journal_case / "CASE.yaml").write_text(yaml.dump({"case_id": "INC-J"}))
+        save_findings(journal_case, load_findings(journal_case))
+        assert not (journal_case / "findings.journal.jsonl").exists()
+        on_disk = json.loads((journal_case / "findings.json").read_text())
+        assert on_disk[3]["title"] == "Edited"
+
+    def test_compact_case_data(self, journal_case):
+        findings = load_findings(journal_case)
+        findings[5]["title"] = "Folded"
+        save_findings(journal_case, findings)
+        assert compact_case_data(journal_case) == ["findings.json"]
+        assert not (journal_case / "findings.journal.jsonl").exists()
+        on_disk = json.loads((journal_case / "findings.json").read_text())
+        assert on_disk[5]["title"] == "Folded"
+
+    def test_case_init_records_storage(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        data = _case_init_data(
+            "Journal", "tester", cases_dir=tmp_path / "cases", storage="journal"
+        )
+        meta = yaml.safe_load((Path(data["case_dir"]) / "CASE.yaml").read_text())
+        assert meta["storage"] == "journal"
+
+    def test_merge_uses_journal(self, journal_case):
+        result = import_bundle(
+            journal_case,
+            {"findings": [{"id": "F-alice-001", "title": "Merged"}]},
+        )
+        assert result["findings"]["added"] == 1
+        assert (journal_case / "findings.journal.jsonl").exists()
+        assert load_findings(journal_case)[-1]["id"] == "F-alice-001"
+
+
+class TestCaseCache:
+    """Parsed case files are cached per process and revalidated by stat."""
+
+    @pytest.fixture
+    def parse_count(self, monkeypatch):
+        calls = []
+        original = case_io._parse_store
+
+        def counting(path):
+            calls.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(case_io, "_parse_store", counting)
+        return calls
+
+    def test_integrity_check_and_load_parse_once(self, case_dir, parse_count):
+        save_findings(case_dir, [{"id": "F-tester-001", "status": "DRAFT"}])
+        check_case_file_integrity(case_dir, "findings.json")
+        load_findings(case_dir)
+        verify_approval_integrity(case_dir)
+        assert parse_count == ["findings.json"]
+
+    def test_mutating_loaded_items_does_not_leak(self, case_dir):
+        save_findings(
+            case_dir,
+            [{"id": "F-tester-001", "status": "DRAFT", "examiner_notes": []}],
+        )
+        first = load_findings(case_dir)
+        first[0]["status"] = "APPROVED"
+        first[0]["examiner_notes"].append({"note": "x"})
+        second = load_findings(case_dir)
+        assert second[0]["status"] == "DRAFT"
+        assert second[0]["examiner_notes"] == []
+
+    def test_nested_mutation_does_not_leak(self, case_dir):
+        save_findings(case_dir, [{"id": "F-tester-001", "artifacts": [{"p": "a"}]}])
+        load_findings(case_dir)[0]["artifacts"][0]["p"] = "CHANGED"
+        assert load_findings(case_dir)[0]["artifacts"] == [{"p": "a"}]
+
+    def test_journal_save_of_nested_edit_persists(self, case_dir):
+        (case_dir / "CASE.yaml").write_text(
+            yaml.dump({"case_id": "INC-J", "storage": "journal"})
+        )
+        save_findings(case_dir, [{"id": "F-tester-001", "artifacts": [{"p": "a"}]}])
+        findings = load_findings(case_dir)
+        findings[0]["artifacts"][0]["p"] = "b"
+        save_findings(case_dir, findings)
+        case_io.clear_case_cache()
+        assert load_findings(case_dir)[0]["artifacts"] == [{"p": "b"}]
+
+    def test_save_invalidates(self, case_dir, parse_count):
+        save_findings(case_dir, [{"id": "F-tester-001", "title": "a"}])
+        load_findings(case_dir)
+        save_findings(case_dir, [{"id": "F-tester-001", "title": "b"}])
+        assert load_findings(case_dir)[0]["title"] == "b"
+        assert parse_count == ["findings.json", "findings.json"]
+
+    def test_external_change_detected(self, case_dir):
+        path = case_dir / "findings.json"
+        path.write_text(json.dumps([{"id": "F-tester-001"}]))
+        load_findings(case_dir)
+        path.write_text(json.dumps([{"id": "F-tester-001"}, {"id": "F-tester-002"}]))
+        assert len(load_findings(case_dir)) == 2
+
+    def test_integrity_check_still_rejects_corrupt(self, case_dir):
+        (case_dir / "findings.json").write_text("{not json")
+        with pytest.raises(SystemExit):
+            check_case_file_integrity(case_dir, "findings.json")
+
+
 class TestApprovalLog:
     def test_write_approval(self, case_dir):
         identity = {
@@ -129,6 +360,315 @@ class TestApprovalLog:
         entry = json.loads(log_file.read_text().strip())
         assert entry["reason"] == "Bad evidence"
 
+    def test_batch_write_single_fsync(self, case_dir, monkeypatch):
+        identity = {"os_user": "testuser", "examiner": "analyst1"}
+        write_approval_log(case_dir, "F-tester-000", "APPROVED", identity)
+        fsyncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(real_fsync(fd)))
+        entries = [
+            approval_log_entry(f"T-tester-{n:03d}", "APPROVED", identity, mode="cli")
+            for n in range(50)
+        ]
+        assert write_approval_logs(case_dir, entries)
+        assert len(fsyncs) == 1
+        log_file = case_dir / "approvals.jsonl"
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert len(lines) == 51
+        assert lines[-1]["item_id"] == "T-tester-049"
+        assert lines[-1]["mode"] == "cli"
+        assert log_file.stat().st_mode & 0o777 == 0o444
+        assert write_approval_logs(case_dir, [])
+
+
+class TestCaseTransaction:
+    IDENTITY = {"os_user": "testuser", "examiner": "analyst1"}
+
+    def _stage(self, case_dir):
+        save_findings(case_dir, [{"id": "F-1", "status": "DRAFT"}])
+        txn = CaseTransaction(case_dir)
+        txn.save_store("findings.json", [{"id": "F-1", "status": "APPROVED"}])
+        txn.save_store("timeline.json", [{"id": "T-1", "status": "APPROVED"}])
+        txn.append_approval_logs([approval_log_entry("F-1", "APPROVED", self.IDENTITY)])
+        txn.save_todos([{"todo_id": "TODO-analyst1-001"}])
+        return txn
+
+    def _approvals(self, case_dir):
+        return (case_dir / "approvals.jsonl").read_text().splitlines()
+
+    def test_commit_applies_all(self, case_dir, monkeypatch):
+        txn = self._stage(case_dir)
+        fsyncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(real_fsync(fd)))
+        txn.commit()
+        # One for the commit record, one per touched file
+        assert len(fsyncs) == 5
+        assert load_findings(case_dir)[0]["status"] == "APPROVED"
+        assert load_timeline(case_dir)[0]["id"] == "T-1"
+        assert len(self._approvals(case_dir)) == 1
+        assert (case_dir / "approvals.jsonl").stat().st_mode & 0o777 == 0o444
+        assert json.loads((case_dir / "todos.json").read_text())[0]["todo_id"]
+        assert not (case_dir / case_io.TXN_FILE).exists()
+
+    def test_interrupted_commit_replays_once(self, case_dir, monkeypatch):
+        txn = self._stage(case_dir)
+        monkeypatch.setattr(
+            case_io, "_apply_append_op", Mock(side_effect=OSError("disk full"))
+        )
+        with pytest.raises(OSError):
+            txn.commit()
+        assert txn.committed
+        record = (case_dir / case_io.TXN_FILE).read_text()
+        monkeypatch.undo()
+
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        assert get_case_dir() == case_dir  # resolving the case replays it
+        assert not (case_dir / case_io.TXN_FILE).exists()
+        assert len(self._approvals(case_dir)) == 1
+        assert load_findings(case_dir)[0]["status"] == "APPROVED"
+
+        # Replaying the same record again changes nothing
+        (case_dir / case_io.TXN_FILE).write_text(record)
+        assert recover_case_transaction(case_dir)
+        assert len(self._approvals(case_dir)) == 1
+        assert len(load_findings(case_dir)) == 1
+
+    def test_uncommitted_record_rolls_back(self, case_dir):
+        save_findings(case_dir, [{"id": "F-1", "status": "DRAFT"}])
+        (case_dir / (case_io.TXN_FILE + ".tmp")).write_text('{"v": 1, "ops": [')
+        assert not recover_case_transaction(case_dir)
+        assert not (case_dir / (case_io.TXN_FILE + ".tmp")).exists()
+        assert load_findings(case_dir)[0]["status"] == "DRAFT"
+
+    def test_failed_stage_writes_nothing(self, case_dir, monkeypatch):
+        txn = self._stage(case_dir)
+        monkeypatch.setattr(case_io.os, "replace", Mock(side_effect=OSError("ro")))
+        with pytest.raises(OSError):
+            txn.commit()
+        monkeypatch.undo()
+        assert not txn.committed
+        assert load_findings(case_dir)[0]["status"] == "DRAFT"
+        assert not (case_dir / "approvals.jsonl").exists()
+
+    def _forge(self, case_dir, ops):
+        (case_dir / case_io.TXN_FILE).write_text(json.dumps({"v": 1, "ops": ops}))
+
+    def test_replay_refuses_ops_outside_case(self, case_dir, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("outside") / "victim"
+        forged = [
+            {
+                "op": "append",
+                "path": str(outside),
+                "data": "x\n",
+                "offset": 0,
+                "mode": 0o644,
+            },
+            {"op": "replace", "file": "../escape.json", "content": "[]"},
+            {"op": "store", "file": "CASE.yaml", "items": []},
+        ]
+        for op in forged:
+            self._forge(case_dir, [op])
+            with pytest.raises(OSError, match="refusing"):
+                recover_case_transaction(case_dir)
+            assert (case_dir / case_io.TXN_FILE).exists()  # kept for inspection
+        assert not outside.exists()
+        assert not (case_dir.parent / "escape.json").exists()
+
+    def test_replay_refuses_malformed_items(self, case_dir, monkeypatch, capsys):
+        save_findings(case_dir, [{"id": "F-1", "status": "DRAFT"}])
+        forged = [
+            {"op": "store", "file": "findings.json", "puts": ["x"]},
+            {"op": "store", "file": "findings.json", "items": ["x", 1]},
+            {"op": "store", "file": "findings.json", "items": [{"id": ""}]},
+        ]
+        for op in forged:
+            self._forge(case_dir, [op])
+            with pytest.raises(OSError, match="refusing"):
+                recover_case_transaction(case_dir)
+        assert load_findings(case_dir) == [{"id": "F-1", "status": "DRAFT"}]
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        assert get_case_dir() == case_dir
+        assert "Could not complete interrupted commit" in capsys.readouterr().err
+
+    def test_replay_refuses_foreign_or_shared_record(self, case_dir, monkeypatch):
+        self._forge(
+            case_dir, [{"op": "replace", "file": "todos.json", "content": "[]"}]
+        )
+        os.chmod(case_dir / case_io.TXN_FILE, 0o666)
+        with pytest.raises(OSError, match="writable by others"):
+            recover_case_transaction(case_dir)
+        os.chmod(case_dir / case_io.TXN_FILE, 0o444)
+        uid = os.getuid()
+        monkeypatch.setattr(case_io.os, "getuid", lambda: uid + 1)
+        with pytest.raises(OSError, match="not owned"):
+            recover_case_transaction(case_dir)
+        assert not (case_dir / "todos.json").exists()
+
+    def test_replay_allows_case_ledger(self, case_dir, tmp_path_factory, monkeypatch):
+        ledger_dir = tmp_path_factory.mktemp("ledger")
+        monkeypatch.setattr("vhir_cli.verification.VERIFICATION_DIR", ledger_dir)
+        ledger = ledger_dir / f"{case_dir.name}.jsonl"
+        self._forge(
+            case_dir,
+            [
+                {
+                    "op": "append",
+                    "path": str(ledger),
+                    "data": "{}\n",
+                    "offset": 0,
+                    "mode": 0o600,
+                }
+            ],
+        )
+        assert recover_case_transaction(case_dir)
+        assert ledger.read_text() == "{}\n"
+
+    def test_refused_record_warning_says_how_to_clear(
+        self, case_dir, monkeypatch, capsys
+    ):
+        (case_dir / case_io.TXN_FILE).write_text("{not json")
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        assert get_case_dir() == case_dir
+        err = capsys.readouterr().err
+        assert "vhir review --verify" in err
+        assert f"delete {case_dir / case_io.TXN_FILE}" in err
+
+    def test_journal_storage_upserts(self, case_dir):
+        (case_dir / "CASE.yaml").write_text("storage: journal\n")
+        save_findings(case_dir, [{"id": "F-1", "v": 1}, {"id": "F-2", "v": 1}])
+        txn = CaseTransaction(case_dir)
+        txn.save_store("findings.json", [{"id": "F-1", "v": 1}, {"id": "F-2", "v": 2}])
+        assert txn.ops[0]["puts"] == [{"id": "F-2", "v": 2}]
+        txn.commit()
+        assert load_findings(case_dir) == [{"id": "F-1", "v": 1}, {"id": "F-2", "v": 2}]
+
+
+class TestCaseModel:
+    def _model(self):
+        return CaseModel(
+            {
+                "findings.json": [
+                    {"id": "F-1", "status": "DRAFT"},
+                    {"id": "F-2", "status": "APPROVED"},
+                ],
+                "timeline.json": [{"id": "T-1", "status": "DRAFT"}],
+            }
+        )
+
+    def test_lookup_shares_items(self):
+        model = self._model()
+        assert model.get("T-1") is model.timeline[0]
+        assert model.position("F-2") == ("findings.json", 1)
+        assert "F-9" not in model
+        assert model.get("F-9") is None
+
+    def test_find_draft(self):
+        model = self._model()
+        assert model.find_draft("F-1")["id"] == "F-1"
+        assert model.find_draft("F-2") is None
+
+    def test_put_replaces_in_place_or_appends(self):
+        model = self._model()
+        assert model.put("findings.json", {"id": "F-1", "status": "REJECTED"}) == 0
+        assert model.put("findings.json", {"id": "F-3", "status": "DRAFT"}) == 2
+        assert [f["id"] for f in model.findings] == ["F-1", "F-2", "F-3"]
+        assert model.get("F-1")["status"] == "REJECTED"
+        assert model.position("F-3") == ("findings.json", 2)
+
+
+class TestCouplingIndex:
+    TIMELINE = [
+        {"id": "T-1", "auto_created_from": "F-1"},
+        {"id": "T-2"},
+        {"id": "T-3", "auto_created_from": "F-2"},
+        {"id": "T-4", "auto_created_from": "F-1"},
+    ]
+    IOCS = [
+        {"id": "IOC-1", "source_findings": ["F-1", "F-2"]},
+        {"id": "IOC-2", "status": "APPROVED", "source_findings": ["F-3"]},
+    ]
+
+    def _setup(self, case_dir):
+        save_timeline(case_dir, self.TIMELINE)
+        save_iocs(case_dir, self.IOCS)
+        return load_timeline(case_dir), load_iocs(case_dir)
+
+    def test_links_items_in_list_order(self, case_dir):
+        timeline, iocs = self._setup(case_dir)
+        events, linked_iocs = coupled_items(case_dir, ["F-1"], timeline, iocs)
+        assert [e["id"] for e in events] == ["T-1", "T-4"]
+        assert events[0] is timeline[0]
+        assert [i["id"] for i in linked_iocs] == ["IOC-1"]
+        assert (case_dir / case_io.COUPLING_INDEX).exists()
+
+    def test_undecided_iocs_returned_for_any_finding(self, case_dir):
+        timeline, iocs = self._setup(case_dir)
+        iocs[1]["status"] = "DRAFT"
+        save_iocs(case_dir, iocs)
+        iocs = load_iocs(case_dir)
+        _, linked_iocs = coupled_items(case_dir, ["F-9"], timeline, iocs)
+        assert [i["id"] for i in linked_iocs] == ["IOC-1", "IOC-2"]
+        iocs[1]["manually_reviewed"] = True
+        save_iocs(case_dir, iocs)
+        iocs = load_iocs(case_dir)
+        _, linked_iocs = coupled_items(case_dir, ["F-9"], timeline, iocs)
+        assert [i["id"] for i in linked_iocs] == ["IOC-1"]
+
+    def test_transaction_updates_index_incrementally(self, case_dir, monkeypatch):
+        timeline, iocs = self._setup(case_dir)
+        coupled_items(case_dir, ["F-1"], timeline, iocs)
+        relinked = []
+        real_link = case_io._link_item
+        monkeypatch.setattr(
+            case_io,
+            "_link_item",
+            lambda entry, item_id, *a: (
+                relinked.append(item_id) or real_link(entry, item_id, *a)
+            ),
+        )
+        monkeypatch.setattr(
+            case_io, "_coupling_entry", Mock(side_effect=AssertionError("rebuilt"))
+        )
+        txn = CaseTransaction(case_dir)
+        txn.save_store(
+            "timeline.json",
+            timeline + [{"id": "T-5", "auto_created_from": "F-2"}],
+        )
+        txn.commit()
+        assert relinked == ["T-5"]  # only the upserted item
+        # The index already describes the new store: no rebuild on lookup
+        events, _ = coupled_items(case_dir, ["F-2"], load_timeline(case_dir), iocs)
+        assert [e["id"] for e in events] == ["T-3", "T-5"]
+
+    def test_full_save_reindexes_without_reparse(self, case_dir, monkeypatch):
+        timeline, iocs = self._setup(case_dir)
+        coupled_items(case_dir, ["F-1"], timeline, iocs)
+        save_timeline(case_dir, [{"id": "T-9", "auto_created_from": "F-1"}])
+        monkeypatch.setattr(
+            case_io, "_read_store", Mock(side_effect=AssertionError("re-read"))
+        )
+        events, _ = coupled_items(
+            case_dir, ["F-1"], [{"id": "T-9", "auto_created_from": "F-1"}], iocs
+        )
+        assert [e["id"] for e in events] == ["T-9"]
+
+    def test_external_write_reindexes(self, case_dir):
+        timeline, iocs = self._setup(case_dir)
+        coupled_items(case_dir, ["F-1"], timeline, iocs)
+        (case_dir / "timeline.json").chmod(0o644)
+        (case_dir / "timeline.json").write_text(
+            json.dumps([{"id": "T-9", "auto_created_from": "F-1"}])
+        )
+        events, _ = coupled_items(case_dir, ["F-1"], load_timeline(case_dir), iocs)
+        assert [e["id"] for e in events] == ["T-9"]
+
+    def test_list_differing_from_index_is_scanned(self, case_dir):
+        timeline, iocs = self._setup(case_dir)
+        reordered = list(reversed(timeline))
+        events, _ = coupled_items(case_dir, ["F-1"], reordered, iocs)
+        assert [e["id"] for e in events] == ["T-4", "T-1"]
+
 
 class TestPathTraversal:
     """Verify path traversal is rejected in case_id."""
@@ -243,6 +783,16 @@ class TestContentHash:
         item2 = {"id": "F-tester-001", "title": "Test", "observation": "modified"}
         assert compute_content_hash(item1) != compute_content_hash(item2)
 
+    def test_canonicalize_serializes_once(self, monkeypatch):
+        item = {"id": "F-tester-001", "title": "Test", "status": "DRAFT"}
+        dumps = Mock(wraps=json.dumps)
+        monkeypatch.setattr(case_io.json, "dumps", dumps)
+        text, digest = canonicalize(item)
+        assert dumps.call_count == 1
+        assert text == hmac_text(item)
+        assert digest == compute_content_hash(item)
+        assert hashlib.sha256(text.encode()).hexdigest() == digest
+
 
 class TestContentHashIntegrity:
     """Tests that simulate the actual approve.py flow.
@@ -424,6 +974,47 @@ class TestImportBundle:
         assert result["status"] == "error"
 
 
+class TestImportBundleStream:
+    BUNDLE = {
+        "case_id": "INC-1",
+        "findings": [
+            {"id": "F-bob-001", "title": 'Bob \u00e9 \\ "q"', "n": 123456789},
+            {"id": "F-bob-002", "nested": {"a": [1, 2.5, None, True]}},
+        ],
+        "exported_at": "2026-06-01T00:00:00Z",
+        "timeline": [{"id": "T-bob-001", "staged": "2026-06-01T00:00:00Z"}],
+    }
+
+    def test_iter_bundle_across_tiny_chunks(self):
+        text = json.dumps(self.BUNDLE, indent=2)
+        pairs = {}
+        for key, value in iter_bundle(io.StringIO(text), chunk_size=3):
+            pairs[key] = list(value) if key in ("findings", "timeline") else value
+        assert pairs == self.BUNDLE
+
+    def test_bare_array_is_findings(self, case_dir):
+        text = json.dumps(self.BUNDLE["findings"])
+        result = import_bundle_stream(case_dir, io.StringIO(text))
+        assert result["findings"]["added"] == 2
+        assert result["timeline"]["added"] == 0
+
+    def test_stream_merge_matches_import_bundle(self, case_dir, tmp_path):
+        result = import_bundle_stream(case_dir, io.StringIO(json.dumps(self.BUNDLE)))
+        other = tmp_path / "other"
+        other.mkdir()
+        assert result == import_bundle(other, self.BUNDLE)
+        assert load_findings(case_dir) == load_findings(other)
+        assert load_timeline(case_dir) == load_timeline(other)
+
+    def test_malformed_bundle_writes_nothing(self, case_dir):
+        text = json.dumps(self.BUNDLE)[:-40]
+        with pytest.raises(json.JSONDecodeError):
+            import_bundle_stream(case_dir, io.StringIO(text))
+        assert not (case_dir / "findings.json").exists()
+        result = import_bundle_stream(case_dir, io.StringIO("42"))
+        assert result["status"] == "error"
+
+
 class TestCaseList:
     """Tests for vhir case list command."""
 
@@ -525,3 +1116,75 @@ class TestCaseList:
         output = capsys.readouterr().out
         assert "INC-2026-001" in output
         assert "not-a-case" not in output
+
+
+class TestCaseCatalog:
+    def _case(self, cases_dir, case_id, findings=()):
+        case = cases_dir / case_id
+        case.mkdir(parents=True)
+        (case / "CASE.yaml").write_text(
+            yaml.dump({"case_id": case_id, "name": case_id.lower(), "status": "open"})
+        )
+        save_findings(case, list(findings))
+        return case
+
+    def test_counts_and_lazy_revalidation(self, tmp_path):
+        cases_dir = tmp_path / "cases"
+        case = self._case(
+            cases_dir,
+            "INC-1",
+            [{"id": "F-1", "status": "DRAFT"}, {"id": "F-2", "status": "APPROVED"}],
+        )
+        self._case(cases_dir, "INC-2")
+        (cases_dir / "not-a-case").mkdir()
+
+        catalog = load_case_catalog(cases_dir)
+        assert list(catalog) == ["INC-1", "INC-2"]
+        assert catalog["INC-1"]["counts"]["findings"] == {"DRAFT": 1, "APPROVED": 1}
+        assert (cases_dir / case_io.CASE_CATALOG).exists()
+
+        # Rewritten behind the CLI's back: picked up by stat signature
+        (case / "findings.json").write_text(json.dumps([{"id": "F-1"}] * 3))
+        (case / "CASE.yaml").write_text(
+            yaml.dump({"case_id": "INC-1", "status": "closed"})
+        )
+        entry = load_case_catalog(cases_dir)["INC-1"]
+        assert entry["status"] == "closed"
+        assert sum(entry["counts"]["findings"].values()) == 3
+
+    def test_saves_revalidated_on_listing(self, tmp_path, monkeypatch):
+        cases_dir = tmp_path / "cases"
+        case = self._case(cases_dir, "INC-1")
+        self._case(cases_dir, "INC-2")
+        load_case_catalog(cases_dir)
+        cached = (cases_dir / case_io.CASE_CATALOG).read_bytes()
+
+        save_findings(case, [{"id": "F-1", "status": "DRAFT"}])
+        save_timeline(case, [{"id": "T-1", "status": "APPROVED"}])
+        case_io.save_todos(case, [{"todo_id": "TODO-1", "status": "open"}])
+        assert (cases_dir / case_io.CASE_CATALOG).read_bytes() == cached
+
+        rebuilt = []
+        real_entry = case_io._catalog_entry
+
+        def tracking(case_dir, signature):
+            rebuilt.append(case_dir.name)
+            return real_entry(case_dir, signature)
+
+        monkeypatch.setattr(case_io, "_catalog_entry", tracking)
+        status = _case_status_data(case)
+        assert status["finding_draft"] == 1
+        assert status["timeline_approved"] == 1
+        assert status["todo_open"] == 1
+        assert load_case_catalog(cases_dir)["INC-1"]["counts"]["todos"] == {"open": 1}
+        assert rebuilt == ["INC-1"]
+
+    def test_removed_case_dropped(self, tmp_path):
+        cases_dir = tmp_path / "cases"
+        self._case(cases_dir, "INC-1")
+        case2 = self._case(cases_dir, "INC-2")
+        load_case_catalog(cases_dir)
+        (case2 / "CASE.yaml").unlink()
+        assert list(load_case_catalog(cases_dir)) == ["INC-1"]
+        stored = json.loads((cases_dir / case_io.CASE_CATALOG).read_text())
+        assert list(stored["cases"]) == ["INC-1"]
@@ -1,10 +1,13 @@
 """Tests for evidence CLI commands."""
 
+import hashlib
 import json
 import stat
 
 import pytest
 
+import vhir_cli.commands.evidence as evidence_mod
+from vhir_cli.case_io import EVIDENCE_VERIFY_CACHE
 from vhir_cli.commands.evidence import (
     cmd_evidence,
     cmd_evidence_log,
@@ -12,6 +15,9 @@ from vhir_cli.commands.evidence import (
     cmd_lock_evidence,
     cmd_register_evidence,
     cmd_verify_evidence,
+    parse_size,
+    register_evidence_bulk_data,
+    verify_evidence_data,
 )
 
 
@@ -43,12 +49,16 @@ class FakeArgs:
         description="",
         evidence_action=None,
         path_filter=None,
+        all_hashes=False,
+        recursive=False,
     ):
         self.case = case
         self.path = path
         self.description = description
         self.evidence_action = evidence_action
         self.path_filter = path_filter
+        self.all_hashes = all_hashes
+        self.recursive = recursive
 
 
 class TestLockEvidence:
@@ -73,6 +83,105 @@ class TestRegisterEvidence:
         assert len(reg["files"]) == 1
         assert reg["files"][0]["sha256"]
         assert reg["files"][0]["description"] == "Test malware"
+        assert "md5" not in reg["files"][0]
+
+    def test_register_all_hashes(self, case_dir, identity, monkeypatch, capsys):
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        ev_file = case_dir / "evidence" / "disk.E01"
+        ev_file.write_bytes(b"disk image")
+        cmd_register_evidence(FakeArgs(path=str(ev_file), all_hashes=True), identity)
+        entry = json.loads((case_dir / "evidence.json").read_text())["files"][0]
+        assert entry["sha256"] == hashlib.sha256(b"disk image").hexdigest()
+        assert entry["sha1"] == hashlib.sha1(b"disk image").hexdigest()
+        assert entry["md5"] == hashlib.md5(b"disk image").hexdigest()
+        output = capsys.readouterr().out
+        assert "MD5:" in output
+        assert "Hashed " in output
+
+    def test_reregister_adds_missing_digests(self, case_dir, identity, monkeypatch):
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        ev_file = case_dir / "evidence" / "disk.E01"
+        ev_file.write_bytes(b"disk image")
+        cmd_register_evidence(FakeArgs(path=str(ev_file)), identity)
+        cmd_register_evidence(FakeArgs(path=str(ev_file), all_hashes=True), identity)
+        reg = json.loads((case_dir / "evidence.json").read_text())
+        assert len(reg["files"]) == 1
+        assert reg["files"][0]["md5"] == hashlib.md5(b"disk image").hexdigest()
+
+
+class TestBulkRegister:
+    @pytest.fixture
+    def tree(self, case_dir):
+        root = case_dir / "evidence" / "kape"
+        for i in range(7):
+            sub = root / f"dir{i % 3}"
+            sub.mkdir(parents=True, exist_ok=True)
+            (sub / f"file{i}.evtx").write_bytes(f"event log {i}".encode())
+        return root
+
+    def test_registers_tree_in_checkpoints(self, case_dir, tree, monkeypatch):
+        from vhir_cli import case_io
+
+        writes = []
+        real = case_io._atomic_write
+        monkeypatch.setattr(
+            case_io, "_atomic_write", lambda p, c: writes.append(p) or real(p, c)
+        )
+        data = register_evidence_bulk_data(case_dir, str(tree), "tester", checkpoint=3)
+        assert data["files"] == 7
+        assert data["registered"] == 7
+        # ceil(7 / 3) checkpoints, each one registry and one cache write
+        assert [p.name for p in writes] == ["evidence.json", EVIDENCE_VERIFY_CACHE] * 3
+        reg = json.loads((case_dir / "evidence.json").read_text())
+        by_path = {e["path"]: e for e in reg["files"]}
+        f0 = tree / "dir0" / "file0.evtx"
+        assert by_path[str(f0.resolve())]["sha256"] == (
+            hashlib.sha256(b"event log 0").hexdigest()
+        )
+
+    def test_rerun_dedups_and_updates(self, case_dir, tree):
+        register_evidence_bulk_data(case_dir, str(tree), "tester")
+        changed = tree / "dir1" / "file1.evtx"
+        changed.write_bytes(b"rotated")
+        data = register_evidence_bulk_data(case_dir, str(tree), "tester")
+        assert (data["registered"], data["updated"], data["unchanged"]) == (0, 1, 6)
+        reg = json.loads((case_dir / "evidence.json").read_text())
+        assert len(reg["files"]) == 7
+
+    def test_symlink_to_outside_target_accepted(self, case_dir, tree, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("outside") / "secret.bin"
+        outside.write_bytes(b"x")
+        (tree / "link.bin").symlink_to(outside)
+        data = register_evidence_bulk_data(case_dir, str(tree), "tester")
+        assert data["registered"] == 8  # link lives in the case dir
+        assert data["errors"] == []
+
+    def test_symlinked_directory_not_followed(self, case_dir, tree, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "a.bin").write_bytes(b"a")
+        (outside / "b.bin").write_bytes(b"b")
+        (tree / "linked-dir").symlink_to(outside, target_is_directory=True)
+        data = register_evidence_bulk_data(case_dir, str(tree), "tester")
+        assert data["files"] == 7
+        assert data["errors"] == []
+        reg = json.loads((case_dir / "evidence.json").read_text())
+        assert not any(str(outside) in e["path"] for e in reg["files"])
+
+    def test_cli_logs_one_summary(self, case_dir, tree, identity, monkeypatch, capsys):
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        cmd_register_evidence(FakeArgs(path=str(tree), recursive=True), identity)
+        assert "7 new" in capsys.readouterr().out
+        lines = (case_dir / "evidence_access.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        entry = json.loads(lines[0])
+        assert entry["action"] == "register_bulk"
+        assert entry["files"] == 7
+
+    def test_not_a_directory(self, case_dir):
+        f = case_dir / "evidence" / "one.bin"
+        f.write_bytes(b"1")
+        with pytest.raises(ValueError):
+            register_evidence_bulk_data(case_dir, str(f), "tester")
 
 
 class TestListEvidence:
@@ -138,6 +247,35 @@ class TestVerifyEvidence:
         assert "MODIFIED" in output
         assert "ALERT" in output
 
+    def test_verify_checks_every_recorded_digest(
+        self, case_dir, identity, monkeypatch, capsys
+    ):
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        ev_file = case_dir / "evidence" / "disk.E01"
+        ev_file.write_bytes(b"disk image")
+        cmd_register_evidence(FakeArgs(path=str(ev_file), all_hashes=True), identity)
+        reg_file = case_dir / "evidence.json"
+        reg = json.loads(reg_file.read_text())
+        reg["files"][0]["md5"] = "0" * 32
+        reg_file.write_text(json.dumps(reg))
+
+        data = verify_evidence_data(case_dir)
+        assert data["modified"] == 1
+        assert data["results"][0]["mismatched"] == ["md5"]
+        assert data["bytes_hashed"] == len(b"disk image")
+
+    def test_verify_many_files_parallel(self, case_dir, identity, monkeypatch):
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        for i in range(5):
+            ev_file = case_dir / "evidence" / f"part{i}.bin"
+            ev_file.write_bytes(bytes([i]) * 100)
+            cmd_register_evidence(FakeArgs(path=str(ev_file)), identity)
+        data = verify_evidence_data(case_dir, workers=3)
+        assert data["verified"] == 5
+        assert [r["path"] for r in data["results"]] == [
+            str(case_dir / "evidence" / f"part{i}.bin") for i in range(5)
+        ]
+
     def test_verify_missing(self, case_dir, identity, monkeypatch, capsys):
         monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
         ev_file = case_dir / "evidence" / "deleted.bin"
@@ -160,6 +298,98 @@ class TestVerifyEvidence:
         assert "No evidence files" in output
 
 
+class TestIncrementalVerify:
+    @pytest.fixture
+    def registered(self, case_dir, identity, monkeypatch):
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        paths = []
+        for i in range(3):
+            ev_file = case_dir / "evidence" / f"img{i}.bin"
+            ev_file.write_bytes(bytes([i]) * 1000)
+            cmd_register_evidence(FakeArgs(path=str(ev_file)), identity)
+            paths.append(ev_file)
+        return paths
+
+    def test_register_records_fingerprint(self, case_dir, registered):
+        entry = json.loads((case_dir / "evidence.json").read_text())["files"][0]
+        assert "fingerprint" not in entry
+        cache = json.loads((case_dir / EVIDENCE_VERIFY_CACHE).read_text())
+        record = cache[entry["path"]]
+        assert record["sha256"] == entry["sha256"]
+        assert record["fingerprint"]["size"] == 1000
+        assert record["verified_at"]
+
+    def test_quick_skips_unchanged(self, case_dir, registered, monkeypatch):
+        hashed = []
+        real = evidence_mod.hash_files
+        monkeypatch.setattr(
+            evidence_mod,
+            "hash_files",
+            lambda paths, *a, **kw: hashed.extend(paths) or real(paths, *a, **kw),
+        )
+        data = verify_evidence_data(case_dir, mode="quick")
+        assert hashed == []
+        assert data["verified"] == 3
+        assert data["fingerprint_only"] == 3
+
+    def test_quick_rehashes_changed(self, case_dir, registered):
+        registered[1].chmod(stat.S_IRUSR | stat.S_IWUSR)
+        registered[1].write_bytes(b"x" * 1000)
+        data = verify_evidence_data(case_dir, mode="quick")
+        assert data["modified"] == 1
+        assert data["results"][1]["checked"] == "hash"
+        # Modified files keep their old fingerprint and stay flagged
+        assert verify_evidence_data(case_dir, mode="quick")["modified"] == 1
+
+    def test_full_refreshes_verified_at(self, case_dir, registered):
+        reg_file = case_dir / "evidence.json"
+        cache_file = case_dir / EVIDENCE_VERIFY_CACHE
+        registry = reg_file.read_bytes()
+        path = str(registered[0])
+        before = json.loads(cache_file.read_text())[path]["verified_at"]
+        data = verify_evidence_data(case_dir, mode="full")
+        assert data["fingerprint_only"] == 0
+        after = json.loads(cache_file.read_text())[path]["verified_at"]
+        assert after >= before
+        # Verification never rewrites the registry
+        assert reg_file.read_bytes() == registry
+
+    def test_reregistered_hash_ignores_cache(self, case_dir, registered):
+        reg_file = case_dir / "evidence.json"
+        reg = json.loads(reg_file.read_text())
+        reg["files"][0]["sha256"] = "0" * 64
+        reg_file.write_text(json.dumps(reg))
+        data = verify_evidence_data(case_dir, mode="quick")
+        assert data["results"][0]["checked"] == "hash"
+        assert data["modified"] == 1
+        assert data["fingerprint_only"] == 2
+
+    def test_rolling_cycles_through_set(self, case_dir, registered):
+        cache_file = case_dir / EVIDENCE_VERIFY_CACHE
+        cache = json.loads(cache_file.read_text())
+        for i, path in enumerate(registered):
+            cache[str(path)]["verified_at"] = f"2026-01-0{i + 1}T00:00:00+00:00"
+        cache_file.write_text(json.dumps(cache))
+
+        seen = []
+        for _ in range(3):
+            data = verify_evidence_data(case_dir, mode="rolling", budget=1000)
+            seen += [r["path"] for r in data["results"] if r["checked"] == "hash"]
+        assert seen == [str(p) for p in registered]
+
+    def test_rolling_requires_budget(self, case_dir, registered):
+        with pytest.raises(ValueError):
+            verify_evidence_data(case_dir, mode="rolling")
+
+    def test_parse_size(self):
+        assert parse_size("1048576") == 1 << 20
+        assert parse_size("500G") == 500 << 30
+        assert parse_size("1.5TB") == int(1.5 * (1 << 40))
+        assert parse_size("2GiB") == 2 << 30
+        with pytest.raises(ValueError):
+            parse_size("lots")
+
+
 class TestEvidenceLog:
     def test_log_shows_entries(self, case_dir, identity, monkeypatch, capsys):
         monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
@@ -0,0 +1,72 @@
+"""Tests for the shared hashing engine."""
+
+import hashlib
+
+import pytest
+
+from vhir_cli.hashing import (
+    COURT_ALGORITHMS,
+    format_throughput,
+    hash_file,
+    hash_files,
+    sha256_file,
+)
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "image.E01"
+    path.write_bytes(bytes(range(256)) * 5000)  # spans several small blocks
+    return path
+
+
+class TestHashFile:
+    def test_single_pass_multi_digest(self, sample):
+        data = sample.read_bytes()
+        digests = hash_file(sample, COURT_ALGORITHMS, block_size=4096)
+        assert digests == {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "sha1": hashlib.sha1(data).hexdigest(),
+            "md5": hashlib.md5(data).hexdigest(),
+        }
+
+    def test_progress_reports_every_byte(self, sample):
+        seen = []
+        hash_file(sample, block_size=4096, progress=seen.append)
+        assert sum(seen) == sample.stat().st_size
+        assert len(seen) > 1
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+        assert sha256_file(path) == hashlib.sha256(b"").hexdigest()
+
+    def test_unknown_algorithm(self, sample):
+        with pytest.raises(ValueError, match="Unsupported"):
+            hash_file(sample, ("sha256", "nope"))
+
+
+class TestHashFiles:
+    def test_parallel_results_and_throughput(self, tmp_path):
+        paths = []
+        for i in range(6):
+            p = tmp_path / f"f{i}.bin"
+            p.write_bytes(str(i).encode() * 1000)
+            paths.append(p)
+        progress = []
+        report = hash_files(paths, workers=3, progress_fn=lambda *a: progress.append(a))
+        assert report["files"] == 6
+        assert report["bytes"] == 6000
+        for p in paths:
+            expected = hashlib.sha256(p.read_bytes()).hexdigest()
+            assert report["results"][str(p)] == {"sha256": expected}
+        assert progress[-1] == ("Hashing", 6, 6)
+
+    def test_unreadable_file_reported(self, tmp_path):
+        report = hash_files([tmp_path / "gone.bin"])
+        assert "error" in report["results"][str(tmp_path / "gone.bin")]
+        assert report["bytes"] == 0
+
+    def test_format_throughput(self):
+        assert format_throughput(2_000_000_000, 4.0) == "2.0 GB in 4.0s (500.0 MB/s)"
+        assert format_throughput(10, 0) == "10 B in 0.0s (0 B/s)"
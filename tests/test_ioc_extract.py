@@ -0,0 +1,163 @@
+"""Tests for the shared IOC extraction engine."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from vhir_cli import ioc_extract
+from vhir_cli.case_io import save_findings
+from vhir_cli.ioc_extract import (
+    INDEX_FILE,
+    extract_text_iocs,
+    finding_iocs,
+    index_iocs,
+    ioc_types,
+    load_ioc_index,
+    lookup_ioc,
+    register_ioc_type,
+)
+
+
+@pytest.fixture
+def registry():
+    """Restore the built-in registry after a test registers types."""
+    saved = dict(ioc_extract._REGISTRY)
+    yield
+    ioc_extract._REGISTRY.clear()
+    ioc_extract._REGISTRY.update(saved)
+    ioc_extract._compiled = None
+    ioc_extract._MEMO.clear()
+
+
+class TestExtractTextIocs:
+    def test_single_pass_finds_every_type(self):
+        md5 = "d41d8cd98f00b204e9800998ecf8427e"
+        text = (
+            f"Beacon to 45.33.32.156 and evil.example.net, dropped {md5} "
+            r"at C:\Users\Public\run.ps1"
+        )
+        found = extract_text_iocs(text)
+        assert found["IPv4"] == {"45.33.32.156"}
+        assert found["Domain"] == {"evil.example.net"}
+        assert found["MD5"] == {md5}
+        assert found["File"] == {r"C:\Users\Public\run.ps1"}
+
+    def test_url_and_email_yield_domains(self):
+        found = extract_text_iocs(
+            "Fetched https://cdn.bad.io/stage2.bin, then mailed Ops@Phish.COM."
+        )
+        assert found["URL"] == {"https://cdn.bad.io/stage2.bin"}
+        assert found["Email"] == {"ops@phish.com"}
+        assert found["Domain"] == {"cdn.bad.io", "phish.com"}
+
+    def test_pascal_case_identifiers_are_not_domains(self):
+        found = extract_text_iocs("Ran Update.Store via System.Link then Config.Me")
+        assert "Domain" not in found
+        assert extract_text_iocs("Beacon to Evil.Example.com")["Domain"] == {
+            "evil.example.com"
+        }
+
+    def test_ipv6_validated(self):
+        found = extract_text_iocs(
+            "Peer 2001:DB8::1 at 12:30:45, loopback ::1, MAC 00:1a:2b:3c:4d:5e"
+        )
+        assert found["IPv6"] == {"2001:db8::1"}
+
+    def test_loopback_ipv4_skipped(self):
+        assert "IPv4" not in extract_text_iocs("Listening on 127.0.0.1")
+
+    def test_registry_key(self):
+        found = extract_text_iocs(
+            r"Persistence via HKCU\Software\Microsoft\Windows\CurrentVersion\Run"
+        )
+        assert found["Registry"] == {
+            r"HKCU\Software\Microsoft\Windows\CurrentVersion\Run"
+        }
+
+
+class TestRegistry:
+    def test_register_type_invalidates_memo(self, registry):
+        finding = {"id": "F-001", "observation": "Ticket CVE-2024-3094 exploited"}
+        assert "CVE" not in finding_iocs(finding)
+        register_ioc_type("CVE", r"\bCVE-\d{4}-\d{4,}\b", before="IPv4")
+        assert ioc_types().index("CVE") == ioc_types().index("IPv4") - 1
+        assert finding_iocs(finding)["CVE"] == {"CVE-2024-3094"}
+
+    def test_rejects_capturing_groups(self, registry):
+        with pytest.raises(ValueError):
+            register_ioc_type("Bad", r"(a|b)")
+
+
+def _finding(fid, text, status="DRAFT"):
+    return {"id": fid, "observation": text, "status": status}
+
+
+class TestIOCIndex:
+    def test_built_on_load_and_looked_up(self, tmp_path):
+        save_findings(
+            tmp_path,
+            [
+                _finding("F-001", "C2 at 10.1.2.3", "APPROVED"),
+                _finding("F-002", "Also saw 10.1.2.3 and EVIL.example.com"),
+            ],
+        )
+        index = load_ioc_index(tmp_path)
+        assert (tmp_path / INDEX_FILE).exists()
+        assert lookup_ioc(index, "10.1.2.3") == [
+            ("IPv4", "10.1.2.3", {"F-001": "APPROVED", "F-002": "DRAFT"})
+        ]
+        assert lookup_ioc(index, "Evil.Example.COM")[0][1] == "evil.example.com"
+        assert index_iocs(index, status="APPROVED") == {"IPv4": {"10.1.2.3"}}
+        assert index_iocs(index, finding_ids=["F-002"])["Domain"] == {
+            "evil.example.com"
+        }
+
+    def test_saves_refreshed_incrementally_on_load(self, tmp_path, monkeypatch):
+        findings = [
+            _finding("F-001", "C2 at 10.1.2.3"),
+            _finding("F-002", "Hash " + "b" * 40),
+        ]
+        save_findings(tmp_path, findings)
+        load_ioc_index(tmp_path)
+        cached = (tmp_path / INDEX_FILE).read_bytes()
+
+        scanned = []
+        real_finding_iocs = ioc_extract.finding_iocs
+
+        def counting(finding):
+            scanned.append(finding["id"])
+            return real_finding_iocs(finding)
+
+        monkeypatch.setattr(ioc_extract, "finding_iocs", counting)
+        # Saves leave the index alone
+        findings[0] = {**findings[0], "status": "APPROVED"}
+        save_findings(tmp_path, findings)
+        assert (tmp_path / INDEX_FILE).read_bytes() == cached
+        # Status-only change reuses the stored IOCs
+        assert load_ioc_index(tmp_path)["iocs"]["IPv4"] == {
+            "10.1.2.3": {"F-001": "APPROVED"}
+        }
+        assert scanned == []
+        # Content change rescans only that finding; removal drops its IOCs
+        findings = [{**findings[0], "observation": "C2 at 10.9.9.9"}]
+        save_findings(tmp_path, findings)
+        index = load_ioc_index(tmp_path)
+        assert scanned == ["F-001"]
+        assert index["iocs"] == {"IPv4": {"10.9.9.9": {"F-001": "APPROVED"}}}
+        assert ioc_extract._read_ioc_index(tmp_path) == index
+
+    def test_external_rewrite_refreshed_on_load(self, tmp_path):
+        save_findings(tmp_path, [_finding("F-001", "C2 at 10.1.2.3")])
+        load_ioc_index(tmp_path)
+        (tmp_path / "findings.json").write_text(
+            json.dumps([_finding("F-001", "C2 at 10.44.4.4")])
+        )
+        assert lookup_ioc(load_ioc_index(tmp_path), "10.1.2.3") == []
+
+    def test_stale_registry_rebuilds(self, tmp_path, registry):
+        save_findings(tmp_path, [_finding("F-001", "Exploited CVE-2024-3094")])
+        assert "CVE" not in load_ioc_index(tmp_path)["iocs"]
+        register_ioc_type("CVE", r"\bCVE-\d{4}-\d{4,}\b")
+        assert "CVE" in load_ioc_index(tmp_path)["iocs"]
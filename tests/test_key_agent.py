@@ -0,0 +1,220 @@
+"""Tests for the local key agent."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from vhir_cli import key_agent
+from vhir_cli.key_agent import (
+    KeyAgent,
+    agent_check_password,
+    agent_sign,
+    agent_status,
+    agent_verify,
+    derive_verifier,
+    record_agent,
+    serve,
+    stop_agent,
+)
+from vhir_cli.verification import (
+    compute_hmac,
+    derive_hmac_key,
+    verify_items,
+    write_ledger_entry,
+)
+
+SALT = b"agentsalt"
+PASSWORD = "agentpass1"
+
+
+@pytest.fixture(scope="module")
+def key():
+    return derive_hmac_key(PASSWORD, SALT)
+
+
+def _agent(key):
+    return KeyAgent("alice", SALT, key, PASSWORD)
+
+
+def _request(agent, op, password=PASSWORD, **extra):
+    """A request answering a fresh challenge from agent."""
+    challenge = agent.handle({"op": "challenge"})
+    nonce = bytes.fromhex(challenge["nonce"])
+    verifier = derive_verifier(password, bytes.fromhex(challenge["salt"]))
+    return {
+        "op": op,
+        "examiner": "alice",
+        "salt": SALT.hex(),
+        "nonce": nonce.hex(),
+        "proof": key_agent._proof(verifier, nonce, b"client:"),
+        **extra,
+    }
+
+
+@pytest.fixture
+def agent_config(monkeypatch, tmp_path):
+    monkeypatch.setattr(key_agent, "AGENT_CONFIG", tmp_path / "config.yaml")
+
+
+@pytest.fixture
+def running_agent(monkeypatch, key, agent_config):
+    """Serve an unlocked, recorded agent on a short temp socket path."""
+    # AF_UNIX paths are limited to ~108 bytes, so avoid the long tmp_path
+    sock_dir = Path(tempfile.mkdtemp(prefix="vhir-agent-"))
+    monkeypatch.setattr(key_agent, "AGENT_DIR", sock_dir / "agent")
+    # The threaded server runs in this process
+    record_agent(os.getpid(), "alice")
+    agent = _agent(key)
+    started = threading.Event()
+    thread = threading.Thread(
+        target=serve,
+        args=(agent, key_agent.agent_socket(), 30, started.set),
+        daemon=True,
+    )
+    thread.start()
+    assert started.wait(5)
+    yield agent
+    agent.stopped = True
+    thread.join(5)
+    shutil.rmtree(sock_dir, ignore_errors=True)
+
+
+class TestKeyAgentHandle:
+    def test_sign_matches_compute_hmac(self, key):
+        agent = _agent(key)
+        response = agent.handle(_request(agent, "sign", texts=["a", "b"]))
+        assert response["ok"]
+        assert response["hmacs"] == [compute_hmac(key, "a"), compute_hmac(key, "b")]
+
+    def test_verify(self, key):
+        agent = _agent(key)
+        good = compute_hmac(key, "text")
+        response = agent.handle(
+            _request(agent, "verify", items=[["text", good], ["text", "x"]])
+        )
+        assert response["verified"] == [True, False]
+
+    def test_wrong_password_rejected(self, key):
+        agent = _agent(key)
+        response = agent.handle(_request(agent, "sign", password="nope", texts=["a"]))
+        assert response == {"ok": False, "error": "password"}
+
+    def test_wipes_after_repeated_failures(self, key):
+        agent = _agent(key)
+        for _ in range(3):
+            agent.handle(_request(agent, "check", password="nope"))
+        assert agent.stopped
+        assert agent.handle({"op": "challenge"})["error"] == "stopped"
+
+    def test_other_examiner_or_salt_is_stale(self, key):
+        agent = _agent(key)
+        request = {**_request(agent, "check"), "examiner": "bob"}
+        assert agent.handle(request)["error"] == "stale"
+        request = {**_request(agent, "check"), "salt": "00"}
+        assert agent.handle(request)["error"] == "stale"
+        assert agent.failures == 0
+
+    def test_challenge_is_single_use(self, key):
+        agent = _agent(key)
+        request = _request(agent, "check")
+        assert agent.handle(request)["ok"]
+        assert agent.handle(request) == {"ok": False, "error": "challenge"}
+        assert agent.failures == 0
+
+    def test_status_does_not_expose_key(self, key):
+        response = _agent(key).handle({"op": "status"})
+        assert response["examiner"] == "alice"
+        assert key.hex() not in str(response)
+
+
+class TestKeyAgentClient:
+    def test_no_agent_returns_none(self, monkeypatch, tmp_path, agent_config):
+        monkeypatch.setattr(key_agent, "AGENT_DIR", tmp_path / "none")
+        assert agent_status() is None
+        assert agent_check_password("alice", SALT, PASSWORD) is None
+        assert agent_sign("alice", SALT, PASSWORD, ["a"]) is None
+        assert not stop_agent()
+
+    def test_socket_is_private(self, running_agent):
+        sock = key_agent.agent_socket()
+        assert sock.stat().st_mode & 0o777 == 0o600
+        assert sock.parent.stat().st_mode & 0o777 == 0o700
+
+    def test_password_never_sent(self, running_agent, monkeypatch):
+        sent = []
+        real_request = key_agent.agent_request
+
+        def recording(request, *args, **kwargs):
+            sent.append(request)
+            return real_request(request, *args, **kwargs)
+
+        monkeypatch.setattr(key_agent, "agent_request", recording)
+        assert agent_check_password("alice", SALT, PASSWORD) is True
+        assert sent and PASSWORD not in str(sent)
+
+    def test_ignores_agent_that_was_not_started(self, running_agent):
+        key_agent.clear_agent()
+        assert agent_status() is None
+        assert agent_check_password("alice", SALT, PASSWORD) is None
+
+    def test_refuses_listener_with_other_pid(self, running_agent):
+        record_agent(os.getpid() + 1, "alice")
+        assert agent_status() is None
+        assert agent_check_password("alice", SALT, "wrong") is None
+        assert running_agent.failures == 0  # nothing was sent
+
+    def test_reply_without_proof_is_ignored(self, running_agent, monkeypatch):
+        real_handle = running_agent.handle
+
+        def impostor(request):
+            response = real_handle(request)
+            if request.get("op") == "check":
+                return {"ok": True}
+            return response
+
+        monkeypatch.setattr(running_agent, "handle", impostor)
+        assert agent_check_password("alice", SALT, "wrong") is None
+
+    def test_round_trip(self, running_agent, key):
+        assert agent_status()["examiner"] == "alice"
+        assert agent_check_password("alice", SALT, PASSWORD) is True
+        assert agent_check_password("alice", SALT, "wrong") is False
+        assert agent_sign("alice", SALT, PASSWORD, ["x"]) == [compute_hmac(key, "x")]
+        # Stale salt (password was reset): caller must derive the key itself
+        assert agent_check_password("alice", b"newsalt", PASSWORD) is None
+
+    def test_verify_items_uses_agent(self, running_agent, key, monkeypatch, tmp_path):
+        monkeypatch.setattr("vhir_cli.verification.VERIFICATION_DIR", tmp_path)
+        write_ledger_entry(
+            "INC-1",
+            {
+                "finding_id": "F-001",
+                "hmac": compute_hmac(key, "snap"),
+                "content_snapshot": "snap",
+                "approved_by": "alice",
+            },
+        )
+
+        def no_derive(*_args):
+            raise AssertionError("key derived despite running agent")
+
+        monkeypatch.setattr("vhir_cli.verification.derive_hmac_key", no_derive)
+        assert verify_items("INC-1", PASSWORD, SALT, "alice")[0]["verified"]
+        assert not verify_items("INC-1", "wrong", SALT, "alice")[0]["verified"]
+        assert agent_verify("alice", SALT, "wrong", [("snap", "x")]) == [False]
+
+    def test_stop_wipes_and_exits(self, running_agent):
+        assert stop_agent()
+        deadline = time.monotonic() + 5
+        while key_agent.agent_socket().exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not key_agent.agent_socket().exists()
+        assert running_agent.stopped
+        assert agent_status() is None
@@ -14,11 +14,8 @@ from vhir_cli.case_io import (
     verify_approval_integrity,
     write_approval_log,
 )
-from vhir_cli.commands.review import (
-    _extract_iocs_from_findings,
-    _extract_text_iocs,
-    cmd_review,
-)
+from vhir_cli.commands.review import cmd_review
+from vhir_cli.ioc_extract import extract_iocs, extract_text_iocs
 
 
 @pytest.fixture
@@ -299,7 +296,7 @@ class TestIOCExtraction:
                 "interpretation": "",
             }
         ]
-        result = _extract_iocs_from_findings(findings)
+        result = extract_iocs(findings)
         assert "1.2.3.4" in result["IPv4"]
         assert "bad.com" in result["Domain"]
 
@@ -311,28 +308,28 @@ class TestIOCExtraction:
                 "interpretation": "",
             }
         ]
-        result = _extract_iocs_from_findings(findings)
+        result = extract_iocs(findings)
         assert "5.6.7.8" in result["IPv4"]
 
     def test_extract_text_ipv4(self):
         collected = {}
-        _extract_text_iocs("Connected to 10.20.30.40 from source", collected)
+        extract_text_iocs("Connected to 10.20.30.40 from source", collected)
         assert "10.20.30.40" in collected["IPv4"]
 
     def test_extract_text_sha256(self):
         collected = {}
         h = "a" * 64
-        _extract_text_iocs(f"Hash: {h}", collected)
+        extract_text_iocs(f"Hash: {h}", collected)
         assert h in collected["SHA256"]
 
     def test_extract_text_windows_path(self):
         collected = {}
-        _extract_text_iocs(r"Found at C:\Windows\Temp\evil.exe on disk", collected)
+        extract_text_iocs(r"Found at C:\Windows\Temp\evil.exe on disk", collected)
         assert r"C:\Windows\Temp\evil.exe" in collected["File"]
 
     def test_extract_text_domain(self):
         collected = {}
-        _extract_text_iocs("Resolved evil.example.com via DNS", collected)
+        extract_text_iocs("Resolved evil.example.com via DNS", collected)
         assert "evil.example.com" in collected["Domain"]
 
     def test_no_iocs(self, case_dir, capsys):
@@ -363,6 +360,19 @@ class TestIOCExtraction:
         output = capsys.readouterr().out
         assert "No IOCs" in output
 
+    def test_ioc_lookup(self, case_dir, sample_findings, capsys):
+        args = Namespace(case=None, verify=False, todos=False, ioc_lookup="10.0.0.15")
+        cmd_review(args, {})
+        output = capsys.readouterr().out
+        assert "10.0.0.15 (IPv4)" in output
+        assert "F-tester-001" in output
+        assert "APPROVED" in output
+        assert "F-tester-002" not in output
+
+        args.ioc_lookup = "203.0.113.9"
+        cmd_review(args, {})
+        assert "No findings mention 203.0.113.9" in capsys.readouterr().out
+
 
 class TestTimeline:
     def test_timeline_summary(self, case_dir, sample_timeline, capsys):
@@ -0,0 +1,131 @@
+"""Tests for the cross-case search index and vhir search."""
+
+from __future__ import annotations
+
+import json
+from argparse import Namespace
+
+import pytest
+import yaml
+
+from vhir_cli import search_index
+from vhir_cli.case_io import save_findings
+from vhir_cli.commands.search import cmd_search
+from vhir_cli.ioc_extract import INDEX_FILE
+from vhir_cli.search_index import refresh_index, search
+
+SHA = "ab" * 32
+
+
+def _make_case(cases_dir, case_id, findings=(), evidence=()):
+    case_dir = cases_dir / case_id
+    case_dir.mkdir(parents=True)
+    (case_dir / "CASE.yaml").write_text(yaml.dump({"case_id": case_id}))
+    save_findings(case_dir, list(findings))
+    if evidence:
+        (case_dir / "evidence.json").write_text(json.dumps({"files": list(evidence)}))
+    return case_dir
+
+
+@pytest.fixture
+def cases(tmp_path):
+    cases_dir = tmp_path / "cases"
+    _make_case(
+        cases_dir,
+        "INC-1",
+        findings=[
+            {
+                "id": "F-a-001",
+                "status": "APPROVED",
+                "title": "Beacon over HTTPS",
+                "observation": "Outbound to 10.1.2.3 from svchost",
+            }
+        ],
+        evidence=[{"path": "evidence/mem.raw", "sha256": SHA.upper()}],
+    )
+    _make_case(
+        cases_dir,
+        "INC-2",
+        findings=[
+            {
+                "id": "F-b-001",
+                "status": "DRAFT",
+                "title": "Lateral movement",
+                "observation": "PsExec from 10.1.2.3 to DC01",
+            }
+        ],
+    )
+    return cases_dir
+
+
+class TestSearchIndex:
+    def test_ioc_found_in_every_case(self, cases, tmp_path):
+        db = tmp_path / "search.db"
+        assert refresh_index(cases, db)["indexed"] == 2
+        results = search(cases, ["10.1.2.3"], db)
+        assert [(r["case_id"], r["ref"]) for r in results] == [
+            ("INC-1", "F-a-001"),
+            ("INC-2", "F-b-001"),
+        ]
+        assert "IPv4 (APPROVED)" in results[0]["matches"]
+
+    def test_evidence_hash_and_words(self, cases, tmp_path):
+        db = tmp_path / "search.db"
+        refresh_index(cases, db)
+        hits = search(cases, [SHA], db)
+        assert [(r["case_id"], r["ref"]) for r in hits] == [
+            ("INC-1", "evidence/mem.raw")
+        ]
+        hits = search(cases, ["lateral", "psexec"], db)
+        assert [r["case_id"] for r in hits] == ["INC-2"]
+        assert search(cases, ["lateral", "svchost"], db) == []
+
+    def test_incremental_refresh(self, cases, tmp_path, monkeypatch):
+        db = tmp_path / "search.db"
+        refresh_index(cases, db)
+
+        indexed = []
+        real_postings = search_index._case_postings
+
+        def tracking(case_dir):
+            indexed.append(case_dir.name)
+            return real_postings(case_dir)
+
+        monkeypatch.setattr(search_index, "_case_postings", tracking)
+        assert refresh_index(cases, db)["indexed"] == 0
+
+        save_findings(
+            cases / "INC-2",
+            [{"id": "F-b-001", "status": "DRAFT", "observation": "To 10.9.9.9"}],
+        )
+        (cases / "INC-1" / "CASE.yaml").unlink()  # no longer a case
+        summary = refresh_index(cases, db)
+        assert indexed == ["INC-2"]
+        assert summary["removed"] == 1
+        assert search(cases, ["10.1.2.3"], db) == []
+        assert search(cases, ["10.9.9.9"], db)[0]["case_id"] == "INC-2"
+
+    def test_refresh_writes_nothing_into_cases(self, cases, tmp_path):
+        before = {p: p.stat().st_mtime_ns for p in cases.rglob("*")}
+        refresh_index(cases, tmp_path / "search.db")
+        assert {p: p.stat().st_mtime_ns for p in cases.rglob("*")} == before
+        assert not list(cases.rglob(INDEX_FILE))
+
+
+class TestSearchCommand:
+    def test_prints_matches(self, cases, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(search_index, "SEARCH_DB", tmp_path / "search.db")
+        args = Namespace(terms=["10.1.2.3"], cases_dir=str(cases), limit=50)
+        cmd_search(args, {})
+        output = capsys.readouterr().out
+        assert "2 match(es) in 2 case(s)" in output
+        assert "INC-1" in output and "INC-2" in output
+
+        args.terms = ["203.0.113.9"]
+        cmd_search(args, {})
+        assert "No cases mention 203.0.113.9" in capsys.readouterr().out
+
+    def test_missing_cases_dir(self, tmp_path):
+        args = Namespace(terms=["x"], cases_dir=str(tmp_path / "none"), limit=50)
+        with pytest.raises(SystemExit):
+            cmd_search(args, {})
@@ -1,6 +1,7 @@
 """Tests for vhir export/merge commands."""
 
 import argparse
+import gzip
 import json
 from pathlib import Path
 
@@ -43,7 +44,14 @@ def _init_case(case_dir: Path, examiner: str = "alice") -> None:
 
 
 def _make_export_args(**kwargs):
-    defaults = {"case": None, "file": "", "since": ""}
+    defaults = {
+        "case": None,
+        "file": "",
+        "since": "",
+        "peer": None,
+        "compact": False,
+        "gzip": False,
+    }
     defaults.update(kwargs)
     return argparse.Namespace(**defaults)
 
@@ -108,6 +116,59 @@ class TestExport:
         assert len(bundle["findings"]) == 1
         assert bundle["findings"][0]["id"] == "F-alice-002"
 
+    def test_compact_gzip_round_trips_through_merge(self, tmp_path, monkeypatch):
+        case_dir = tmp_path / "case"
+        _init_case(case_dir)
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        monkeypatch.setenv("VHIR_EXAMINER", "alice")
+
+        output = tmp_path / "bundle.json.gz"
+        cmd_export(
+            _make_export_args(file=str(output), compact=True), {"examiner": "alice"}
+        )
+        text = gzip.decompress(output.read_bytes()).decode()
+        assert "\n" not in text.strip()
+        assert json.loads(text)["findings"][0]["id"] == "F-alice-001"
+
+        other = tmp_path / "other"
+        _init_case(other, examiner="bob")
+        monkeypatch.setenv("VHIR_CASE_DIR", str(other))
+        cmd_merge(_make_merge_args(file=str(output)), {"examiner": "bob"})
+        ids = [f["id"] for f in json.loads((other / "findings.json").read_text())]
+        assert "F-alice-001" in ids
+
+    def test_peer_cursor_exports_only_changes(self, tmp_path, monkeypatch):
+        case_dir = tmp_path / "case"
+        _init_case(case_dir)
+        monkeypatch.setenv("VHIR_CASE_DIR", str(case_dir))
+        monkeypatch.setenv("VHIR_EXAMINER", "alice")
+
+        first = tmp_path / "first.json"
+        cmd_export(_make_export_args(file=str(first), peer="bob"), {})
+        assert len(json.loads(first.read_text())["findings"]) == 1
+        cursors = json.loads((case_dir / ".export-cursors.json").read_text())
+        assert cursors["bob"]["since"] == "2026-01-01T00:00:00Z"
+
+        findings = json.loads((case_dir / "findings.json").read_text())
+        findings.append({"id": "F-alice-002", "staged": "2026-06-01T00:00:00+00:00"})
+        (case_dir / "findings.json").write_text(json.dumps(findings))
+
+        second = tmp_path / "second.json"
+        cmd_export(_make_export_args(file=str(second), peer="bob"), {})
+        bundle = json.loads(second.read_text())
+        # Items at the cursor are re-sent (merge skips them as not newer)
+        assert [f["id"] for f in bundle["findings"]] == ["F-alice-001", "F-alice-002"]
+        assert bundle["timeline"][0]["id"] == "T-alice-001"
+        cursors = json.loads((case_dir / ".export-cursors.json").read_text())
+        assert cursors["bob"]["since"] == "2026-06-01T00:00:00+00:00"
+
+        # Another peer still gets everything; bad peer names are refused
+        third = tmp_path / "third.json"
+        cmd_export(_make_export_args(file=str(third), peer="carol"), {})
+        assert len(json.loads(third.read_text())["findings"]) == 2
+        with pytest.raises(SystemExit):
+            cmd_export(_make_export_args(file=str(third), peer="../x"), {})
+
 
 class TestMerge:
     def test_merge_reads_bundle(self, tmp_path, monkeypatch, capsys):
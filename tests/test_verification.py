@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from vhir_cli.verification import (
     compute_hmac,
     copy_ledger_to_case,
     derive_hmac_key,
+    latest_entries,
+    lookup_ledger_entry,
     read_ledger,
+    recover_rotation,
     rehmac_entries,
+    rotate_ledgers,
     verify_items,
     write_ledger_entry,
 )
@@ -21,6 +27,12 @@ def _patch_verification_dir(tmp_path, monkeypatch):
     monkeypatch.setattr("vhir_cli.verification.VERIFICATION_DIR", tmp_path)
 
 
+def _ledger_lines(tmp_path, case_id):
+    """Every line of a ledger, superseded ones included."""
+    text = (tmp_path / f"{case_id}.jsonl").read_text()
+    return [json.loads(line) for line in text.splitlines()]
+
+
 def test_derive_hmac_key():
     """Deterministic key derivation with known inputs."""
     key1 = derive_hmac_key("1234", b"salt")
@@ -190,6 +202,197 @@ def test_rehmac_entries(tmp_path):
     assert results_old[0]["verified"] is False
 
 
+def _entry(finding_id, examiner, key, desc):
+    return {
+        "finding_id": finding_id,
+        "type": "finding",
+        "hmac": compute_hmac(key, desc),
+        "content_snapshot": desc,
+        "approved_by": examiner,
+        "case_id": "INC-2026-001",
+    }
+
+
+def test_latest_entry_wins(tmp_path):
+    """Re-approval supersedes the earlier entry for the same examiner."""
+    key = derive_hmac_key("mypassword", b"mysalt")
+    write_ledger_entry("INC-2026-001", _entry("F-001", "alice", key, "v1"))
+    write_ledger_entry("INC-2026-001", _entry("F-001", "bob", key, "bob"))
+    write_ledger_entry("INC-2026-001", _entry("F-001", "alice", key, "v2"))
+
+    assert len(_ledger_lines(tmp_path, "INC-2026-001")) == 3
+    current = latest_entries("INC-2026-001")
+    assert [(e["approved_by"], e["content_snapshot"]) for e in current] == [
+        ("bob", "bob"),
+        ("alice", "v2"),
+    ]
+    assert read_ledger("INC-2026-001") == current
+    assert (
+        lookup_ledger_entry("INC-2026-001", "F-001", "alice")["content_snapshot"]
+        == "v2"
+    )
+    assert lookup_ledger_entry("INC-2026-001", "F-002", "alice") is None
+    assert lookup_ledger_entry("INC-2026-999", "F-001", "alice") is None
+
+    results = verify_items("INC-2026-001", "mypassword", b"mysalt", "alice")
+    assert [r["verified"] for r in results] == [True]
+
+
+def test_lookup_checks_the_key_of_the_line(tmp_path):
+    """Offsets that point at another item's line are not trusted."""
+    import vhir_cli.verification as verification
+
+    key = derive_hmac_key("mypassword", b"mysalt")
+    write_ledger_entry("INC-2026-001", _entry("F-001", "alice", key, "a"))
+    write_ledger_entry("INC-2026-001", _entry("F-002", "alice", key, "b"))
+    index = verification._ledger_index("INC-2026-001")
+    ledger = tmp_path / "INC-2026-001.jsonl"
+    first, second = ledger.read_text().splitlines(keepends=True)
+    ledger.write_text(second + first)  # same size, lines swapped
+    assert index.get("F-001\talice")["content_snapshot"] == "a"
+    entry = lookup_ledger_entry("INC-2026-001", "F-002", "alice")
+    assert entry["content_snapshot"] == "b"
+
+
+def test_ledger_index_sidecar_not_globbed(tmp_path):
+    """The index sidecar never looks like a ledger to password rotation."""
+    write_ledger_entry("INC-2026-001", {"finding_id": "F-001", "approved_by": "a"})
+    latest_entries("INC-2026-001")
+    assert (tmp_path / ".index" / "INC-2026-001.idx").exists()
+    assert [p.name for p in tmp_path.glob("*.jsonl")] == ["INC-2026-001.jsonl"]
+
+
+def test_rehmac_appends_only_examiner_entries(tmp_path):
+    """Rotation appends re-signed lines and leaves existing bytes alone."""
+    old_key = derive_hmac_key("oldpasswd", b"oldsalt")
+    write_ledger_entry("INC-2026-001", _entry("F-001", "alice", old_key, "a"))
+    write_ledger_entry("INC-2026-001", _entry("F-002", "bob", old_key, "b"))
+    ledger = tmp_path / "INC-2026-001.jsonl"
+    before = ledger.read_bytes()
+
+    count = rehmac_entries(
+        "INC-2026-001", "alice", "oldpasswd", b"oldsalt", "newpasswd", b"newsalt"
+    )
+    assert count == 1
+    assert ledger.read_bytes().startswith(before)
+    appended = _ledger_lines(tmp_path, "INC-2026-001")[2:]
+    assert [e["finding_id"] for e in appended] == ["F-001"]
+    assert "resigned_at" in appended[0]
+    bob = lookup_ledger_entry("INC-2026-001", "F-002", "bob")
+    assert bob["hmac"] == compute_hmac(old_key, "b")
+
+    # Nothing to re-sign: the ledger is not touched
+    size = ledger.stat().st_size
+    assert rehmac_entries("INC-2026-001", "carol", "x", b"x", "y", b"y") == 0
+    assert ledger.stat().st_size == size
+
+
+def test_rotate_ledgers_all_cases(tmp_path):
+    """Batch rotation re-signs every case and reports per case."""
+    old_key = derive_hmac_key("oldpasswd", b"oldsalt")
+    new_key = derive_hmac_key("newpasswd", b"newsalt")
+    for n in range(5):
+        write_ledger_entry(f"INC-{n}", _entry("F-001", "alice", old_key, f"d{n}"))
+    write_ledger_entry("INC-0", _entry("F-002", "alice", b"other", "forged"))
+    write_ledger_entry("INC-9", _entry("F-001", "bob", old_key, "bob"))
+
+    result = rotate_ledgers("alice", old_key, new_key, workers=3)
+    assert result["committed"]
+    assert result["resigned"] == 5
+    assert result["errors"] == []
+    assert result["cases"]["INC-0"] == {"resigned": 1, "skipped": 1}
+    assert "INC-9" not in result["cases"]
+    for n in range(5):
+        results = verify_items(f"INC-{n}", "newpasswd", b"newsalt", "alice")
+        assert {r["finding_id"]: r["verified"] for r in results}["F-001"]
+    assert not (tmp_path / ".rotation-journal.json").exists()
+
+
+def test_rotation_aborts_if_any_case_fails(tmp_path):
+    """One unreadable ledger stops the whole rotation before any write."""
+    old_key = derive_hmac_key("oldpasswd", b"oldsalt")
+    new_key = derive_hmac_key("newpasswd", b"newsalt")
+    for n in range(3):
+        write_ledger_entry(f"INC-{n}", _entry("F-001", "alice", old_key, f"d{n}"))
+    (tmp_path / "INC-bad.jsonl").mkdir()  # unreadable ledger
+    before = {n: _ledger_lines(tmp_path, f"INC-{n}") for n in range(3)}
+    committed = []
+
+    result = rotate_ledgers(
+        "alice", old_key, new_key, on_commit=lambda: committed.append(1), workers=2
+    )
+    assert not result["committed"]
+    assert result["errors"] == ["INC-bad"]
+    assert result["resigned"] == 0
+    assert committed == []
+    assert {n: _ledger_lines(tmp_path, f"INC-{n}") for n in range(3)} == before
+    assert not (tmp_path / ".rotation-journal.json").exists()
+
+
+def test_rotation_journal_dropped_if_password_never_stored(tmp_path, monkeypatch):
+    """A crash before the new password was stored leaves the ledgers alone."""
+    import vhir_cli.approval_auth as approval_auth
+
+    monkeypatch.setattr(approval_auth, "_PASSWORDS_DIR", tmp_path / "passwords")
+    old_key = derive_hmac_key("oldpasswd", b"oldsalt")
+    new_key = derive_hmac_key("newpasswd", b"newsalt")
+    write_ledger_entry("INC-0", _entry("F-001", "alice", old_key, "d"))
+
+    def crash():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        rotate_ledgers("alice", old_key, new_key, new_salt=b"newsalt", on_commit=crash)
+    assert not (tmp_path / ".rotation-journal.json").exists()
+    assert len(_ledger_lines(tmp_path, "INC-0")) == 1
+
+    # Journal left by a process killed between journal and password write
+    (tmp_path / ".rotation-journal.json").write_text(
+        json.dumps(
+            {
+                "examiner": "alice",
+                "salt": b"newsalt".hex(),
+                "cases": {"INC-0": [_entry("F-001", "alice", new_key, "d")]},
+            }
+        )
+    )
+    assert recover_rotation()
+    assert len(_ledger_lines(tmp_path, "INC-0")) == 1
+
+
+def test_rotation_rolls_forward_after_crash(tmp_path, monkeypatch):
+    """A commit interrupted partway is finished on the next ledger access."""
+    import vhir_cli.verification as verification
+
+    old_key = derive_hmac_key("oldpasswd", b"oldsalt")
+    new_key = derive_hmac_key("newpasswd", b"newsalt")
+    for n in range(3):
+        write_ledger_entry(f"INC-{n}", _entry("F-001", "alice", old_key, "d"))
+
+    real_append = verification.write_ledger_entries
+    calls = []
+
+    def crash_on_second(case_id, entries):
+        calls.append(case_id)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        real_append(case_id, entries)
+
+    monkeypatch.setattr(verification, "write_ledger_entries", crash_on_second)
+    with pytest.raises(OSError):
+        rotate_ledgers("alice", old_key, new_key, workers=1)
+    assert (tmp_path / ".rotation-journal.json").exists()
+    monkeypatch.setattr(verification, "write_ledger_entries", real_append)
+
+    # Any read finishes the rotation; cases already committed aren't duplicated
+    latest_entries("INC-0")
+    assert not recover_rotation()
+    for n in range(3):
+        [r] = verify_items(f"INC-{n}", "newpasswd", b"newsalt", "alice")
+        assert r["verified"]
+        assert len(_ledger_lines(tmp_path, f"INC-{n}")) == 2
+
+
 def test_case_id_validation():
     """Rejects path traversal in case IDs."""
     with pytest.raises(ValueError, match="path traversal"):